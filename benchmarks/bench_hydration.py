@@ -0,0 +1,68 @@
+""" Compare building Person instances with and without a shared Hydrator on a synthetic 100k-user payload
+
+Run from the repository root with ``python benchmarks/bench_hydration.py``. Use ``--people`` and ``--licenses`` to
+change the size of the payload and the number of licenses in the Org. No API calls are made.
+"""
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Use the wxcadm in this checkout, not an installed copy
+sys.path.insert(0, ROOT)
+
+import wxcadm
+from wxcadm.org import WebexLicense
+from wxcadm.person import Person
+
+
+def licenses(count: int) -> list:
+    names = ['Webex Calling - Professional', 'Webex Calling - Workspaces', 'Webex Calling - Basic',
+             'Messaging', 'Meeting - Webex Enterprise', 'Unified Communication Manager (UCM)']
+    return [WebexLicense(None, {'id': f'Y2lzY29zcGFyazovL3VzL0xJQ0VOU0UvYWJjZC0{n}', 'name': names[n % len(names)]})
+            for n in range(count)]
+
+
+def people(count: int, license_count: int) -> list:
+    return [{
+        'id': f'Y2lzY29zcGFyazovL3VzL1BFT1BMRS8{i:08d}LWFiY2QtZWZnaC1pamtsLW1ub3BxcnN0dXZ3eA',
+        'emails': [f'user{i}@example.com'],
+        'phoneNumbers': [{'type': 'work', 'value': f'+1919{i:07d}', 'primary': True}],
+        'extension': f'{1000 + i % 9000}',
+        'locationId': f'Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OL2FiY2Q{i % 50}',
+        'displayName': f'User {i}',
+        'firstName': 'User',
+        'lastName': f'{i}',
+        'roles': [],
+        'licenses': [f'Y2lzY29zcGFyazovL3VzL0xJQ0VOU0UvYWJjZC0{(i + n) % license_count}' for n in range(4)],
+        'status': 'active',
+        'loginEnabled': True,
+    } for i in range(count)]
+
+
+def build(org, payload: list, hydrator=None) -> float:
+    start = time.perf_counter()
+    for entry in payload:
+        Person(entry['id'], org=org, config=entry, hydrator=hydrator)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--people', type=int, default=100_000, help="The number of people in the payload")
+    parser.add_argument('--licenses', type=int, default=40, help="The number of licenses in the Org")
+    args = parser.parse_args()
+
+    org = SimpleNamespace(licenses=licenses(args.licenses), locations=[])
+    payload = people(args.people, args.licenses)
+    print(f"{args.people:,} people, {args.licenses} licenses")
+    before = build(org, payload)
+    print(f"  per Person    {before:6.2f} s  ({before / args.people * 1e6:5.1f} us/person)")
+    after = build(org, payload, hydrator=wxcadm.Hydrator(org))
+    print(f"  Hydrator      {after:6.2f} s  ({after / args.people * 1e6:5.1f} us/person, {before / after:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
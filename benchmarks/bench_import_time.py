@@ -0,0 +1,61 @@
+""" Measure the time it takes to ``import wxcadm`` in a fresh interpreter
+
+Run from the repository root with ``python benchmarks/bench_import_time.py``. Each run starts a new Python process
+with ``-X importtime``, so nothing is cached in ``sys.modules``. Pass ``--max-ms`` to exit with an error when the median
+import time is over a budget, and ``--top`` to list the slowest modules. The lazily-loaded subsystems (XSI, RedSky,
+Meraki, CDR and reports) must not be imported by ``import wxcadm``, and the benchmark fails if any of them are.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAZY_MODULES = ['wxcadm.xsi', 'wxcadm.redsky', 'wxcadm.meraki', 'wxcadm.cdr', 'wxcadm.reports', 'srvlookup',
+                'xmltodict']
+
+
+def import_times(statement: str = 'import wxcadm') -> dict:
+    # Run the import in a new interpreter and return the cumulative microseconds of each module
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, env=env, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='The number of imports to time. Defaults to 10.')
+    parser.add_argument('--max-ms', type=float, help='Fail if the median import time is over this many ms')
+    parser.add_argument('--top', type=int, default=0, help='List this many of the slowest modules')
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    totals = [run['wxcadm'] / 1000 for run in runs]
+    median = statistics.median(totals)
+    print(f"import wxcadm: median {median:.1f} ms, min {min(totals):.1f} ms, max {max(totals):.1f} ms "
+          f"({args.runs} runs)")
+    if args.top:
+        for name, micros in sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)[:args.top]:
+            print(f"  {micros / 1000:7.1f} ms  {name}")
+
+    failed = False
+    loaded = [name for name in LAZY_MODULES if name in runs[-1]]
+    if loaded:
+        print(f"FAIL: imported by 'import wxcadm' but should be lazy: {', '.join(loaded)}")
+        failed = True
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"FAIL: median import time {median:.1f} ms is over the {args.max_ms:.1f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+""" Compare the per-page cost of the available JSON codecs on synthetic Webex list pages
+
+Run from the repository root with ``python benchmarks/bench_json_codec.py``. Codecs whose library isn't installed
+are skipped. The pages mimic a full page of ``v1/people?callingData=true`` (1,000 people) and of
+``v1/telephony/config/numbers`` (2,000 numbers).
+"""
+import os
+import sys
+import timeit
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Use the wxcadm in this checkout, not an installed copy
+sys.path.insert(0, ROOT)
+
+import wxcadm
+
+
+def people_page(count: int = 1000) -> dict:
+    return {'items': [{
+        'id': f'Y2lzY29zcGFyazovL3VzL1BFT1BMRS8{i:08d}LWFiY2QtZWZnaC1pamtsLW1ub3BxcnN0dXZ3eA',
+        'emails': [f'user{i}@example.com'],
+        'phoneNumbers': [{'type': 'work', 'value': f'+1919555{i:04d}', 'primary': True}],
+        'extension': f'{1000 + i}',
+        'locationId': 'Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OL2FiY2QtZWZnaC1pamts',
+        'displayName': f'User {i}',
+        'nickName': f'User{i}',
+        'firstName': 'User',
+        'lastName': f'{i}',
+        'orgId': 'Y2lzY29zcGFyazovL3VzL09SR0FOSVpBVElPTi9hYmNkLWVmZ2g',
+        'roles': [],
+        'licenses': [f'Y2lzY29zcGFyazovL3VzL0xJQ0VOU0UvYWJjZC0{n}' for n in range(4)],
+        'created': '2023-01-01T00:00:00.000Z',
+        'lastModified': '2024-01-01T00:00:00.000Z',
+        'timezone': 'America/New_York',
+        'lastActivity': '2024-06-01T00:00:00.000Z',
+        'status': 'active',
+        'invitePending': False,
+        'loginEnabled': True,
+        'type': 'person',
+    } for i in range(count)]}
+
+
+def numbers_page(count: int = 2000) -> dict:
+    return {'phoneNumbers': [{
+        'phoneNumber': f'+1919555{i:04d}',
+        'extension': f'{1000 + i}',
+        'mainNumber': False,
+        'tollFreeNumber': False,
+        'state': 'ACTIVE',
+        'isServiceNumber': False,
+        'includedTelephonyTypes': 'PSTN_NUMBER',
+        'location': {'id': 'Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OL2FiY2Q', 'name': 'Main'},
+        'owner': {'id': f'Y2lzY29zcGFyazovL3VzL1BFT1BMRS8{i:08d}', 'type': 'PEOPLE',
+                  'firstName': 'User', 'lastName': f'{i}'},
+    } for i in range(count)]}
+
+
+def response(body: bytes) -> requests.Response:
+    r = requests.Response()
+    r.status_code = 200
+    r.headers['Content-Type'] = 'application/json'
+    r._content = body
+    return r
+
+
+def main():
+    codecs = [wxcadm.JsonCodec()]
+    for codec_class in (wxcadm.OrjsonCodec, wxcadm.MsgspecCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError as e:
+            print(f"Skipping {codec_class.__name__}: {e}")
+    for name, page in [('people', people_page()), ('numbers', numbers_page())]:
+        body = wxcadm.JsonCodec().dumps(page)
+        print(f"\n{name} page: {len(body) / 1024:.0f} KiB")
+        runs = 20
+        r = response(body)
+        baseline = min(timeit.repeat(lambda: r.json(), number=runs, repeat=5)) / runs
+        print(f"  {'r.json()':8} loads {baseline * 1000:7.2f} ms/page (before)")
+        for codec in codecs:
+            loads = min(timeit.repeat(lambda: codec.loads(body), number=runs, repeat=5)) / runs
+            dumps = min(timeit.repeat(lambda: codec.dumps(page), number=runs, repeat=5)) / runs
+            print(f"  {codec.name:8} loads {loads * 1000:7.2f} ms/page ({baseline / loads:4.1f}x)  "
+                  f"dumps {dumps * 1000:7.2f} ms/page")
+
+
+if __name__ == '__main__':
+    main()
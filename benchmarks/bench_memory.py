@@ -0,0 +1,157 @@
+""" Compare the memory used by Person, Device and Number instances with and without ``__slots__``
+
+Run from the repository root with ``python benchmarks/bench_memory.py``. Use ``--count`` to change the number of
+instances of each class. Each class is measured as it is and as an unslotted copy that keeps its attributes in a
+``__dict__``, with every Person feature config created up front, which is how the classes worked before they had
+``__slots__``. Only the memory of the instances themselves is counted, not the API data they were built from. No API
+calls are made.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Use the wxcadm in this checkout, not an installed copy
+sys.path.insert(0, ROOT)
+
+import wxcadm
+from wxcadm.device import Device
+from wxcadm.number import Number
+from wxcadm.person import Person
+
+FEATURE_CONFIGS = ('vm_config', 'call_recording', 'call_forwarding', 'caller_id', 'intercept', 'dnd',
+                   'calling_behavior', 'hoteling', 'outgoing_permission')
+
+
+def person_item(i: int) -> dict:
+    return {
+        'id': f'Y2lzY29zcGFyazovL3VzL1BFT1BMRS8{i:08d}LWFiY2QtZWZnaC1pamtsLW1ub3BxcnN0dXZ3eA',
+        'emails': [f'user{i}@example.com'],
+        'phoneNumbers': [{'type': 'work', 'value': f'+1919{i:07d}', 'primary': True}],
+        'extension': f'{1000 + i % 9000}',
+        'locationId': 'Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OL2FiY2Q',
+        'displayName': f'User {i}',
+        'firstName': 'User',
+        'lastName': f'{i}',
+        'roles': [],
+        'licenses': ['Y2lzY29zcGFyazovL3VzL0xJQ0VOU0UvYWJjZC0'],
+        'status': 'active',
+        'loginEnabled': True,
+    }
+
+
+def device_item(i: int) -> dict:
+    return {
+        'id': f'Y2lzY29zcGFyazovL3VzL0RFVklDRS8{i:08d}',
+        'displayName': f'Phone {i}',
+        'personId': f'Y2lzY29zcGFyazovL3VzL1BFT1BMRS8{i:08d}',
+        'orgId': 'Y2lzY29zcGFyazovL3VzL09SR0FOSVpBVElPTi9hYmNkLWVmZ2g',
+        'capabilities': ['xapi'],
+        'permissions': ['xapi:readonly'],
+        'product': 'Cisco 8865',
+        'type': 'roomdesk',
+        'tags': [],
+        'ip': '10.0.0.1',
+        'mac': f'00AABB{i:06X}',
+        'serial': f'FCH{i:08d}',
+        'activeInterface': 'Ethernet',
+        'software': 'sip88xx.14-2-1',
+        'upgradeChannel': 'Stable',
+        'primarySipUrl': f'user{i}@example.calls.webex.com',
+        'connectionStatus': 'connected',
+        'created': '2023-01-01T00:00:00.000Z',
+        'locationId': 'Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OL2FiY2Q',
+    }
+
+
+def number_item(i: int) -> dict:
+    return {
+        'phoneNumber': f'+1919{i:07d}',
+        'extension': f'{1000 + i % 9000}',
+        'mainNumber': False,
+        'tollFreeNumber': False,
+        'state': 'ACTIVE',
+        'phoneNumberType': 'PRIMARY',
+        'includedTelephonyTypes': 'PSTN_NUMBER',
+        'location': {'id': 'Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OL2FiY2Q', 'name': 'Main'},
+        'owner': {'id': f'Y2lzY29zcGFyazovL3VzL1BFT1BMRS8{i:08d}', 'type': 'PEOPLE',
+                  'firstName': 'User', 'lastName': f'{i}'},
+    }
+
+
+def unslotted(cls, eager: tuple = ()):
+    """ A copy of a slotted class that keeps its attributes in a ``__dict__``, with the ``eager`` attributes set to
+    empty dicts by ``__init__`` """
+    skip = set(cls.__slots__) | {'__slots__'} | set(eager)
+    namespace = {key: value for key, value in vars(cls).items() if key not in skip}
+    if eager:
+        init = cls.__init__
+
+        def __init__(self, *args, **kwargs):
+            for name in eager:
+                setattr(self, name, {})
+            init(self, *args, **kwargs)
+
+        namespace['__init__'] = __init__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def measure(build, items: list) -> float:
+    """ The bytes allocated per instance while building one instance for each item """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [build(item) for item in items]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del instances
+    return used / len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100_000, help="The number of instances of each class")
+    args = parser.parse_args()
+
+    org = SimpleNamespace(licenses=[], locations=[])
+    hydrator = wxcadm.Hydrator(org)
+
+    def number_builder(number_class):
+        def number(item: dict) -> Number:
+            # The same fields that Number.from_dict() sets, without its (slow) type-hint decoding
+            this_number = number_class(phone_number=item['phoneNumber'], extension=item['extension'],
+                                       state=item['state'], phone_number_type=item['phoneNumberType'],
+                                       main_number=item['mainNumber'],
+                                       included_telephony_types=item['includedTelephonyTypes'],
+                                       toll_free_number=item['tollFreeNumber'], _location=item['location'],
+                                       _owner=item['owner'])
+            this_number.org = org
+            return this_number
+        return number
+
+    def person_builder(person_class):
+        return lambda item: person_class(item['id'], org=org, config=item, hydrator=hydrator)
+
+    def device_builder(device_class):
+        return lambda item: device_class(org=org, parent=None, config=item, id=item['id'])
+
+    classes = [
+        ('Person', person_builder, Person, unslotted(Person, eager=FEATURE_CONFIGS), person_item),
+        ('Device', device_builder, Device, unslotted(Device), device_item),
+        ('Number', number_builder, Number, unslotted(Number), number_item),
+    ]
+    print(f"{args.count:,} instances of each class, in bytes per instance")
+    print(f"  {'':7} {'__dict__':>9} {'__slots__':>9} {'saved':>9}")
+    for name, builder, slotted_class, dict_class, make_item in classes:
+        items = [make_item(i) for i in range(args.count)]
+        before = measure(builder(dict_class), items)
+        after = measure(builder(slotted_class), items)
+        saved_mib = (before - after) * args.count / 2 ** 20
+        print(f"  {name:7} {before:9.0f} {after:9.0f} {(before - after) / before:8.0%}  "
+              f"({saved_mib:.1f} MiB for {args.count:,})")
+
+if __name__ == '__main__':
+    main()
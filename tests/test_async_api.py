@@ -0,0 +1,106 @@
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import unittest
+import wxcadm
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: dict, headers: dict = None, next_url: str = None):
+        self.status = status
+        self.ok = status < 400
+        self.headers = headers or {}
+        self.links = {'next': {'url': next_url}} if next_url else {}
+        self._body = json.dumps(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def text(self):
+        return self._body
+
+
+class FakeSession:
+    """ Stands in for the aiohttp ClientSession, answering each request with the next queued response """
+    closed = False
+
+    def __init__(self, responses: list):
+        self.responses = list(responses)
+        self.sent = []
+
+    def request(self, method, url, params=None, json=None):
+        self.sent.append((method, url, params))
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+@unittest.skipIf(importlib.util.find_spec('aiohttp') is None, "aiohttp is not installed")
+class TestAsyncWebexApi(unittest.IsolatedAsyncioTestCase):
+    def api(self, responses: list) -> wxcadm.AsyncWebexApi:
+        api = wxcadm.AsyncWebexApi("token", org_id='org', rate_limiter=wxcadm.RateLimiter(),
+                                   region_map=wxcadm.RegionMap())
+        api._session = FakeSession(responses)
+        return api
+
+    async def test_pagination(self):
+        next_url = "https://webexapis.com/v1/people?orgId=org&cursor=2"
+        api = self.api([FakeResponse(200, {'items': [{'id': '1'}, {'id': '2'}]}, next_url=next_url),
+                        FakeResponse(200, {'items': [{'id': '3'}]})])
+        self.assertEqual(await api.get('v1/people', params={'callingData': True, 'locationId': None}),
+                         [{'id': '1'}, {'id': '2'}, {'id': '3'}])
+        self.assertEqual(api._session.sent, [
+            ('GET', "https://webexapis.com/v1/people", {'orgId': 'org', 'callingData': 'true'}),
+            ('GET', next_url, None),
+        ])
+
+    async def test_retry_after_429(self):
+        api = self.api([FakeResponse(429, {'message': 'Too Many Requests'}, headers={'Retry-After': '0'}),
+                        FakeResponse(200, {'id': '1'})])
+        self.assertEqual(await api.get('v1/people/1'), {'id': '1'})
+        self.assertEqual(len(api._session.sent), 2)
+
+    async def test_region_redirect(self):
+        api = self.api([FakeResponse(451, {'message': 'Please use https://eu.webexapis.com/v1/cdr_feed'}),
+                        FakeResponse(200, {'items': [{'id': '1'}]}),
+                        FakeResponse(200, {'items': [{'id': '2'}]})])
+        self.assertEqual(await api.get('v1/cdr_feed'), [{'id': '1'}])
+        # The new region is remembered, so the next call goes straight there
+        self.assertEqual(await api.get('v1/cdr_feed'), [{'id': '2'}])
+        self.assertEqual([url for _, url, _ in api._session.sent], [
+            "https://webexapis.com/v1/cdr_feed",
+            "https://eu.webexapis.com/v1/cdr_feed",
+            "https://eu.webexapis.com/v1/cdr_feed",
+        ])
+
+    async def test_shared_limiter_off_event_loop(self):
+        threads = []
+
+        class Limiter(wxcadm.SharedRateLimiter):
+            def reserve(self):
+                threads.append(threading.get_ident())
+                return super().reserve()
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            api = self.api([FakeResponse(200, {'id': '1'})])
+            api.rate_limiter = Limiter(path=os.path.join(tempdir, 'ratelimit.sqlite'))
+            self.assertEqual(await api.get('v1/people/1'), {'id': '1'})
+            api.rate_limiter._conn.close()
+        # The SQLite transaction ran in an executor, not on the event loop's thread
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.get_ident())
+
+    async def test_error(self):
+        api = self.api([FakeResponse(404, {'message': 'Not found'})])
+        with self.assertRaises(wxcadm.APIError):
+            await api.get('v1/people/1')
+
+
+if __name__ == '__main__':
+    unittest.main()
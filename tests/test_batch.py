@@ -0,0 +1,64 @@
+import unittest
+import time
+import wxcadm
+
+
+class TestBatch(unittest.TestCase):
+    def test_order_and_errors(self):
+        api = wxcadm.WebexApi("token", max_workers=4)
+
+        def slow(value):
+            time.sleep(0.1 if value % 2 else 0)
+            return value
+
+        def fail():
+            raise wxcadm.APIError("failed")
+
+        requests = [lambda i=i: slow(i) for i in range(8)]
+        requests.insert(3, fail)
+        start = time.monotonic()
+        results = api.batch(requests)
+        self.assertLess(time.monotonic() - start, 0.35)
+        self.assertEqual([r.result for r in results if r.ok], list(range(8)))
+        self.assertIsInstance(results[3].error, wxcadm.APIError)
+        self.assertIs(results[3].request, fail)
+
+    def test_unsupported_method(self):
+        api = wxcadm.WebexApi("token")
+        results = api.batch([('head', 'v1/people')])
+        self.assertIsInstance(results[0].error, ValueError)
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    def test_aimd(self):
+        control = wxcadm.AdaptiveConcurrency(initial=4, max_window=6, cooldown=60)
+        for _ in range(5):
+            control.record(False)
+        self.assertEqual(control.window, 5)
+        control.record(True)
+        self.assertEqual(control.window, 2)
+        # Later 429s from the same burst don't shrink the window again
+        control.record(True)
+        self.assertEqual(control.window, 2)
+        self.assertAlmostEqual(control.throttle_rate, 2 / 7)
+        for _ in range(100):
+            control.record(False)
+        self.assertEqual(control.window, 6)
+
+    def test_window_limits_batch(self):
+        control = wxcadm.AdaptiveConcurrency(initial=3, max_window=10)
+        api = wxcadm.WebexApi("token", concurrency=control)
+        peak = []
+
+        def work():
+            peak.append(control.in_flight)
+            time.sleep(0.02)
+
+        results = api.batch([work] * 20)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertLessEqual(max(peak), 3)
+        self.assertEqual(control.in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
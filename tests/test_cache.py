@@ -0,0 +1,141 @@
+import json
+import unittest
+import time
+from urllib.parse import urlparse, parse_qsl
+import requests
+import wxcadm
+
+
+def response(status: int, body: bytes, headers: dict = None) -> requests.Response:
+    r = requests.Response()
+    r.status_code = status
+    r.headers['Content-Type'] = 'application/json'
+    r.headers.update(headers or {})
+    r._content = body
+    return r
+
+
+class TestResponseCache(unittest.TestCase):
+    base = "https://webexapis.com/"
+
+    def test_ttl_patterns(self):
+        cache = wxcadm.ResponseCache(ttl=30, ttls={'v1/roles': 3600, 'v1/people*': 0})
+        self.assertEqual(cache.ttl_for(self.base + "v1/roles"), 3600)
+        self.assertEqual(cache.ttl_for(self.base + "v1/people/abc"), 0)
+        self.assertEqual(cache.ttl_for(self.base + "v1/locations"), 30)
+        cache.set(self.base + "v1/people", {'orgId': 'org'}, [{'id': 'abc'}])
+        self.assertEqual(len(cache), 0)
+
+    def test_expiry_and_copies(self):
+        cache = wxcadm.ResponseCache(ttl=0.1)
+        cache.set(self.base + "v1/roles", None, [{'id': 'role'}])
+        entry = cache.get(self.base + "v1/roles")
+        self.assertFalse(entry.expired)
+        entry.copy_value()[0]['id'] = 'changed'
+        self.assertEqual(cache.get(self.base + "v1/roles").copy_value(), [{'id': 'role'}])
+        time.sleep(0.15)
+        self.assertTrue(cache.get(self.base + "v1/roles").expired)
+
+    def test_lru_eviction(self):
+        cache = wxcadm.ResponseCache(max_entries=2)
+        cache.set(self.base + "v1/a", None, 'a')
+        cache.set(self.base + "v1/b", None, 'b')
+        cache.get(self.base + "v1/a")
+        cache.set(self.base + "v1/c", None, 'c')
+        self.assertIsNotNone(cache.get(self.base + "v1/a"))
+        self.assertIsNone(cache.get(self.base + "v1/b"))
+
+    def test_invalidation(self):
+        cache = wxcadm.ResponseCache()
+        locations = self.base + "v1/telephony/config/locations"
+        cache.set(locations, {'orgId': 'org'}, [])
+        cache.set(locations + "/loc1", {'orgId': 'org'}, {})
+        cache.set(locations + "/loc1/callingConfig", None, {})
+        cache.set(locations + "/loc2", None, {})
+        self.assertEqual(cache.invalidate(locations + "/loc1"), 3)
+        self.assertIsNotNone(cache.get(locations + "/loc2"))
+
+
+class TestWebexApiCache(unittest.TestCase):
+    def setUp(self):
+        self.sent = []
+        self.cache = wxcadm.ResponseCache(ttl=60)
+        self.api = wxcadm.WebexApi("token", cache=self.cache,
+                                   page_sizes=wxcadm.PageSizes(overrides={'v1/locations': None}))
+
+        def request(method, url, params=None, headers=None, **kwargs):
+            self.sent.append((method, url.replace("https://webexapis.com/", ""), headers))
+            if method != 'GET':
+                return response(204, b'')
+            if headers and headers.get('If-None-Match') == '"v1"':
+                return response(304, b'')
+            if 'v1/numbers' in url:
+                start = int(dict(parse_qsl(urlparse(url).query)).get('start', 0))
+                r = response(200, json.dumps({'items': [{'id': f'n{start}'}] if start < 3 else []}).encode(),
+                             {'ETag': f'"n{start}"'})
+                if start < 3:
+                    r.headers['Link'] = f'<https://webexapis.com/v1/numbers?max=1&start={start + 1}>; rel="next"'
+                return r
+            if url.endswith('v1/locations') and 'cursor' not in url:
+                r = response(200, b'{"items": [{"id": "loc1"}]}', {'ETag': '"v1"'})
+                r.headers['Link'] = '<https://webexapis.com/v1/locations?cursor=2>; rel="next"'
+                return r
+            if 'cursor' in url:
+                return response(200, b'{"items": [{"id": "loc2"}]}', {'ETag': '"v2"'})
+            return response(200, b'{"id": "role", "name": "Admin"}', {'ETag': '"v1"'})
+
+        self.api.session.request = request
+
+    def test_served_from_cache(self):
+        self.assertEqual(self.api.get('v1/roles/role'), {'id': 'role', 'name': 'Admin'})
+        role = self.api.get('v1/roles/role')
+        self.assertEqual(role, {'id': 'role', 'name': 'Admin'})
+        self.assertEqual(len(self.sent), 1)
+        # Callers get a copy, so changing it doesn't change the cache
+        role['name'] = 'changed'
+        self.assertEqual(self.api.get('v1/roles/role')['name'], 'Admin')
+
+    def test_revalidate_with_etag(self):
+        self.cache.ttl = 0.05
+        self.api.get('v1/roles/role')
+        time.sleep(0.1)
+        self.cache.ttl = 60
+        self.assertEqual(self.api.get('v1/roles/role'), {'id': 'role', 'name': 'Admin'})
+        self.assertEqual(self.sent[1], ('GET', 'v1/roles/role', {'If-None-Match': '"v1"'}))
+        # The 304 restarted the TTL, so the next GET doesn't go to Webex at all
+        self.assertEqual(self.api.get('v1/roles/role'), {'id': 'role', 'name': 'Admin'})
+        self.assertEqual(len(self.sent), 2)
+
+    def test_writes_evict(self):
+        writes = {'put': lambda: self.api.put('v1/roles/role', payload={'name': 'New'}),
+                  'post': lambda: self.api.post('v1/roles/role', payload={}),
+                  'patch': lambda: self.api.patch('v1/roles/role', payload={'name': 'New'}),
+                  'delete': lambda: self.api.delete('v1/roles/role')}
+        for name, write in writes.items():
+            with self.subTest(name):
+                self.cache.clear()
+                self.sent.clear()
+                self.api.get('v1/roles/role')
+                self.api.get('v1/roles/role')
+                write()
+                self.api.get('v1/roles/role')
+                self.assertEqual([method for method, _, _ in self.sent], ['GET', name.upper(), 'GET'])
+
+    def test_multi_page_has_no_etag(self):
+        self.cache.ttl = 0.05
+        self.assertEqual(self.api.get('v1/locations'), [{'id': 'loc1'}, {'id': 'loc2'}])
+        self.assertIsNone(self.cache.get("https://webexapis.com/v1/locations", {}).etag)
+        time.sleep(0.1)
+        self.sent.clear()
+        # With no ETag, the expired list is fetched again in full instead of revalidated with the first page's ETag
+        self.assertEqual(self.api.get('v1/locations'), [{'id': 'loc1'}, {'id': 'loc2'}])
+        self.assertEqual([headers for _, _, headers in self.sent], [None, None])
+
+    def test_parallel_pages_have_no_etag(self):
+        numbers = self.api.get('v1/numbers', params={'max': 1}, parallel=True)
+        self.assertEqual(numbers, [{'id': 'n0'}, {'id': 'n1'}, {'id': 'n2'}])
+        self.assertIsNone(self.cache.get("https://webexapis.com/v1/numbers", {'max': 1}).etag)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+import requests
+import wxcadm
+
+
+class TestJsonCodec(unittest.TestCase):
+    def codecs(self):
+        codecs = [wxcadm.JsonCodec()]
+        for codec_class in (wxcadm.OrjsonCodec, wxcadm.MsgspecCodec):
+            try:
+                codecs.append(codec_class())
+            except ImportError:
+                pass
+        return codecs
+
+    def test_round_trip(self):
+        value = {'items': [{'id': 'abc', 'name': 'Ünïcode', 'count': 3, 'enabled': True, 'extra': None}]}
+        for codec in self.codecs():
+            with self.subTest(codec=codec.name):
+                encoded = codec.dumps(value)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(codec.loads(encoded), value)
+                self.assertEqual(wxcadm.JsonCodec().loads(encoded), value)
+                with self.assertRaises(ValueError):
+                    codec.loads(b'not json')
+
+    def test_webex_api_uses_codec(self):
+        api = wxcadm.WebexApi("token", json_codec=wxcadm.JsonCodec())
+        self.assertEqual(api.codec.name, 'json')
+        r = requests.Response()
+        r._content = b'{"id": "abc"}'
+        self.assertEqual(api._json(r), {'id': 'abc'})
+        r._content = b''
+        with self.assertRaises(requests.exceptions.JSONDecodeError):
+            api._json(r)
+
+
+if __name__ == '__main__':
+    unittest.main()
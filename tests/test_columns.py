@@ -0,0 +1,77 @@
+import importlib.util
+import unittest
+from types import SimpleNamespace
+import wxcadm
+
+
+def items():
+    return [{'id': f'p{i}', 'emails': [f'user{i}@example.com'], 'displayName': f'User {i}',
+             'locationId': f'L{i % 3}' if i % 4 else '', 'extension': str(1000 + i) if i % 5 else None,
+             'phoneNumbers': [{'type': 'mobile', 'value': f'+1404{i:07d}'},
+                              {'type': 'work', 'value': f'+1919{i:07d}', 'primary': True}],
+             'licenses': ['msg', 'wxc'] if i % 2 else ['msg']}
+            for i in range(12)]
+
+
+def org(calls: list):
+    def iter_items(endpoint, params=None):
+        calls.append((endpoint, params))
+        return iter(items())
+    return SimpleNamespace(api=SimpleNamespace(iter_items=iter_items), locations=[],
+                           licenses=[SimpleNamespace(id='wxc', wxc_license=True),
+                                     SimpleNamespace(id='msg', wxc_license=False)])
+
+
+class TestPeopleFrame(unittest.TestCase):
+    def frame(self) -> wxcadm.PeopleFrame:
+        return wxcadm.PeopleFrame.from_items(items(), wxcadm.Hydrator(org([])))
+
+    def test_columns(self):
+        people = self.frame()
+        self.assertEqual(len(people), 12)
+        self.assertEqual(people['email'][3], 'user3@example.com')
+        self.assertEqual(people['phone_number'][3], '+19190000003')
+        self.assertEqual(people['license_count'][3], 2)
+        self.assertEqual(people['wxc_license'][:5], [False, True, False, True, False])
+        # Like Person.wxc, a Webex Calling license only counts with a Location
+        self.assertEqual(people['wxc'][:5], [False, True, False, True, False])
+        self.assertFalse(people['wxc'][4])
+        self.assertEqual(people.where(wxc_license=True, location_id='')['id'], [])
+        self.assertEqual(set(people.columns), set(wxcadm.PeopleFrame.COLUMNS))
+
+    def test_missing_fields(self):
+        # Bots and some service accounts come back with no email addresses or phone numbers
+        people = wxcadm.PeopleFrame.from_items([{'id': 'p1', 'emails': []}, {'id': 'p2'}], wxcadm.Hydrator(org([])))
+        self.assertEqual(people['email'], ['', ''])
+        self.assertEqual(people['phone_number'], [None, None])
+        self.assertEqual(people['wxc'], [False, False])
+
+    def test_filter_and_group(self):
+        people = self.frame()
+        calling = people.where(wxc=True)
+        self.assertEqual(calling['id'], ['p1', 'p3', 'p5', 'p7', 'p9', 'p11'])
+        self.assertEqual(calling.count_by('location_id'), {'L1': 2, 'L0': 2, 'L2': 2})
+        groups = calling.group_by('location_id')
+        self.assertEqual(groups['L1']['id'], ['p1', 'p7'])
+        no_extension = people.filter([extension is None for extension in people['extension']])
+        self.assertEqual(no_extension['id'], ['p0', 'p5', 'p10'])
+        with self.assertRaises(ValueError):
+            people.filter([True])
+
+    def test_person_list(self):
+        calls = []
+        people = wxcadm.PersonList.__new__(wxcadm.PersonList)
+        people.org = org(calls)
+        people.location = SimpleNamespace(id='L1')
+        frame = people.to_columns()
+        self.assertEqual(len(frame), 12)
+        self.assertEqual(calls, [('v1/people', {'callingData': 'true', 'locationId': 'L1'})])
+
+    def test_pandas(self):
+        if importlib.util.find_spec('pandas') is None:
+            with self.assertRaises(ImportError):
+                self.frame().to_pandas()
+        else:
+            data_frame = self.frame().to_pandas()
+            self.assertEqual(list(data_frame.columns), list(wxcadm.PeopleFrame.COLUMNS))
+            self.assertEqual(len(data_frame), 12)
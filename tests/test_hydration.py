@@ -0,0 +1,52 @@
+import unittest
+from types import SimpleNamespace
+import wxcadm
+from wxcadm.person import Person
+from wxcadm.workspace import Workspace
+
+
+class Org(SimpleNamespace):
+    """ An Org that counts how many times its licenses and locations are listed """
+    def __init__(self, **kwargs):
+        super().__init__(lookups=0, **kwargs)
+
+    def __getattribute__(self, name):
+        if name in ('licenses', 'locations'):
+            object.__setattr__(self, 'lookups', object.__getattribute__(self, 'lookups') + 1)
+        return object.__getattribute__(self, name)
+
+
+def org():
+    return Org(
+        licenses=[SimpleNamespace(id='wxc', wxc_license=True), SimpleNamespace(id='msg', wxc_license=False)],
+        locations=[SimpleNamespace(id='L1', name='Main'), SimpleNamespace(id='L2', name='Branch')],
+    )
+
+
+class TestHydrator(unittest.TestCase):
+    def test_tables(self):
+        hydrator = wxcadm.Hydrator(org())
+        self.assertEqual(hydrator.wxc_license_ids, frozenset({'wxc'}))
+        self.assertEqual(hydrator.location('L2').name, 'Branch')
+        self.assertIsNone(hydrator.location('L9'))
+
+    def test_people_share_tables(self):
+        test_org = org()
+        hydrator = wxcadm.Hydrator(test_org)
+        people = [Person(f'p{i}', org=test_org, hydrator=hydrator,
+                         config={'emails': [f'user{i}@example.com'], 'locationId': 'L1' if i % 2 else '',
+                                 'licenses': ['msg', 'wxc'] if i % 3 else ['msg']})
+                  for i in range(30)]
+        self.assertEqual(test_org.lookups, 1)
+        self.assertEqual([person.wxc for person in people], [bool(i % 2 and i % 3) for i in range(30)])
+        # Without a Hydrator, each Person works out the licenses itself
+        self.assertTrue(Person('p', org=test_org, config={'locationId': 'L1', 'licenses': ['wxc']}).wxc)
+        self.assertEqual(test_org.lookups, 2)
+
+    def test_workspaces_share_tables(self):
+        test_org = org()
+        hydrator = wxcadm.Hydrator(test_org)
+        workspaces = [Workspace(test_org, f'w{i}', config={'displayName': f'Room {i}', 'locationId': f'L{i % 2 + 1}'},
+                                hydrator=hydrator) for i in range(10)]
+        self.assertEqual(test_org.lookups, 1)
+        self.assertEqual(workspaces[1].location_id.name, 'Branch')
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+import unittest
+import wxcadm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_lazy_modules_not_imported(self):
+        # Use a new interpreter, because other tests may have imported the modules already
+        code = ("import sys, wxcadm; "
+                "print(','.join(m for m in ('wxcadm.xsi', 'wxcadm.redsky', 'wxcadm.meraki', 'wxcadm.cdr', "
+                "'wxcadm.reports', 'srvlookup', 'xmltodict') if m in sys.modules))")
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+        self.assertEqual(result.stdout.strip(), '')
+
+    def test_lazy_names(self):
+        from wxcadm.xsi import XSI
+        from wxcadm.redsky import RedSky
+        self.assertIs(wxcadm.XSI, XSI)
+        self.assertIs(wxcadm.RedSky, RedSky)
+        self.assertEqual(wxcadm.Call.__module__, 'wxcadm.xsi')
+        self.assertIn('Meraki', dir(wxcadm))
+        with self.assertRaises(AttributeError):
+            wxcadm.NotAThing
+
+
+if __name__ == '__main__':
+    unittest.main()
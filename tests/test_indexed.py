@@ -0,0 +1,106 @@
+import unittest
+from types import SimpleNamespace
+import wxcadm
+from wxcadm.indexed import casefold
+from wxcadm.number import Number, NumberList, normalize_number
+
+
+class Items(wxcadm.IndexedList):
+    _indexes = {
+        'id': lambda item: item.id,
+        'name': lambda item: casefold(item.name),
+    }
+
+
+def item(id: str, name: str):
+    return SimpleNamespace(id=id, name=name)
+
+
+class TestIndexedList(unittest.TestCase):
+    def test_find(self):
+        items = Items([item('1', 'Alpha'), item('2', 'beta'), item('3', 'BETA')])
+        self.assertEqual(items._find('id', '2')[0].name, 'beta')
+        self.assertEqual([entry.id for entry in items._find('name', 'beta')], ['2', '3'])
+        self.assertEqual(items._find('id', '9'), [])
+        self.assertEqual(items._find_first(('name', 'beta'), ('id', '1')).id, '1')
+        self.assertIsNone(items._find_first(('id', None)))
+
+    def test_kept_current(self):
+        items = Items([item('1', 'Alpha')])
+        self.assertEqual(len(items._find('id', '1')), 1)
+        items.append(item('2', 'Beta'))
+        self.assertEqual(items._find('id', '2')[0].name, 'Beta')
+        items.remove(items[0])
+        self.assertEqual(items._find('id', '1'), [])
+        self.assertEqual(items._find('id', '2')[0].name, 'Beta')
+        items.data = [item('3', 'Gamma')]
+        self.assertEqual(items._find('id', '2'), [])
+        self.assertEqual(items._find('name', 'gamma')[0].id, '3')
+        items._discard(items[0])
+        self.assertEqual(len(items), 0)
+
+    def test_changed_item(self):
+        items = Items([item('1', 'Alpha'), item('2', 'Beta')])
+        self.assertEqual(len(items._find('name', 'alpha')), 1)
+        items[0].name = 'Beta'
+        self.assertEqual(items._find('name', 'alpha'), [])
+        self.assertEqual([entry.id for entry in items._find('name', 'beta')], ['1', '2'])
+
+    def test_workspace_list(self):
+        workspaces = wxcadm.WorkspaceList.__new__(wxcadm.WorkspaceList)
+        wxcadm.IndexedList.__init__(workspaces, [SimpleNamespace(id=f'ws{i}', name=f'Room {i}', spark_id=f'x/uuid{i}')
+                                                 for i in range(1000)])
+        self.assertEqual(workspaces.get(name='Room 500').id, 'ws500')
+        self.assertEqual(workspaces.get(uuid='uuid7').id, 'ws7')
+        self.assertEqual(workspaces.get_by_id('ws999').name, 'Room 999')
+        self.assertIsNone(workspaces.get(id='nope'))
+
+    def test_person_list(self):
+        people = wxcadm.PersonList(SimpleNamespace())
+        people.data = [SimpleNamespace(id='p1', email='Second@example.com', display_name='One'),
+                       SimpleNamespace(id='p2', email='first@example.com', display_name='Two')]
+        people._PersonList__data_loaded = True
+        self.assertEqual(people.get(email='SECOND@example.com').id, 'p1')
+        # The ID is checked before the email, even when the email matches an earlier Person
+        self.assertEqual(people.get(id='p2', email='second@example.com').id, 'p2')
+
+
+class TestNumberIndex(unittest.TestCase):
+    def numbers(self) -> NumberList:
+        numbers = NumberList.__new__(NumberList)
+        wxcadm.IndexedList.__init__(numbers)
+        numbers.data = [
+            Number(phone_number='+19195551234', extension='1234', esn='81234', state='ACTIVE', _location={'id': 'L1'}),
+            Number(phone_number='+14045551234', extension='1234', state='ACTIVE', _location={'id': 'L2'}),
+            Number(phone_number='+442079460000', extension='2000', state='INACTIVE', _location={'id': 'L2'}),
+            Number(phone_number=None, extension='3000', state='ACTIVE', _location={'id': 'L1'}),
+        ]
+        return numbers
+
+    def test_normalize(self):
+        self.assertEqual(normalize_number(' +1 (919) 555-1234'), '+19195551234')
+        self.assertEqual(normalize_number('919.555.1234'), '9195551234')
+        self.assertIsNone(normalize_number('ext'))
+
+    def test_find(self):
+        numbers = self.numbers()
+        self.assertEqual(numbers.get(phone_number='+1 919 555 1234').extension, '1234')
+        self.assertEqual(numbers.get(phone_number='(404) 555-1234').phone_number, '+14045551234')
+        self.assertEqual(numbers.get(phone_number='14045551234').phone_number, '+14045551234')
+        self.assertEqual([n.phone_number for n in numbers.find('5551234')], ['+19195551234', '+14045551234'])
+        self.assertEqual(numbers.find('+9195551234'), [])
+        self.assertIsNone(numbers.get(phone_number='+15555555555'))
+
+    def test_extension_and_location(self):
+        numbers = self.numbers()
+        location = SimpleNamespace(id='L2')
+        self.assertEqual(numbers.get(extension='1234', location=location).phone_number, '+14045551234')
+        self.assertEqual(len(numbers.get(extension='1234')), 2)
+        self.assertEqual(numbers.get(esn='81234').phone_number, '+19195551234')
+        self.assertEqual(numbers.get(state='INACTIVE').extension, '2000')
+        numbers.append(Number(phone_number='+13125550000', extension='1234', _location={'id': 'L3'}))
+        self.assertEqual(numbers.find('3125550000')[0].extension, '1234')
+
+
+if __name__ == '__main__':
+    unittest.main()
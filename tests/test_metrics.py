@@ -0,0 +1,35 @@
+import unittest
+import wxcadm
+
+
+class TestApiMetrics(unittest.TestCase):
+    def test_endpoint_template(self):
+        url = ("https://webexapis.com/v1/telephony/config/locations/"
+               "Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OLzEyMzQ/queues/a1b2c3d4-e5f6-1111-2222-333344445555")
+        self.assertEqual(wxcadm.endpoint_template(url), "v1/telephony/config/locations/{id}/queues/{id}")
+        self.assertEqual(wxcadm.endpoint_template("v1/people/me"), "v1/people/me")
+
+    def test_snapshot_and_prometheus(self):
+        metrics = wxcadm.ApiMetrics(buckets=(0.1, 1.0, float('inf')))
+        events = []
+        metrics.add_callback(events.append)
+        for status, elapsed, retry in [(429, 0.05, False), (200, 0.5, True), (200, 2.0, False)]:
+            metrics.record(wxcadm.RequestEvent(method='GET', url='https://webexapis.com/v1/people', template='v1/people',
+                                               status=status, elapsed=elapsed, bytes=100, retry=retry, page=True))
+        self.assertEqual(len(events), 3)
+        values = metrics.snapshot()['GET v1/people']
+        self.assertEqual(values['count'], 3)
+        self.assertEqual(values['throttled'], 1)
+        self.assertEqual(values['retries'], 1)
+        self.assertEqual(values['bytes'], 300)
+        self.assertEqual(list(values['latency_buckets'].values()), [1, 1, 1])
+        text = metrics.to_prometheus()
+        self.assertIn('wxcadm_requests_total{method="GET",endpoint="v1/people"} 3', text)
+        self.assertIn('wxcadm_request_duration_seconds_bucket{method="GET",endpoint="v1/people",le="1.0"} 2', text)
+        self.assertIn('wxcadm_request_duration_seconds_bucket{method="GET",endpoint="v1/people",le="+Inf"} 3', text)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import wxcadm
+
+BASE = "https://webexapis.com/v1/"
+
+
+def fetch_each(detector, ids):
+    for person_id in ids:
+        detector.record('GET', BASE + f"people/Y2lzY29zcGFyazovL3VzL1BFT1BMRS8{person_id}")
+
+
+class TestNPlusOneDetector(unittest.TestCase):
+    def test_warns_past_threshold(self):
+        with wxcadm.NPlusOneDetector(threshold=3) as detector:
+            self.assertIs(wxcadm.get_n_plus_one_detector(), detector)
+            fetch_each(detector, ['a', 'a', 'b', 'c'])
+            self.assertEqual(detector.findings, {})
+            with self.assertLogs('wxcadm', level='WARNING'):
+                fetch_each(detector, ['d', 'e'])
+        self.assertIsNone(wxcadm.get_n_plus_one_detector())
+        finding = detector.findings['GET v1/people/{id}']
+        self.assertEqual(finding['ids'], 5)
+        self.assertIn('fetch_each', finding['wxcadm_site'])
+
+    def test_params_and_paging(self):
+        detector = wxcadm.NPlusOneDetector(threshold=2, raise_error=True)
+        for start in range(0, 500, 100):
+            detector.record('GET', BASE + "people", {'orgId': 'org', 'start': start, 'max': 100})
+        detector.record('GET', BASE + "people", {'id': 'one'})
+        detector.record('GET', BASE + "people", {'id': 'two'})
+        with self.assertRaises(wxcadm.NPlusOneError):
+            detector.record('GET', BASE + "people", {'id': 'three'})
+        # Every later request with the template raises too, not just the first one past the threshold
+        with self.assertRaises(wxcadm.NPlusOneError):
+            detector.record('GET', BASE + "people", {'id': 'four'})
+        with self.assertRaises(wxcadm.NPlusOneError):
+            detector.record('GET', BASE + "people", {'id': 'three'})
+        self.assertEqual(detector.findings['GET v1/people']['ids'], 4)
+
+    def test_ignore(self):
+        detector = wxcadm.NPlusOneDetector(threshold=1, raise_error=True, ignore=['GET v1/people/{id}'])
+        fetch_each(detector, ['a', 'b', 'c'])
+        self.assertEqual(detector.findings, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
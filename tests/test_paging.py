@@ -0,0 +1,248 @@
+import json
+import threading
+import unittest
+from types import SimpleNamespace
+from urllib.parse import urlparse, parse_qsl
+import requests
+import wxcadm
+from wxcadm.events import AuditEventList
+
+
+def response(status: int, body: bytes) -> requests.Response:
+    r = requests.Response()
+    r.status_code = status
+    r.headers['Content-Type'] = 'application/json'
+    r._content = body
+    return r
+
+
+class TestPageSizes(unittest.TestCase):
+    def test_apply(self):
+        sizes = wxcadm.PageSizes()
+        self.assertEqual(sizes.apply('https://webexapis.com/v1/devices', {'orgId': 'abc'}),
+                         {'orgId': 'abc', 'max': 1000})
+        self.assertEqual(sizes.apply('v1/devices', {'max': 10}), {'max': 10})
+        self.assertEqual(sizes.apply('v1/people', {'callingData': 'true'}), {'callingData': 'true', 'max': 100})
+        self.assertEqual(sizes.apply('v1/people/abc123', {}), {})
+
+    def test_overrides(self):
+        sizes = wxcadm.PageSizes(overrides={'v1/devices': None, 'v1/groups': 500})
+        self.assertIsNone(sizes.lookup('v1/devices'))
+        self.assertEqual(sizes.lookup('v1/groups'), 500)
+        sizes.set('https://webexapis.com/v1/workspaces', 200)
+        self.assertEqual(sizes.lookup('v1/workspaces'), 200)
+
+    def test_reject(self):
+        sizes = wxcadm.PageSizes()
+        params = {'max': 10}
+        self.assertFalse(sizes.reject('v1/devices', params, '{"message": "max is too large"}'))
+        self.assertEqual(params, {'max': 10})
+        params = {'max': 1000, 'type': 'phone'}
+        self.assertFalse(sizes.reject('v1/devices', params, '{"message": "Invalid type"}'))
+        self.assertEqual(params, {'max': 1000, 'type': 'phone'})
+        self.assertTrue(sizes.reject('v1/devices', params, '{"message": "max is too large"}'))
+        self.assertEqual(params, {'type': 'phone'})
+        # The registry is shared, so it keeps its page size
+        self.assertEqual(sizes.lookup('v1/devices'), 1000)
+
+    def test_get_retries_without_rejected_size(self):
+        sent = []
+
+        def request(method, url, params=None, **kwargs):
+            sent.append(dict(params))
+            if 'max' in params:
+                return response(400, b'{"message": "max is too large"}')
+            return response(200, b'{"items": [{"id": "1"}]}')
+
+        api = wxcadm.WebexApi("token", page_sizes=wxcadm.PageSizes(), metrics=wxcadm.ApiMetrics())
+        api.session.request = request
+        self.assertEqual(api.get('v1/devices'), [{'id': '1'}])
+        self.assertEqual(api.get('v1/devices', params={'type': 'phone'}), [{'id': '1'}])
+        self.assertEqual(sent, [{'max': 1000}, {}, {'type': 'phone'}])
+        self.assertEqual(api.paging.lookup('v1/devices'), 1000)
+        # Another WebexApi still sends the page size
+        other = wxcadm.WebexApi("token", page_sizes=api.paging, metrics=wxcadm.ApiMetrics())
+        other.session.request = request
+        other.get('v1/devices')
+        self.assertEqual(sent[3], {'max': 1000})
+
+    def test_other_400_is_raised(self):
+        sent = []
+
+        def request(method, url, params=None, **kwargs):
+            sent.append(dict(params))
+            return response(400, b'{"message": "Invalid value for type"}')
+
+        api = wxcadm.WebexApi("token", page_sizes=wxcadm.PageSizes(), metrics=wxcadm.ApiMetrics())
+        api.session.request = request
+        with self.assertRaises(wxcadm.APIError):
+            api.get('v1/devices', params={'type': 'bad'})
+        self.assertEqual(sent, [{'type': 'bad', 'max': 1000}])
+        self.assertEqual(api._apply_page_size('https://webexapis.com/v1/devices', {}), {'max': 1000})
+
+
+class TestParallelPages(unittest.TestCase):
+    def test_offset_pages_in_order(self):
+        total = 23
+        sent = []
+        lock = threading.Lock()
+
+        def request(method, url, params=None, **kwargs):
+            query = dict(parse_qsl(urlparse(url).query))
+            query.update(params or {})
+            start, size = int(query.get('start', 0)), int(query['max'])
+            with lock:
+                sent.append(start)
+            r = response(200, json.dumps({'numbers': list(range(start, min(start + size, total)))}).encode())
+            if start + size < total:
+                r.headers['Link'] = f'<https://webexapis.com/v1/telephony/config/numbers?max={size}' \
+                                    f'&start={start + size}>; rel="next"'
+            return r
+
+        api = wxcadm.WebexApi("token", page_sizes=wxcadm.PageSizes(), metrics=wxcadm.ApiMetrics())
+        api.session.request = request
+        items = api.get('v1/telephony/config/numbers', params={'max': 5}, items_key='numbers', parallel=True)
+        self.assertEqual(items, list(range(total)))
+        self.assertEqual(sorted(sent)[:5], [0, 5, 10, 15, 20])
+
+    def test_short_pages(self):
+        # Webex may return fewer than max items and still send a next link, so nothing may be skipped
+        total = 23
+
+        def api_for(page_length):
+            def request(method, url, params=None, **kwargs):
+                query = dict(parse_qsl(urlparse(url).query))
+                query.update(params or {})
+                start, size = int(query.get('start', 0)), int(query['max'])
+                end = min(start + page_length(start, size), total)
+                r = response(200, json.dumps({'numbers': list(range(start, end))}).encode())
+                if end < total:
+                    r.headers['Link'] = f'<https://webexapis.com/v1/telephony/config/numbers?max={size}' \
+                                        f'&start={end}>; rel="next"'
+                return r
+
+            api = wxcadm.WebexApi("token", page_sizes=wxcadm.PageSizes(), metrics=wxcadm.ApiMetrics())
+            api.session.request = request
+            return api
+
+        for name, page_length in [('capped', lambda start, size: 3),
+                                  ('one short page', lambda start, size: 2 if start == 10 else size)]:
+            with self.subTest(name):
+                items = api_for(page_length).get('v1/telephony/config/numbers', params={'max': 5},
+                                                 items_key='numbers', parallel=True)
+                self.assertEqual(items, list(range(total)))
+
+    def test_inside_capped_batch(self):
+        # The page requests of a parallel get() inside a batch() item must not wait for a second window slot
+        total = 23
+
+        def request(method, url, params=None, **kwargs):
+            query = dict(parse_qsl(urlparse(url).query))
+            query.update(params or {})
+            start, size = int(query.get('start', 0)), int(query['max'])
+            r = response(200, json.dumps({'numbers': list(range(start, min(start + size, total)))}).encode())
+            if start + size < total:
+                r.headers['Link'] = f'<https://webexapis.com/v1/telephony/config/numbers?max={size}' \
+                                    f'&start={start + size}>; rel="next"'
+            return r
+
+        api = wxcadm.WebexApi("token", page_sizes=wxcadm.PageSizes(), metrics=wxcadm.ApiMetrics(),
+                              concurrency=wxcadm.AdaptiveConcurrency(initial=2, max_window=2))
+        api.session.request = request
+
+        def get_numbers():
+            return api.get('v1/telephony/config/numbers', params={'max': 5}, items_key='numbers', parallel=True)
+
+        results = []
+        worker = threading.Thread(target=lambda: results.extend(api.batch([get_numbers, get_numbers])), daemon=True)
+        worker.start()
+        worker.join(timeout=10)
+        self.assertFalse(worker.is_alive(), "The batch is waiting for a window slot")
+        self.assertEqual([result.result for result in results], [list(range(total))] * 2)
+        self.assertEqual(api.concurrency.in_flight, 0)
+
+
+class TestDeviceListStream(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.pulled = []
+
+        def iter_pages(endpoint, params=None, items_key='items', prefetch=True):
+            self.calls.append((endpoint, params, prefetch))
+            for number in range(3):
+                self.pulled.append(number)
+                yield [{'id': f'{number}-{n}', 'displayName': f'Phone {number}-{n}', 'type': 'phone'}
+                       for n in range(2)]
+
+        api = wxcadm.WebexApi("token")
+        api.iter_pages = iter_pages
+        # Loading the list uses get(), which gathers every page first
+        api.get = lambda endpoint, params=None, items_key='items': [item for page in iter_pages(endpoint, params)
+                                                                    for item in page]
+        self.org = SimpleNamespace(api=api, licenses=[], locations=[])
+
+    def test_stream(self):
+        person = wxcadm.person.Person('person1', org=self.org, config={'id': 'person1', 'emails': ['user@example.com']})
+        devices = wxcadm.device.DeviceList(self.org, parent=person)
+        self.calls.clear()
+        self.pulled.clear()
+        stream = devices.stream()
+        self.assertEqual([next(stream).id for _ in range(3)], ['0-0', '0-1', '1-0'])
+        # Only the pages needed so far were pulled, and iter_pages was asked to prefetch the next one
+        self.assertEqual(self.pulled, [0, 1])
+        self.assertEqual(self.calls, [('v1/devices', {'personId': 'person1'}, True)])
+        stream.close()
+        self.assertEqual(self.pulled, [0, 1])
+        self.assertEqual([device.id for device in devices.stream()], ['0-0', '0-1', '1-0', '1-1', '2-0', '2-1'])
+        # Streaming doesn't change the list itself
+        self.assertEqual(len(devices), 6)
+
+
+class TestListStreams(unittest.TestCase):
+    """ Stream each list from a stubbed session serving three pages of two items """
+    def setUp(self):
+        self.sent = []
+
+        def request(method, url, params=None, **kwargs):
+            self.sent.append(url)
+            page = int(dict(parse_qsl(urlparse(url).query)).get('cursor', 0))
+            items = [{'id': f'{page}-{n}', 'emails': [f'user{page}{n}@example.com'], 'data': {}} for n in range(2)]
+            r = response(200, json.dumps({'items': items}).encode())
+            if page < 2:
+                endpoint = url.split('?')[0]
+                r.headers['Link'] = f'<{endpoint}?cursor={page + 1}>; rel="next"'
+            return r
+
+        self.api = wxcadm.WebexApi("token", cache=wxcadm.ResponseCache())
+        self.api.session.request = request
+        org = SimpleNamespace(api=self.api, licenses=[], locations=[])
+        self.lists = {
+            'PersonList': wxcadm.PersonList(org),
+            'RecordingList': wxcadm.RecordingList(org),
+            'AuditEventList': AuditEventList(org, start='2026-01-01', end='2026-02-01'),
+        }
+
+    def test_stream(self):
+        for name, items in self.lists.items():
+            with self.subTest(name):
+                self.sent.clear()
+                stream = items.stream()
+                self.assertEqual(next(stream).id, '0-0')
+                # The last page isn't requested until the earlier pages have been used
+                self.assertLessEqual(len(self.sent), 2)
+                self.assertEqual([item.id for item in stream], ['0-1', '1-0', '1-1', '2-0', '2-1'])
+                self.assertEqual(len(self.sent), 3)
+
+    def test_load_uses_cache(self):
+        for name, items in self.lists.items():
+            with self.subTest(name):
+                items.data = items._get_data()
+                self.sent.clear()
+                items.data = items._get_data()
+                self.assertEqual([item.id for item in items], ['0-0', '0-1', '1-0', '1-1', '2-0', '2-1'])
+                # The list was loaded with get(), so the second load came from the ResponseCache
+                self.assertEqual(self.sent, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -47,6 +47,11 @@ class TestPersonList(unittest.TestCase):
         self.assertEqual(random_person.id, get_person.id)
         self.assertEqual(random_person.display_name, get_person.display_name)
 
+    def test_stream(self) -> None:
+        streamed_ids = [person.id for person in self.webex.org.people.stream()]
+        all_ids = [person.id for person in self.webex.org.people.all()]
+        self.assertCountEqual(streamed_ids, all_ids)
+
 
 
 
@@ -0,0 +1,116 @@
+import unittest
+import json
+import os
+import tempfile
+from urllib.parse import urlparse
+import requests
+import wxcadm
+from wxcadm.common import _region_redirect_domain
+
+
+class TestRegionMap(unittest.TestCase):
+    def test_route_and_learn(self):
+        regions = wxcadm.RegionMap()
+        url = "https://webexapis.com/v1/cdr_feed?startTime=now"
+        self.assertEqual(regions.route('org', url), url)
+        regions.learn('org', url, 'analytics-calling-eu.webexapis.com')
+        self.assertEqual(regions.route('org', url),
+                         "https://analytics-calling-eu.webexapis.com/v1/cdr_feed?startTime=now")
+        # Other Orgs and other endpoint families are left alone
+        self.assertEqual(regions.route('other', url), url)
+        self.assertEqual(regions.route('org', "https://webexapis.com/v1/people"),
+                         "https://webexapis.com/v1/people")
+        analytics = "https://analytics.webexapis.com/v1/cdr_feed"
+        self.assertEqual(regions.route('org', analytics), "https://analytics-calling-eu.webexapis.com/v1/cdr_feed")
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'regions.json')
+            wxcadm.RegionMap(path=path).learn('org', "https://webexapis.com/v1/cdr_feed", 'eu.webexapis.com')
+            self.assertEqual(wxcadm.RegionMap(path=path).lookup('org', "https://webexapis.com/v1/cdr_feed/x"),
+                             'eu.webexapis.com')
+
+    def test_redirect_domain(self):
+        self.assertEqual(_region_redirect_domain({'message': 'Please use https://eu.webexapis.com/v1/cdr_feed'}),
+                         'eu.webexapis.com')
+        self.assertEqual(_region_redirect_domain({'message': 'Wrong region. URL: eu.webexapis.com'}),
+                         'eu.webexapis.com')
+        self.assertIsNone(_region_redirect_domain({'message': 'Unavailable'}))
+
+
+class CountingCodec(wxcadm.JsonCodec):
+    def __init__(self):
+        super().__init__()
+        self.decoded = []
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+class TestRegionRedirect(unittest.TestCase):
+    def test_get_follows_451(self):
+        sent = []
+
+        def request(method, url, params=None, **kwargs):
+            sent.append(url)
+            r = requests.Response()
+            r.headers['Content-Type'] = 'application/json'
+            if url.startswith("https://webexapis.com/"):
+                r.status_code = 451
+                r._content = b'{"message": "Please use https://eu.webexapis.com/v1/cdr_feed"}'
+            else:
+                r.status_code = 200
+                r._content = b'{"items": [{"id": "1"}]}'
+            return r
+
+        calls = {'get': lambda api: api.get('v1/cdr_feed'),
+                 'iter_pages': lambda api: next(api.iter_pages('v1/cdr_feed'))}
+        for name, call in calls.items():
+            with self.subTest(name):
+                sent.clear()
+                codec = CountingCodec()
+                api = wxcadm.WebexApi("token", org_id='org', json_codec=codec, region_map=wxcadm.RegionMap(),
+                                      page_sizes=wxcadm.PageSizes(overrides={'v1/cdr_feed': None}))
+                api.session.request = request
+                self.assertEqual(call(api), [{'id': '1'}])
+                self.assertEqual(sent, ["https://webexapis.com/v1/cdr_feed", "https://eu.webexapis.com/v1/cdr_feed"])
+                # The 451 body was decoded by the codec only once, and the page once
+                self.assertEqual(len(codec.decoded), 2)
+
+
+class TestCdrRegions(unittest.TestCase):
+    def test_orgs_in_different_regions(self):
+        regions = {'orgA': 'analytics-calling-eu.webexapis.com', 'orgB': 'analytics-calling-au.webexapis.com'}
+        current = {}
+        sent = []
+
+        def request(method, url, params=None, **kwargs):
+            # The CDR feed has no orgId, so the stub uses the Org the test is working on to decide the region
+            host = urlparse(url).netloc
+            sent.append(host)
+            r = requests.Response()
+            r.headers['Content-Type'] = 'application/json'
+            if host == regions[current['org']]:
+                r.status_code = 200
+                r._content = json.dumps({'items': [{'org': current['org']}]}).encode()
+            else:
+                r.status_code = 451
+                message = f"Please use https://{regions[current['org']]}/v1/cdr_feed"
+                r._content = json.dumps({'message': message}).encode()
+            return r
+
+        api = wxcadm.WebexApi("token", region_map=wxcadm.RegionMap(),
+                              page_sizes=wxcadm.PageSizes(overrides={'v1/cdr_feed': None}))
+        api.session.request = request
+        orgs = {org_id: wxcadm.Org(api, name=org_id, id=org_id) for org_id in regions}
+        for org_id in ['orgA', 'orgB', 'orgA', 'orgB']:
+            current['org'] = org_id
+            self.assertEqual(wxcadm.calls.Calls(orgs[org_id]).cdr(hours=1), [{'org': org_id}])
+        # Each Org paid for one 451, then went straight to its own region
+        self.assertEqual(sent, ['analytics.webexapis.com', regions['orgA'], 'analytics.webexapis.com', regions['orgB'],
+                                regions['orgA'], regions['orgB']])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from types import SimpleNamespace
+from wxcadm.device import Device
+from wxcadm.number import Number
+from wxcadm.person import Person
+
+
+def person():
+    org = SimpleNamespace(licenses=[SimpleNamespace(id='wxc', wxc_license=True)], locations=[])
+    return Person('p1', org=org, config={'emails': ['user@example.com'], 'locationId': 'L1', 'licenses': ['wxc'],
+                                         'displayName': 'User One'})
+
+
+class TestSlots(unittest.TestCase):
+    def test_person(self):
+        test_person = person()
+        self.assertEqual((test_person.email, test_person.name, test_person.wxc), ('user@example.com', 'User One', True))
+        self.assertIsNone(test_person._features)
+        # Attributes that aren't declared still work, using a __dict__ that is only created when needed
+        self.assertEqual(vars(test_person), {})
+        test_person.note = 'VIP'
+        self.assertEqual(vars(test_person), {'note': 'VIP'})
+
+    def test_feature_configs(self):
+        test_person = person()
+        self.assertEqual(test_person.vm_config, {})
+        test_person.vm_config['enabled'] = True
+        self.assertEqual(test_person.vm_config, {'enabled': True})
+        test_person.dnd = {'enabled': False}
+        self.assertEqual(test_person.dnd, {'enabled': False})
+        self.assertEqual(test_person.call_forwarding, {})
+        self.assertEqual(person().vm_config, {})
+
+    def test_device_and_number(self):
+        device = Device(org=None, parent=None, config={'id': 'd1', 'type': 'roomdesk', 'mac': '00AABB000001'})
+        self.assertEqual((device.id, device.mac, device.owner), ('d1', '00AABB000001', None))
+        self.assertEqual(vars(device), {})
+        number = Number.from_dict({'phoneNumber': '+19195551234', 'state': 'ACTIVE', 'location': {'id': 'L1'}})
+        self.assertEqual((number.phone_number, number.state, number._location), ('+19195551234', 'ACTIVE', {'id': 'L1'}))
+        self.assertEqual(vars(number), {})
+        self.assertIn('phone_number', Number.__slots__)
@@ -0,0 +1,67 @@
+import unittest
+import os
+import json
+import tempfile
+import wxcadm
+
+
+@wxcadm.traced
+class Thing:
+    def __init__(self):
+        self.calls = 0
+
+    def outer(self):
+        self.calls += 1
+        return self.inner()
+
+    def inner(self):
+        wxcadm.get_tracer().record_request('GET', 'https://webexapis.com/v1/people/Y2lzY29zcGFyazovL3VzL1BFT1BMRS8x',
+                                           200, 'ROUTER_1', 0.0, 0.0)
+        return 'done'
+
+    def idle(self):
+        return None
+
+    @property
+    def value(self):
+        return self.inner()
+
+
+class TestTracing(unittest.TestCase):
+    def test_off_by_default(self):
+        self.assertIsNone(wxcadm.get_tracer())
+        self.assertEqual(Thing().idle(), None)
+
+    def test_spans(self):
+        thing = Thing()
+        with wxcadm.Tracer() as tracer:
+            self.assertEqual(thing.outer(), 'done')
+            self.assertEqual(thing.value, 'done')
+            thing.idle()
+        self.assertIsNone(wxcadm.get_tracer())
+        spans = {span['id']: span for span in tracer.to_json()}
+        names = [span['name'] for span in spans.values()]
+        self.assertNotIn('Thing.idle', names)
+        self.assertEqual(names.count('Thing.inner'), 2)
+        for span in spans.values():
+            if span['name'] == 'Thing.inner':
+                self.assertIn(spans[span['parent_id']]['name'], ['Thing.outer', 'Thing.value'])
+                self.assertEqual(spans[span['parent_id']]['requests'], 1)
+        http = [span for span in tracer.to_json() if span['kind'] == 'http']
+        self.assertEqual(http[0]['name'], 'GET v1/people/{id}')
+        self.assertEqual(http[0]['attributes']['tracking_id'], 'ROUTER_1')
+
+    def test_export(self):
+        with wxcadm.Tracer() as tracer:
+            Thing().outer()
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'trace.json')
+            tracer.export(path, format='chrome')
+            with open(path) as f:
+                trace = json.load(f)
+        self.assertEqual(len(trace['traceEvents']), 3)
+        self.assertTrue(all(event['ph'] == 'X' for event in trace['traceEvents']))
+
+
+if __name__ == '__main__':
+    unittest.main()
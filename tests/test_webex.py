@@ -1,5 +1,6 @@
 import unittest
 import os
+import asyncio
 from dotenv import load_dotenv
 import wxcadm
 from random import choice
@@ -48,5 +49,13 @@ class TestWebex(unittest.TestCase):
         if location.call_queues:
             self.assertIsInstance(choice(location.call_queues), wxcadm.call_queue.CallQueue)
 
+    def test_async_api(self):
+        async def get_people():
+            async with self.webex.org.async_api as api:
+                return await api.get('v1/people')
+        people = asyncio.run(get_people())
+        self.assertIsInstance(people, list)
+        self.assertEqual(len(people), len(self.webex.org.people.all()))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,195 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+import requests
+from requests_toolbelt import MultipartEncoder
+import wxcadm
+
+
+def response(status: int, body: bytes) -> requests.Response:
+    r = requests.Response()
+    r.status_code = status
+    r.headers['Content-Type'] = 'application/json'
+    r._content = body
+    return r
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_pool_size(self):
+        api = wxcadm.WebexApi("token", max_workers=32)
+        self.assertEqual(api.session.get_adapter("https://webexapis.com/")._pool_maxsize, 32)
+        api = wxcadm.WebexApi("token", pool_connections=4, pool_maxsize=50)
+        adapter = api.session.get_adapter("https://webexapis.com/")
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 50)
+
+    def test_orgs_share_session(self):
+        api = wxcadm.WebexApi("token", max_workers=16)
+        orgs = [wxcadm.Org(api, name=f"Org {i}", id=f"org{i}") for i in range(3)]
+        for org in orgs:
+            self.assertIs(org.api.session, api.session)
+            self.assertEqual(org.api.max_workers, 16)
+        self.assertEqual(orgs[1].api.parameters, {'orgId': 'org1'})
+
+    def test_for_org_params(self):
+        api = wxcadm.WebexApi("token", org_id="partner")
+        customer = api.for_org("customer", params={'callingData': 'true'})
+        self.assertIs(customer.session, api.session)
+        self.assertEqual(customer.parameters, {'orgId': 'customer', 'callingData': 'true'})
+        self.assertIsNone(api.for_org(None).parameters)
+
+
+class TestLazyStartup(unittest.TestCase):
+    def test_org_from_id(self):
+        webex = wxcadm.Webex("token", org_id="org1", lazy=True)
+        sent = []
+        webex.api.session.send = lambda request, **kwargs: sent.append(request)
+        org = webex.org
+        self.assertEqual(org.id, "org1")
+        self.assertIs(org.api.session, webex.api.session)
+        self.assertIs(webex.org, org)
+        self.assertEqual(sent, [])
+
+    def test_read_only_org(self):
+        webex = wxcadm.Webex("token", read_only=True, lazy=True)
+        webex.api.get = lambda endpoint, **kwargs: {'orgId': 'org1'} if endpoint == 'v1/people/me' else None
+        self.assertIs(webex.org, webex.orgs[0])
+        self.assertEqual(webex.org.id, 'org1')
+        self.assertEqual(webex.org.name, 'My Organization')
+
+
+class TestInflightGet(unittest.TestCase):
+    def setUp(self):
+        self.sent = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.status = 200
+        self.api = wxcadm.WebexApi("token")
+
+        def request(method, url, params=None, **kwargs):
+            # A slow GET, held open until the test has queued every waiter behind it
+            self.sent.append((method, url))
+            self.started.set()
+            self.release.wait(5)
+            if self.status == 200:
+                return response(200, b'{"id": "abc", "emails": ["user@example.com"]}')
+            return response(self.status, b'{"message": "Not found"}')
+
+        self.api.session.request = request
+
+    def concurrent_gets(self, count: int) -> list:
+        # Start a leader GET, then count - 1 identical GETs while it is in flight
+        outcomes = [None] * count
+
+        def get(index):
+            try:
+                outcomes[index] = self.api.get('v1/people/abc')
+            except Exception as e:
+                outcomes[index] = e
+
+        threads = [threading.Thread(target=get, args=(0,))]
+        threads[0].start()
+        self.assertTrue(self.started.wait(5))
+        threads += [threading.Thread(target=get, args=(i,)) for i in range(1, count)]
+        for thread in threads[1:]:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while sum(call.waiters for call in list(self.api._inflight.values())) < count - 1:
+            self.assertLess(time.monotonic(), deadline, "The waiters never joined the in-flight GET")
+            time.sleep(0.01)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        return outcomes
+
+    def test_waiters_share_one_request(self):
+        results = self.concurrent_gets(4)
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(results, [{'id': 'abc', 'emails': ['user@example.com']}] * 4)
+        # Each caller has its own copy, so changing one result doesn't change the others
+        results[1]['emails'].append('other@example.com')
+        results[2]['id'] = 'changed'
+        self.assertEqual(results[0], {'id': 'abc', 'emails': ['user@example.com']})
+        self.assertEqual(results[3], {'id': 'abc', 'emails': ['user@example.com']})
+        self.assertEqual(self.api._inflight, {})
+        # A GET after the leader has finished sends its own request
+        self.assertEqual(self.api.get('v1/people/abc')['id'], 'abc')
+        self.assertEqual(len(self.sent), 2)
+
+    def test_error_raised_to_every_waiter(self):
+        self.status = 404
+        errors = self.concurrent_gets(3)
+        self.assertEqual(len(self.sent), 1)
+        for error in errors:
+            self.assertIsInstance(error, wxcadm.APIError)
+        self.assertEqual(self.api._inflight, {})
+        # The failed GET isn't left in flight, so the next one goes out
+        self.status = 200
+        self.assertEqual(self.api.get('v1/people/abc')['id'], 'abc')
+        self.assertEqual(len(self.sent), 2)
+
+
+class TestUpload(unittest.TestCase):
+    def setUp(self):
+        self.sent = []
+        self.status = 200
+        self.api = wxcadm.WebexApi("token")
+
+        def send(request, **kwargs):
+            self.sent.append(request)
+            return response(self.status, b'{"message": "Unsupported format"}' if self.status >= 400 else b'')
+
+        self.api.session.send = send
+
+    def upload(self, method):
+        encoder = MultipartEncoder(fields={'file': ('greeting.wav', b'RIFF0000WAVE', 'audio/wav')})
+        # The pooled session must be used, so creating any other Session fails the test
+        with mock.patch('requests.Session', side_effect=AssertionError("New Session created")), \
+                mock.patch('requests.sessions.Session', side_effect=AssertionError("New Session created")):
+            result = method('v1/people/abc/features/voicemail/actions/uploadBusyGreeting/invoke', payload=encoder)
+        return encoder, result
+
+    def test_pooled_upload(self):
+        for name in ('put_upload', 'post_upload'):
+            with self.subTest(name):
+                self.sent.clear()
+                encoder, result = self.upload(getattr(self.api, name))
+                self.assertTrue(result)
+                request = self.sent[0]
+                self.assertEqual(request.method, name.split('_')[0].upper())
+                # The encoder is streamed as the body, not serialized as JSON
+                self.assertIs(request.body, encoder)
+                self.assertEqual(request.headers['Content-Type'], encoder.content_type)
+                self.assertEqual(request.headers['Authorization'], 'Bearer token')
+        # Only the upload changed the Content-Type, not the pooled session
+        self.assertEqual(self.api.session.headers['Content-Type'], 'application/json')
+
+    def test_upload_error(self):
+        self.status = 415
+        with self.assertRaises(wxcadm.APIError):
+            self.upload(self.api.post_upload)
+
+    def test_person_greetings(self):
+        org = SimpleNamespace(api=self.api, licenses=[], locations=[])
+        person = wxcadm.person.Person('abc', org=org, config={'id': 'abc', 'emails': ['user@example.com']})
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, 'greeting.wav')
+            with open(filename, 'wb') as f:
+                f.write(b'RIFF0000WAVE')
+            self.assertTrue(person.upload_busy_greeting(filename, activate=False))
+            self.assertTrue(person.upload_no_answer_greeting(filename, activate=False))
+            self.status = 415
+            self.assertFalse(person.upload_busy_greeting(filename, activate=False))
+        self.assertEqual([request.url for request in self.sent[:2]], [
+            "https://webexapis.com/v1/people/abc/features/voicemail/actions/uploadBusyGreeting/invoke",
+            "https://webexapis.com/v1/people/abc/features/voicemail/actions/uploadNoAnswerGreeting/invoke",
+        ])
+        self.assertTrue(all(isinstance(request.body, MultipartEncoder) for request in self.sent))
+
+
+if __name__ == '__main__':
+    unittest.main()
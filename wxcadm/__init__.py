@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import logging
 # Set up NullHandler for logging
 log = logging.getLogger(__name__)
@@ -8,12 +9,21 @@ log.addHandler(logging.NullHandler())
 
 from .webex import Webex
 from .org import Org, WebexLicenseList, WebexLicense
-from .xsi import XSIEvents, Call, XSI, XSICallQueue
-from .redsky import RedSky
-from .meraki import Meraki
-from .cdr import CallDetailRecords
 from .exceptions import *
 from .common import *
+from .ratelimit import *
+from .cache import *
+from .batch import *
+from .metrics import *
+from .tracing import *
+from .nplusone import *
+from .region import *
+from .codec import *
+from .paging import *
+from .indexed import *
+from .hydration import *
+from .columns import *
+from .async_api import *
 from .wholesale import Wholesale
 from .location_features import *
 from .announcements import *
@@ -27,17 +37,42 @@ from .device import *
 from .hunt_group import *
 from .jobs import *
 from .location import *
-from .meraki import *
 from .monitoring import *
 from .number import *
 from .person import *
 from .pickup_group import *
 from .recording import *
-from .redsky import *
-from .reports import *
 from .virtual_line import *
 from .webhooks import *
 from .workspace import *
 from .pstn import *
 from .models import *
 
+
+# Subsystems that Webex and Org don't need are imported the first time one of their names is used, which keeps them
+# (and their dependencies, like srvlookup and xmltodict) out of the time it takes to import wxcadm
+_LAZY_NAMES = {
+    'xsi': ['XSIEvents', 'Call', 'XSI', 'XSICallQueue'],
+    'redsky': ['RedSky', 'RedSkyUsers', 'RedSkyUser', 'RedSkyBuilding', 'RedSkyLocation'],
+    'meraki': ['Meraki', 'MerakiOrg', 'MerakiNetwork', 'MerakiDevice', 'MerakiSwitch', 'MerakiSwitchPort',
+               'MerakiWireless', 'MerakiAuditResults', 'tags_decoder', 'address_cleaner'],
+    'cdr': ['CallDetailRecords'],
+    'reports': ['Report', 'ReportTemplate', 'ReportList'],
+}
+_LAZY_ATTRS = {name: module for module, names in _LAZY_NAMES.items() for name in names}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        return importlib.import_module(f".{name}", __name__)
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Cache the value so that __getattr__ isn't called for it again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_LAZY_ATTRS))
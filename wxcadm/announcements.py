@@ -11,8 +11,10 @@ from requests_toolbelt import MultipartEncoder
 
 import wxcadm.org
 from wxcadm import log
+from .tracing import traced
 
 
+@traced
 class AnnouncementList(UserList):
     def __init__(self, org: wxcadm.Org):
         super().__init__()
@@ -406,6 +408,7 @@ class Playlist:
         return True
 
 
+@traced
 class PlaylistList(UserList):
     def __init__(self, parent: wxcadm.Org):
         super().__init__()
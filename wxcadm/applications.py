@@ -6,8 +6,10 @@ from collections import UserList
 
 import wxcadm.org
 from wxcadm import log
+from .tracing import traced
 
 
+@traced
 class WebexApplications(UserList):
     def __init__(self, org: wxcadm.Org):
         super().__init__()
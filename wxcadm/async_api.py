@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Optional, Union
+
+from wxcadm import log
+from .exceptions import *
+from .common import _region_redirect_domain
+from .ratelimit import RateLimiter, SharedRateLimiter, get_rate_limiter
+from .region import RegionMap, get_region_map
+from .codec import get_json_codec
+
+__all__ = ['AsyncWebexApi']
+
+
+class AsyncWebexApi:
+    def __init__(self,
+                 access_token: str,
+                 org_id: Optional[str] = None,
+                 url_base: str = "https://webexapis.com/",
+                 retry_count: int = 10,
+                 max_connections: int = 100,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 region_map: Optional[RegionMap] = None):
+        """ An asyncio-native connection to the Webex API
+
+        The :class:`AsyncWebexApi` provides the same ``get``, ``put``, ``post``, ``patch`` and ``delete`` methods as
+        :class:`~.common.WebexApi`, with the same pagination, 429 Retry-After, 451 region-redirect and
+        :class:`~.exceptions.APIError` behavior, except each method is a coroutine. This allows hundreds of API calls
+        to be in flight at once from a single thread, for example with :func:`asyncio.gather`.
+
+        .. note::
+            This class requires the optional ``aiohttp`` library, which can be installed with
+            ``pip install "wxcadm[async]"``.
+
+        Args:
+            access_token (str): The Webex API Access Token
+            org_id (str, optional): The Org ID to send as the ``orgId`` param with every request
+            url_base (str, optional): The base URL of the API. Defaults to ``https://webexapis.com/``
+            retry_count (int, optional): The number of times to retry a request that receives a 429. Default 10.
+            max_connections (int, optional): The maximum number of simultaneous connections. Default 100.
+            rate_limiter (RateLimiter, optional): The :class:`~.ratelimit.RateLimiter` to use. Defaults to the
+                process-wide limiter shared with every :class:`~.common.WebexApi`.
+            region_map (RegionMap, optional): The :class:`~.region.RegionMap` of hosts learned from 451 responses.
+                Defaults to the process-wide map shared with every :class:`~.common.WebexApi`.
+
+        """
+        try:
+            import aiohttp
+        except ModuleNotFoundError:
+            raise ImportError(
+                "The 'aiohttp' library is not installed. "
+                "Please install it using 'pip install \"wxcadm[async]\"' "
+                "or 'pip install aiohttp'."
+            ) from None
+        self.access_token = access_token
+        self.org_id = org_id
+        self.url_base = url_base
+        self.headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        # Always include the orgId param if given an org_id
+        self.parameters = None
+        if org_id is not None:
+            self.parameters = {'orgId': org_id}
+        self.retry_count = retry_count
+        self.max_connections = max_connections
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.region_map: Optional[RegionMap] = region_map
+        # The aiohttp session must be created inside a running event loop, so it is built on first use
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _get_session(self):
+        import aiohttp
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                                  json_serialize=lambda obj: get_json_codec().dumps(obj).decode())
+        return self._session
+
+    async def close(self):
+        """ Close the underlying connection pool """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _clean_endpoint(self, url: str, url_base: Optional[str] = None) -> str:
+        # This just cleans up the URL to make sure there aren't any // other than after the https:
+        if url_base is None:
+            url_base = self.url_base
+        if url.startswith("/"):
+            url = url[1:]
+        if url_base.endswith("/"):
+            url = url_base + url
+        else:
+            url = url_base + "/" + url
+        return url
+
+    def _clean_params(self, params: Optional[dict] = None) -> dict:
+        new_params = {}
+        if self.parameters is not None:
+            new_params = self.parameters.copy()
+        if params is not None:
+            new_params.update(params)
+        # aiohttp only accepts str, int and float param values. None values are dropped, the same as requests does.
+        for key, value in list(new_params.items()):
+            if value is None:
+                del new_params[key]
+            elif isinstance(value, bool):
+                new_params[key] = str(value).lower()
+        return new_params
+
+    @staticmethod
+    async def _limiter_call(limiter: RateLimiter, func, *args):
+        # A SharedRateLimiter waits on an SQLite lock, which must not block the event loop
+        if isinstance(limiter, SharedRateLimiter):
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+        return func(*args)
+
+    @staticmethod
+    def _parse_body(body: str) -> Union[dict, list, str]:
+        try:
+            return get_json_codec().loads(body)
+        except ValueError:
+            return body
+
+    async def _request(self, method: str, url: str, params: Optional[dict] = None, payload=None,
+                       ignore_400: bool = False):
+        """ Send a single request, handling 429 and 451 responses
+
+        Returns:
+            tuple: The parsed response body and the ``next`` link URL, if any. The body is None when ``ignore_400``
+                is True and Webex returned a 400.
+
+        """
+        session = await self._get_session()
+        limiter = self.rate_limiter if self.rate_limiter is not None else get_rate_limiter()
+        regions = self.region_map if self.region_map is not None else get_region_map()
+        org_id = self.org_id or (params or {}).get('orgId')
+        url = regions.route(org_id, url)
+        try_num = 1
+        while try_num <= self.retry_count:
+            wait = await self._limiter_call(limiter, limiter.reserve)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            async with session.request(method, url, params=params, json=payload) as r:
+                log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
+                body = await r.text()
+                if r.ok:
+                    next_url = None
+                    if 'next' in r.links:
+                        next_url = str(r.links['next']['url'])
+                    return self._parse_body(body), next_url
+                log.warning("Webex API returned an error")
+                log.warning(f"\t[{r.status}] {body}")
+                if r.status == 429:
+                    retry_after = int(r.headers.get('Retry-After', 30))
+                    log.info(f"Received 429 Too Many Requests. Waiting {retry_after} seconds to retry.")
+                    await self._limiter_call(limiter, limiter.pause, retry_after)
+                    try_num += 1
+                    continue
+                elif r.status == 400 and ignore_400 is True:
+                    log.info("Ignoring 400 Error due to ignore_400=True")
+                    return None, None
+                elif r.status == 451 and method == 'GET':
+                    log.info(f"Retrying {method} in different API region")
+                    new_domain = _region_redirect_domain(self._parse_body(body))
+                    if new_domain is not None:
+                        log.info(f'Using {new_domain} as new domain')
+                        regions.learn(org_id, url, new_domain)
+                        url = url.replace(url.split('/')[2], new_domain, 1)
+                        try_num += 1
+                        continue
+                raise APIError(self._parse_body(body))
+        raise APIError(f"{method} {url} failed after {self.retry_count} attempts")
+
+    async def get(self,
+                  endpoint: str,
+                  params: Optional[dict] = None,
+                  items_key: str = 'items',
+                  kwargs: Optional[dict] = None):
+        """ Perform a GET request to the Webex API.
+
+        Args:
+            endpoint (str): The API endpoint (e.g. `/v1/people`)
+            params (dict, optional): The request parameters, in dict format
+            items_key (str, optional): The key to use for the list of entries. Defaults to 'items'.
+
+        Returns:
+            Union[dict, list]: The list of items when the response is paginated, otherwise the response dict
+
+        """
+        kwargs = kwargs or {}
+        url = self._clean_endpoint(endpoint)
+        params = self._clean_params(params)
+        start_time = time.time()
+        log.debug("Webex API Call:")
+        log.debug("\tMethod: GET")
+        log.debug("\tURL: %s", url)
+        log.debug("\tParameters: %s", params)
+        response, next_url = await self._request('GET', url, params=params,
+                                                 ignore_400=kwargs.get('ignore_400', False))
+        if not isinstance(response, dict) or items_key not in response:
+            return response
+        log.debug(f"Webex returned {len(response[items_key])} items")
+        page_number = 1
+        while next_url is not None:
+            page_number += 1
+            log.debug(f"Getting page {page_number} from {next_url}")
+            # The next URL already includes all the params from the first request
+            new_items, next_url = await self._request('GET', next_url)
+            if isinstance(new_items, dict) and items_key in new_items:
+                log.debug(f"Webex returned {len(new_items[items_key])} more items")
+                response[items_key].extend(new_items[items_key])
+        log.debug(f"GET {url} completed in {time.time() - start_time} seconds")
+        return response[items_key]
+
+    async def _write(self, method: str, endpoint: str, payload: Optional[dict] = None,
+                     params: Optional[dict] = None):
+        url = self._clean_endpoint(endpoint)
+        params = self._clean_params(params)
+        start_time = time.time()
+        log.debug("Webex API Call:")
+        log.debug(f"\tMethod: {method}")
+        log.debug("\tURL: %s", url)
+        log.debug("\tParameters: %s", params)
+        log.debug("\tPayload: %s", payload)
+        response, _ = await self._request(method, url, params=params, payload=payload)
+        log.debug(f"{method} {url} completed in {time.time() - start_time} seconds")
+        if response:
+            return response
+        return True
+
+    async def put(self, endpoint: str, payload: Optional[dict] = None, params: Optional[dict] = None):
+        """ Perform a PUT request to the Webex API.
+
+        Args:
+            endpoint (str): The API endpoint (e.g. `/v1/people`)
+            payload (dict): The payload of the request
+            params (dict, optional): The request parameters, in dict format
+
+        Returns:
+            Union[dict, bool]: The response if any was present, otherwise True for success.
+
+        """
+        return await self._write('PUT', endpoint, payload=payload, params=params)
+
+    async def post(self, endpoint: str, payload: Optional[dict] = None, params: Optional[dict] = None):
+        """ Perform a POST request to the Webex API.
+
+        Args:
+            endpoint (str): The API endpoint (e.g. `/v1/people`)
+            payload (dict, optional): The payload of the request
+            params (dict, optional): The request parameters, in dict format
+
+        Returns:
+            Union[dict, bool]: The response if any was present, otherwise True for success.
+
+        """
+        return await self._write('POST', endpoint, payload=payload, params=params)
+
+    async def patch(self, endpoint: str, payload: Optional[dict] = None, params: Optional[dict] = None):
+        """ Perform a PATCH request to the Webex API.
+
+        Args:
+            endpoint (str): The API endpoint (e.g. `/v1/people`)
+            payload (dict, optional): The payload of the request
+            params (dict, optional): The request parameters, in dict format
+
+        Returns:
+            Union[dict, bool]: The response if any was present, otherwise True for success.
+
+        """
+        return await self._write('PATCH', endpoint, payload=payload, params=params)
+
+    async def delete(self, endpoint: str, params: Optional[dict] = None):
+        """ Perform a DELETE request to the Webex API.
+
+        Args:
+            endpoint (str): The API endpoint (e.g. `/v1/people`)
+            params (dict, optional): The request parameters, in dict format
+
+        Returns:
+            Union[dict, bool]: The response if any was present, otherwise True for success.
+
+        """
+        return await self._write('DELETE', endpoint, params=params)
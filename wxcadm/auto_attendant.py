@@ -8,9 +8,11 @@ from collections import UserList
 
 import wxcadm.location
 from wxcadm import log
+from .tracing import traced
 from .common import *
 
 
+@traced
 class AutoAttendantList(UserList):
     def __init__(self, org: wxcadm.Org, location: Optional[wxcadm.Location] = None):
         super().__init__()
@@ -27,7 +29,8 @@ class AutoAttendantList(UserList):
             log.debug("Getting AutoAttendantList items for Org")
             params = None
 
-        response = self.org.api.get(f'v1/telephony/config/autoAttendants', params=params, items_key='autoAttendants')
+        response = self.org.api.get(f'v1/telephony/config/autoAttendants', params=params, items_key='autoAttendants',
+                                    parallel=True)
         items = []
         for entry in response:
             items.append(AutoAttendant(org=self.org, id=entry['id'], data=entry))
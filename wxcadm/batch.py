@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Any, Callable, Union
+
+from wxcadm import log
+
+__all__ = ['BatchResult', 'AdaptiveConcurrency']
+
+
+@dataclass
+class BatchResult:
+    """ The outcome of one request in a :meth:`WebexApi.batch() <.common.WebexApi.batch>` """
+    request: Union[tuple, Callable]
+    """ The request as it was passed to :meth:`~.common.WebexApi.batch` """
+    result: Any = None
+    """ The value returned by the request, when it succeeded """
+    error: Optional[Exception] = None
+    """ The exception raised by the request (normally an :class:`~.exceptions.APIError`), when it failed """
+
+    @property
+    def ok(self) -> bool:
+        """ True if the request succeeded """
+        return self.error is None
+
+
+class AdaptiveConcurrency:
+    def __init__(self,
+                 initial: int = 4,
+                 min_window: int = 1,
+                 max_window: int = 50,
+                 increase: float = 1.0,
+                 decrease: float = 0.5,
+                 cooldown: float = 1.0,
+                 sample_size: int = 100):
+        """ An AIMD (additive-increase/multiplicative-decrease) limit on the number of concurrent requests
+
+        When given to :class:`~.common.WebexApi` as ``concurrency``, :meth:`~.common.WebexApi.batch` and
+        :meth:`~.common.WebexApi.submit` only run :attr:`window` requests at a time. Every successful response widens the
+        window by ``increase / window``, so it grows by about ``increase`` for each window's worth of responses. A 429
+        multiplies the window by ``decrease``. The 429s that arrive within ``cooldown`` seconds of a decrease were
+        usually sent before it, so they don't shrink the window again. Over a long bulk job, the window settles near
+        the highest concurrency that the tenant allows::
+
+            api = wxcadm.WebexApi(access_token, concurrency=wxcadm.AdaptiveConcurrency(max_window=32))
+            results = api.batch(requests)
+            print(api.concurrency.window, api.concurrency.throttle_rate)
+
+        Args:
+            initial (int, optional): The starting window. Defaults to 4.
+            min_window (int, optional): The smallest the window can become. Defaults to 1.
+            max_window (int, optional): The largest the window can become, which is also the number of worker threads.
+                Defaults to 50.
+            increase (float, optional): How much the window grows for each window of successful responses.
+                Defaults to 1.
+            decrease (float, optional): The factor applied to the window on a 429. Defaults to 0.5.
+            cooldown (float, optional): The number of seconds after a decrease during which further 429s are ignored.
+                Defaults to 1.
+            sample_size (int, optional): The number of recent responses used for :attr:`throttle_rate`.
+                Defaults to 100.
+
+        """
+        self.min_window: int = min_window
+        """ The smallest allowed window """
+        self.max_window: int = max_window
+        """ The largest allowed window """
+        self.increase: float = increase
+        """ The additive increase per window of successful responses """
+        self.decrease: float = decrease
+        """ The multiplicative decrease on a 429 """
+        self.cooldown: float = cooldown
+        """ The number of seconds after a decrease during which 429s don't decrease the window again """
+        self.responses: int = 0
+        """ The total number of responses recorded """
+        self.throttled: int = 0
+        """ The total number of 429 responses recorded """
+        self._window: float = float(max(min_window, min(initial, max_window)))
+        self._in_flight: int = 0
+        self._samples: deque = deque(maxlen=sample_size)
+        self._last_decrease: float = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def window(self) -> int:
+        """ The number of requests currently allowed to run at once """
+        return int(self._window)
+
+    @property
+    def in_flight(self) -> int:
+        """ The number of requests currently running """
+        return self._in_flight
+
+    @property
+    def throttle_rate(self) -> float:
+        """ The fraction of recent responses that were 429s """
+        samples = list(self._samples)
+        if not samples:
+            return 0.0
+        return sum(samples) / len(samples)
+
+    def acquire(self) -> None:
+        """ Block until there is room in the window, then count the caller as running """
+        with self._condition:
+            while self._in_flight >= int(self._window):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """ Mark a request started with :meth:`acquire` as finished """
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record(self, throttled: bool) -> None:
+        """ Adjust the window for a response
+
+        Args:
+            throttled (bool): True if the response was a 429
+
+        """
+        with self._condition:
+            self.responses += 1
+            self._samples.append(1 if throttled else 0)
+            if throttled:
+                self.throttled += 1
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    self._window = max(float(self.min_window), self._window * self.decrease)
+                    self._last_decrease = now
+                    log.info(f"Concurrency window reduced to {self.window} after a 429")
+            else:
+                self._window = min(float(self.max_window), self._window + self.increase / self._window)
+            self._condition.notify_all()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatch
+from typing import Optional, Any
+from urllib.parse import urlparse
+
+from wxcadm import log
+
+__all__ = ['ResponseCache']
+
+
+class CacheEntry:
+    def __init__(self, path: str, value: Any, ttl: float, etag: Optional[str] = None):
+        self.path: str = path
+        """ The URL path of the cached GET, used for invalidation """
+        self.value: Any = value
+        """ The cached response """
+        self.etag: Optional[str] = etag
+        """ The ETag returned by Webex, if any, used to revalidate the entry once it expires """
+        self.expires: float = time.monotonic() + ttl
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+    def copy_value(self) -> Any:
+        # Callers are free to modify what they get back, so never hand out the cached object itself
+        return copy.deepcopy(self.value)
+
+
+class ResponseCache:
+    def __init__(self,
+                 ttl: float = 60,
+                 max_entries: int = 1024,
+                 ttls: Optional[dict] = None):
+        """ A TTL and LRU cache of GET responses for :class:`~.common.WebexApi`
+
+        Each successful GET is stored by URL and parameters for its TTL. The least-recently-used entries are dropped
+        once ``max_entries`` is reached. When an entry has expired but Webex provided an ETag, the next GET sends
+        ``If-None-Match`` and keeps the cached response if Webex answers 304 Not Modified. Any PUT, POST, PATCH or
+        DELETE evicts the cached GETs for that resource path, its parent collections and its sub-resources.
+
+        The cache is enabled by passing it to :class:`~.common.WebexApi` or :class:`~.webex.Webex`::
+
+            cache = wxcadm.ResponseCache(ttl=60, ttls={'v1/roles': 3600, 'v1/people*': 0})
+            webex = wxcadm.Webex(access_token, cache=cache)
+
+        Args:
+            ttl (float, optional): The default number of seconds to keep a response. Defaults to 60.
+            max_entries (int, optional): The maximum number of responses to keep. Defaults to 1024.
+            ttls (dict, optional): TTLs for specific endpoints, as a dict of ``{pattern: seconds}``. The pattern is
+                matched against the endpoint path (e.g. ``'v1/telephony/config/locations*'``) using shell-style
+                wildcards, and the first match wins. A TTL of 0 disables caching for matching endpoints.
+
+        """
+        self.ttl: float = ttl
+        """ The default TTL, in seconds """
+        self.max_entries: int = max_entries
+        """ The maximum number of cached responses """
+        self.ttls: dict = ttls or {}
+        """ The per-endpoint TTLs """
+        self.hits: int = 0
+        """ The number of GETs that were served from the cache """
+        self.misses: int = 0
+        """ The number of GETs that had to be sent to Webex """
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _path(url: str) -> str:
+        return urlparse(url).path.strip('/')
+
+    @staticmethod
+    def _key(url: str, params: Optional[dict] = None) -> tuple:
+        if params is None:
+            return url, ()
+        return url, tuple(sorted((str(k), str(v)) for k, v in params.items()))
+
+    def ttl_for(self, url: str) -> float:
+        """ Get the TTL that applies to a URL
+
+        Args:
+            url (str): The full URL or endpoint path
+
+        Returns:
+            float: The TTL, in seconds
+
+        """
+        path = self._path(url)
+        for pattern, ttl in self.ttls.items():
+            if fnmatch(path, pattern.strip('/')):
+                return ttl
+        return self.ttl
+
+    def get(self, url: str, params: Optional[dict] = None) -> Optional[CacheEntry]:
+        """ Get the cache entry for a GET, whether it has expired or not
+
+        Args:
+            url (str): The full URL of the request
+            params (dict, optional): The request parameters
+
+        Returns:
+            CacheEntry: The entry, or None if the request isn't cached
+
+        """
+        key = self._key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.expired:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def set(self, url: str, params: Optional[dict], value: Any, etag: Optional[str] = None) -> None:
+        """ Store a GET response
+
+        Args:
+            url (str): The full URL of the request
+            params (dict, optional): The request parameters
+            value: The response
+            etag (str, optional): The ETag header returned with the response
+
+        """
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return
+        entry = CacheEntry(self._path(url), copy.deepcopy(value), ttl, etag)
+        key = self._key(url, params)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, entry: CacheEntry) -> None:
+        """ Restart the TTL of an entry after Webex confirmed it is still current with a 304 """
+        entry.expires = time.monotonic() + self.ttl_for(entry.path)
+
+    def invalidate(self, url: str) -> int:
+        """ Evict cached GETs affected by a change to the given URL
+
+        Entries for the resource itself, its parent collections and its sub-resources are removed.
+
+        Args:
+            url (str): The full URL or endpoint path that was changed
+
+        Returns:
+            int: The number of entries that were evicted
+
+        """
+        path = self._path(url)
+        with self._lock:
+            stale = [key for key, entry in self._entries.items()
+                     if entry.path == path
+                     or path.startswith(entry.path + '/')
+                     or entry.path.startswith(path + '/')]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            log.debug(f"Evicted {len(stale)} cached responses for {path}")
+        return len(stale)
+
+    def clear(self) -> None:
+        """ Remove every cached response """
+        with self._lock:
+            self._entries.clear()
@@ -6,13 +6,14 @@ if TYPE_CHECKING:
     from wxcadm.workspace import Workspace
 
 from typing import Optional, Union
-from collections import UserList
 from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json, config
 
 import wxcadm.exceptions
 from .common import *
 from wxcadm import log
+from .tracing import traced
+from .indexed import IndexedList, casefold, spark_uuid
 
 
 @dataclass_json
@@ -164,7 +165,14 @@ class CallQueue:
     get_queue_forwarding = call_forwarding
 
 
-class CallQueueList(UserList):
+@traced
+class CallQueueList(IndexedList):
+    _indexes = {
+        'id': lambda item: item.id,
+        'name': lambda item: casefold(item.name),
+        'uuid': spark_uuid,
+        'spark_id': lambda item: item.spark_id,
+    }
     _endpoint = "v1/telephony/config/queues"
     _endpoint_items_key = "queues"
     _item_endpoint = "v1/telephony/config/locations/{location_id}/queues/{item_id}"
@@ -186,7 +194,8 @@ class CallQueueList(UserList):
             params['locationId'] = self.location.id
         else:
             params['locationId'] = None
-        response = self.org.api.get(self._endpoint, params=params, items_key=self._endpoint_items_key)
+        response = self.org.api.get(self._endpoint, params=params, items_key=self._endpoint_items_key,
+                                    parallel=True)
         items = []
         for entry in response:
             items.append(self._item_class(org=self.org, id=entry['id'], config=entry))
@@ -225,22 +234,11 @@ class CallQueueList(UserList):
         """
         if id is None and name is None and spark_id is None and uuid is None:
             raise ValueError("A search argument must be provided")
-        if id is not None:
-            for item in self.data:
-                if item.id == id:
-                    return item
-        if name is not None:
-            for item in self.data:
-                if item.name.lower() == name.lower():
-                    return item
-        if uuid is not None:
-            for item in self.data:
-                if item.spark_id.split('/')[-1].upper() == uuid.upper():
-                    return item
-        if spark_id is not None:
-            for item in self.data:
-                if item.spark_id == spark_id:
-                    return item
+        for index, key in (('id', id), ('name', casefold(name)), ('uuid', uuid and uuid.upper()),
+                           ('spark_id', spark_id)):
+            item = self._find_first((index, key))
+            if item is not None:
+                return item
         return None
 
     def create(self,
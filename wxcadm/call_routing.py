@@ -9,6 +9,7 @@ import wxcadm
 import wxcadm.location
 import wxcadm.person
 from wxcadm import log, location
+from .tracing import traced
 from .models import OutboundProxy
 
 
@@ -76,6 +77,7 @@ class CallRouting:
         return response
 
 
+@traced
 class Trunks(UserList):
     """ Trunks is a class that behaves as an array. Each item in the array is a :py:class:`Trunk` instance."""
     def __init__(self, org: wxcadm.Org):
@@ -307,6 +309,7 @@ class Trunk:
         return True
 
 
+@traced
 class RouteGroups(UserList):
     """ RouteGroups is a class that behaves as an array. Each item in the array is a :py:class:`RouteGroup` instance."""
     def __init__(self, org: wxcadm.Org):
@@ -408,6 +411,7 @@ class RouteGroup:
         return highest
 
 
+@traced
 class RouteLists(UserList):
     """ RouteLists is a class that behaves as an array. Each item in the array is a :py:class:`RouteList` instance."""
     def __init__(self, org: wxcadm.Org):
@@ -496,6 +500,7 @@ class RouteList:
         return response.json()
 
 
+@traced
 class DialPlans(UserList):
     """ DialPlans is a class that behaves as an array. Each item in the array is a :py:class:`DialPlan` instance."""
     def __init__(self, org: wxcadm.Org):
@@ -646,6 +651,7 @@ class TranslationPattern:
         return True
 
 
+@traced
 class TranslationPatternList(UserList):
     def __init__(self, org: wxcadm.Org, location: Optional[wxcadm.Location] = None):
         super().__init__()
@@ -68,5 +68,8 @@ class Calls:
 
         log.debug(f'Setting start time to {start}')
         payload = {'startTime': start, 'endTime': end}
-        response = webex_api_call('get', '/v1/cdr_feed', params=payload, domain='https://analytics.webexapis.com')
+        # The CDR feed lives on the analytics host and doesn't take an orgId, but can still use the Org's connections
+        # and the region learned for this Org
+        cdr_api = self.org.api.for_org(None, region_org=self.org.id)
+        response = cdr_api.get('https://analytics.webexapis.com/v1/cdr_feed', params=payload)
         return response
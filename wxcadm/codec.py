@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Optional, Union
+
+from wxcadm import log
+
+__all__ = ['JsonCodec', 'OrjsonCodec', 'MsgspecCodec', 'get_json_codec', 'set_json_codec']
+
+
+class JsonCodec:
+    name: str = 'json'
+    """ The name of the library used by the codec """
+
+    def __init__(self):
+        """ The JSON decoder and encoder used by :class:`~.common.WebexApi` for responses and request payloads
+
+        This codec uses the standard library :mod:`json` module. :class:`OrjsonCodec` and :class:`MsgspecCodec` are
+        much faster for large list responses, such as ``v1/people?callingData=true``, and one of them is used
+        automatically when its library is installed. To choose a codec for every :class:`~.common.WebexApi`::
+
+            wxcadm.set_json_codec(wxcadm.JsonCodec())
+
+        Any class with the same ``loads()`` and ``dumps()`` methods can be used.
+
+        """
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """ Decode a JSON document
+
+        Args:
+            data (bytes, str): The JSON document
+
+        Returns:
+            Any: The decoded value
+
+        Raises:
+            ValueError: Raised when ``data`` isn't valid JSON
+
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """ Encode a value as UTF-8 JSON
+
+        Args:
+            obj (Any): The value to encode
+
+        Returns:
+            bytes: The JSON document
+
+        """
+        return json.dumps(obj, allow_nan=False).encode('utf-8')
+
+
+class OrjsonCodec(JsonCodec):
+    name = 'orjson'
+
+    def __init__(self):
+        """ A :class:`JsonCodec` that uses the ``orjson`` library
+
+        .. note::
+            This class requires the optional ``orjson`` library, which can be installed with
+            ``pip install "wxcadm[orjson]"``.
+
+        """
+        super().__init__()
+        try:
+            import orjson
+        except ModuleNotFoundError:
+            raise ImportError(
+                "The 'orjson' library is not installed. "
+                "Please install it using 'pip install \"wxcadm[orjson]\"' "
+                "or 'pip install orjson'."
+            ) from None
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+
+class MsgspecCodec(JsonCodec):
+    name = 'msgspec'
+
+    def __init__(self):
+        """ A :class:`JsonCodec` that uses the ``msgspec`` library
+
+        .. note::
+            This class requires the optional ``msgspec`` library, which can be installed with
+            ``pip install msgspec``.
+
+        """
+        super().__init__()
+        try:
+            import msgspec
+        except ModuleNotFoundError:
+            raise ImportError(
+                "The 'msgspec' library is not installed. "
+                "Please install it using 'pip install msgspec'."
+            ) from None
+        self._json = msgspec.json
+        self._error = msgspec.DecodeError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._json.decode(data)
+        except self._error as e:
+            # msgspec's DecodeError isn't a ValueError, so make it look like every other codec's
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._json.encode(obj)
+
+
+def _best_codec() -> JsonCodec:
+    # Use the fastest codec that is installed
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return JsonCodec()
+
+
+_json_codec: Optional[JsonCodec] = None
+
+
+def get_json_codec() -> JsonCodec:
+    """ Get the process-wide :class:`JsonCodec` used by every :class:`~.common.WebexApi` without its own
+
+    Unless :func:`set_json_codec` has been called, this is an :class:`OrjsonCodec` if ``orjson`` is installed, then a
+    :class:`MsgspecCodec` if ``msgspec`` is installed, otherwise the standard library :class:`JsonCodec`.
+
+    Returns:
+        JsonCodec: The shared codec
+
+    """
+    global _json_codec
+    if _json_codec is None:
+        _json_codec = _best_codec()
+        log.debug(f"Using the {_json_codec.name} JSON codec")
+    return _json_codec
+
+
+def set_json_codec(codec: JsonCodec) -> None:
+    """ Replace the process-wide :class:`JsonCodec`
+
+    Args:
+        codec (JsonCodec): The new codec
+
+    """
+    global _json_codec
+    _json_codec = codec
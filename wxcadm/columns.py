@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from itertools import compress
+from typing import Any, Iterable, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .hydration import Hydrator
+
+__all__ = ['PeopleFrame']
+
+
+class PeopleFrame:
+    COLUMNS = ('id', 'email', 'display_name', 'first_name', 'last_name', 'location_id', 'extension', 'phone_number',
+               'status', 'login_enabled', 'license_count', 'wxc_license', 'wxc')
+    """ The names of the columns, in order """
+
+    def __init__(self, columns: Optional[dict] = None):
+        """ A column-oriented table of people, built straight from the ``v1/people`` API data
+
+        Reports that only need a few fields for every person in a large Org don't need a full
+        :class:`~.person.Person` for each of them. A PeopleFrame, which is normally created with
+        :meth:`PersonList.to_columns() <.person.PersonList.to_columns>`, holds one list per field instead, which is
+        much faster to build and much smaller in memory. Filtering and grouping work on whole columns::
+
+            people = org.people.to_columns()
+            calling = people.where(wxc=True)
+            per_location = calling.count_by('location_id')
+            no_extension = calling.filter([extension is None for extension in calling['extension']])
+
+        The columns are listed in :attr:`COLUMNS`. ``wxc_license`` is True when the person has a Webex Calling
+        license, and ``wxc`` is True when they also have a Location, the same as :attr:`.person.Person.wxc`.
+        ``phone_number`` is the person's primary phone number. :meth:`to_pandas` and :meth:`to_arrow` hand the
+        columns to pandas or Arrow when they are installed.
+
+        Args:
+            columns (dict, optional): The columns, as ``{name: list}``. Every column in :attr:`COLUMNS` that isn't
+                given is empty.
+
+        """
+        self.columns: dict = {name: [] for name in self.COLUMNS}
+        """ The columns, as ``{name: list}``. Every list has one value per person. """
+        if columns:
+            self.columns.update(columns)
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict], hydrator: Hydrator) -> PeopleFrame:
+        """ Build a PeopleFrame from ``v1/people`` items
+
+        Args:
+            items (Iterable[dict]): The people, as returned by the API. A generator of pages can be chained, so that
+                only one page is held in memory at a time.
+            hydrator (Hydrator): The Org-wide lookup tables to use
+
+        Returns:
+            PeopleFrame: The new table
+
+        """
+        frame = cls()
+        column = frame.columns
+        wxc_license_ids = hydrator.wxc_license_ids
+        for item in items:
+            licenses = item.get('licenses', [])
+            location_id = item.get('locationId', '')
+            wxc_license = not wxc_license_ids.isdisjoint(licenses)
+            column['id'].append(item['id'])
+            column['email'].append((item.get('emails') or [''])[0])
+            column['display_name'].append(item.get('displayName', ''))
+            column['first_name'].append(item.get('firstName', ''))
+            column['last_name'].append(item.get('lastName', ''))
+            column['location_id'].append(location_id)
+            column['extension'].append(item.get('extension'))
+            column['phone_number'].append(_primary_number(item.get('phoneNumbers', [])))
+            column['status'].append(item.get('status'))
+            column['login_enabled'].append(item.get('loginEnabled'))
+            column['license_count'].append(len(licenses))
+            column['wxc_license'].append(wxc_license)
+            column['wxc'].append(wxc_license and location_id != '')
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.columns['id'])
+
+    def __getitem__(self, name: str) -> list:
+        return self.columns[name]
+
+    def __repr__(self):
+        return f"<PeopleFrame {len(self)} people>"
+
+    def filter(self, mask: Sequence[bool]) -> PeopleFrame:
+        """ Get the people where ``mask`` is True
+
+        Args:
+            mask (Sequence[bool]): One value per person, such as a list built from one of the columns
+
+        Returns:
+            PeopleFrame: A new table with only the matching people
+
+        Raises:
+            ValueError: Raised when ``mask`` isn't the same length as the table
+
+        """
+        if len(mask) != len(self):
+            raise ValueError(f"The mask has {len(mask)} values but there are {len(self)} people")
+        return PeopleFrame({name: list(compress(values, mask)) for name, values in self.columns.items()})
+
+    def where(self, **values: Any) -> PeopleFrame:
+        """ Get the people whose columns equal the given values, e.g. ``where(location_id=location.id, wxc=True)``
+
+        Returns:
+            PeopleFrame: A new table with only the matching people
+
+        Raises:
+            KeyError: Raised when a column doesn't exist
+
+        """
+        mask = [True] * len(self)
+        for name, value in values.items():
+            mask = [keep and entry == value for keep, entry in zip(mask, self.columns[name])]
+        return self.filter(mask)
+
+    def group_by(self, name: str) -> dict:
+        """ Split the table by the values of one column
+
+        Args:
+            name (str): The column name, such as ``location_id``
+
+        Returns:
+            dict: A new :class:`PeopleFrame` for each value, as ``{value: PeopleFrame}``, in order of first appearance
+
+        """
+        positions: dict = {}
+        for position, value in enumerate(self.columns[name]):
+            positions.setdefault(value, []).append(position)
+        return {value: self._take(group) for value, group in positions.items()}
+
+    def count_by(self, name: str) -> dict:
+        """ Count the people with each value of one column
+
+        Args:
+            name (str): The column name, such as ``location_id``
+
+        Returns:
+            dict: The number of people with each value, as ``{value: count}``
+
+        """
+        counts: dict = {}
+        for value in self.columns[name]:
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    def _take(self, positions: list) -> PeopleFrame:
+        return PeopleFrame({name: [values[position] for position in positions]
+                            for name, values in self.columns.items()})
+
+    def to_pandas(self):
+        """ Convert the table to a :class:`pandas.DataFrame`, with one column per column of the table
+
+        .. note::
+            This method requires the optional ``pandas`` library, which can be installed with
+            ``pip install "wxcadm[pandas]"``.
+
+        Returns:
+            pandas.DataFrame: The DataFrame
+
+        """
+        try:
+            import pandas
+        except ModuleNotFoundError:
+            raise ImportError(
+                "The 'pandas' library is not installed. "
+                "Please install it using 'pip install \"wxcadm[pandas]\"' "
+                "or 'pip install pandas'."
+            ) from None
+        return pandas.DataFrame(self.columns, columns=list(self.columns))
+
+    def to_arrow(self):
+        """ Convert the table to a :class:`pyarrow.Table`, with one column per column of the table
+
+        .. note::
+            This method requires the optional ``pyarrow`` library, which can be installed with
+            ``pip install "wxcadm[arrow]"``.
+
+        Returns:
+            pyarrow.Table: The Arrow table
+
+        """
+        try:
+            import pyarrow
+        except ModuleNotFoundError:
+            raise ImportError(
+                "The 'pyarrow' library is not installed. "
+                "Please install it using 'pip install \"wxcadm[arrow]\"' "
+                "or 'pip install pyarrow'."
+            ) from None
+        return pyarrow.table(self.columns)
+
+
+def _primary_number(phone_numbers: list) -> Optional[str]:
+    # The primary phone number, or the first one if none is marked as primary
+    for number in phone_numbers:
+        if number.get('primary'):
+            return number.get('value')
+    return phone_numbers[0].get('value') if phone_numbers else None
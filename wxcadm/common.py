@@ -1,18 +1,34 @@
 from __future__ import annotations
 
 import base64
+import contextvars
+import copy
+import functools
 import logging
 import uuid
 import time
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import sys
-from typing import Optional, TYPE_CHECKING
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from urllib.parse import urlparse, parse_qsl, urlencode
+from typing import Optional, Iterator, Union, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from requests_toolbelt import MultipartEncoder
 
 from .exceptions import *
+from .ratelimit import RateLimiter, get_rate_limiter
+from .cache import ResponseCache
+from .batch import BatchResult, AdaptiveConcurrency
+from .metrics import ApiMetrics, RequestEvent, endpoint_template, get_metrics
+from .tracing import get_tracer
+from .nplusone import get_n_plus_one_detector
+from .region import RegionMap, get_region_map
+from .codec import JsonCodec, get_json_codec
+from .paging import PageSizes, get_page_sizes
 import wxcadm
 from wxcadm import log
 
@@ -24,13 +40,57 @@ _url_base = "https://webexapis.com/"
 _webex_headers = {"Authorization": "",
                   "Content-Type": "application/json",
                   "Accept": "application/json"}
+# True while the current context holds a slot in an AdaptiveConcurrency window, so that the requests it makes itself,
+# such as the pages of a parallel get() inside a batch() item, don't wait for a second slot
+_holding_window: contextvars.ContextVar = contextvars.ContextVar('wxcadm_holding_window', default=False)
+
+def _region_redirect_domain(message: dict) -> Optional[str]:
+    """ Parse the new API domain out of a 451 response body
+
+    Args:
+        message (dict): The JSON body of the 451 response
+
+    Returns:
+        str: The domain, without the scheme, that the request should be sent to. None if no domain was found.
+
+    """
+    log.debug(message.get('message'))
+    m = re.search('Please use (.*)', message.get('message', ''))
+    if not m:
+        m = re.search('URL: (.*)', message.get('message', ''))
+    if m:
+        # Added 4.6.1 to remove https if present, because there are multiple verbiages
+        # Only the host is needed, so drop any path or trailing punctuation after it
+        return m.group(1).replace("https://", "").strip().split('/')[0].rstrip('.')
+    return None
+
+
+class _InflightGet:
+    # Tracks a GET that is in progress so identical GETs from other threads can wait for its result
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters: int = 0
+        self.result = None
+        self.error: Optional[BaseException] = None
+
 
 class WebexApi:
     def __init__(self,
                  access_token: str,
                  org_id: Optional[str] = None,
                  url_base: str = "https://webexapis.com/",
-                 retry_count: int = 10):
+                 retry_count: int = 10,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = None,
+                 max_workers: int = 10,
+                 concurrency: Optional[AdaptiveConcurrency] = None,
+                 metrics: Optional[ApiMetrics] = None,
+                 region_map: Optional[RegionMap] = None,
+                 json_codec: Optional[JsonCodec] = None,
+                 page_sizes: Optional[PageSizes] = None,
+                 session: Optional[requests.Session] = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: Optional[int] = None):
         self.access_token = access_token
         self.org_id = org_id
         self.url_base = url_base
@@ -44,11 +104,186 @@ class WebexApi:
         if org_id is not None:
             self.parameters = {'orgId': org_id}
         self.retry_count = retry_count
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # When no RateLimiter is given, the process-wide limiter is used so all instances share one budget
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        # GET responses are only cached when a ResponseCache is provided
+        self.cache: Optional[ResponseCache] = cache
+        # Identical GETs that are already in flight, keyed by URL, params and items_key
+        self._inflight: dict = {}
+        self._inflight_lock = threading.Lock()
+        # The worker pool for submit() is only started if it is used
+        self.max_workers: int = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # When an AdaptiveConcurrency is given, it decides how many of those workers may run at once
+        self.concurrency: Optional[AdaptiveConcurrency] = concurrency
+        # When no ApiMetrics is given, requests are recorded in the process-wide metrics
+        self.metrics: Optional[ApiMetrics] = metrics
+        # When no RegionMap is given, the process-wide map of hosts learned from 451 responses is used
+        self.region_map: Optional[RegionMap] = region_map
+        # When no JsonCodec is given, the process-wide codec (orjson or msgspec if installed) is used
+        self.json_codec: Optional[JsonCodec] = json_codec
+        # When no PageSizes is given, the process-wide page sizes are used for GETs that don't send their own max
+        self.page_sizes: Optional[PageSizes] = page_sizes
+        # The Org whose learned regions are used when a request has no orgId, such as the CDR feed. Set by for_org().
+        self.region_org: Optional[str] = None
+        # The endpoint templates whose page size Webex rejected. This instance doesn't send a page size for them again.
+        self._rejected_page_sizes: set = set()
+        # The last request on each thread that failed with a 429 or 5xx, so the next send of it counts as a retry
+        self._local = threading.local()
+        # A Session passed in is shared with another instance, which has already set it up
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            # One pool of keep-alive connections per host (up to pool_connections hosts), shared with every instance
+            # made by for_org(). Keep enough connections for every worker thread, or they'd be closed after each request.
+            if pool_maxsize is None:
+                pool_maxsize = max(10, self._pool_size)
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self.session = session
+
+    def for_org(self, org_id: Optional[str], params: Optional[dict] = None,
+                region_org: Optional[str] = None) -> WebexApi:
+        """ Get a WebexApi for another Org that shares this instance's connection pool and settings
+
+        The new instance sends ``orgId=org_id`` with every request, but reuses this instance's Session, so requests for
+        many Orgs (e.g. a partner working through its customers) reuse the same warm connections.
+
+        Args:
+            org_id (str): The Org ID to send with every request, or None to not send one
+            params (dict, optional): Other params to send with every request for the Org
+            region_org (str, optional): The Org whose regional hosts, learned from 451 responses, are used when
+                ``org_id`` is None. This is for APIs that don't take an ``orgId``, such as the CDR feed, so that each
+                Org keeps its own region.
+
+        Returns:
+            WebexApi: The new instance
+
+        """
+        api = WebexApi(self.access_token, org_id=org_id, url_base=self.url_base, retry_count=self.retry_count,
+                       rate_limiter=self.rate_limiter, cache=self.cache, max_workers=self.max_workers,
+                       concurrency=self.concurrency, metrics=self.metrics, region_map=self.region_map,
+                       json_codec=self.json_codec, page_sizes=self.page_sizes, session=self.session)
+        if params:
+            api.parameters = {**(api.parameters or {}), **params}
+        api.region_org = region_org
+        return api
+
+    @property
+    def limiter(self) -> RateLimiter:
+        """ The :class:`~.ratelimit.RateLimiter` that this instance uses """
+        if self.rate_limiter is not None:
+            return self.rate_limiter
+        return get_rate_limiter()
+
+    @property
+    def regions(self) -> RegionMap:
+        """ The :class:`~.region.RegionMap` that this instance uses """
+        if self.region_map is not None:
+            return self.region_map
+        return get_region_map()
+
+    @property
+    def codec(self) -> JsonCodec:
+        """ The :class:`~.codec.JsonCodec` that this instance uses """
+        if self.json_codec is not None:
+            return self.json_codec
+        return get_json_codec()
+
+    @property
+    def paging(self) -> PageSizes:
+        """ The :class:`~.paging.PageSizes` that this instance uses """
+        if self.page_sizes is not None:
+            return self.page_sizes
+        return get_page_sizes()
+
+    def _apply_page_size(self, url: str, params: dict) -> dict:
+        # Add the page size for a URL to its params, unless Webex has rejected it for this instance
+        if endpoint_template(url) in self._rejected_page_sizes:
+            return params
+        return self.paging.apply(url, params)
+
+    def _reject_page_size(self, url: str, params: Optional[dict], r: requests.Response) -> bool:
+        # Remove the page size from the params of a GET that received a 400 because of it
+        if params is None or not self.paging.reject(url, params, r.text):
+            return False
+        template = endpoint_template(url)
+        log.warning(f"Webex rejected the page size for {template}. Not sending a page size for it again.")
+        self._rejected_page_sizes.add(template)
+        return True
+
+    def _json(self, r: requests.Response):
+        # Decode a response with the codec, raising the same error as Response.json() so callers can catch it
+        try:
+            return self.codec.loads(r.content)
+        except ValueError as e:
+            raise requests.exceptions.JSONDecodeError(str(e), r.text, 0) from e
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        # Every request goes through here so the rate limiter and metrics see all traffic
+        regions = self.regions
+        org_id = self.org_id or (kwargs.get('params') or {}).get('orgId') or self.region_org
+        url = regions.route(org_id, url)
+        detector = get_n_plus_one_detector()
+        if detector is not None:
+            detector.record(method, url, kwargs.get('params'))
+        if 'json' in kwargs:
+            # Encode the payload with the codec instead of letting requests use the json module
+            payload = kwargs.pop('json')
+            if payload is not None:
+                kwargs['data'] = self.codec.dumps(payload)
+        limiter = self.limiter
+        limiter.acquire()
+        start = time.perf_counter()
+        r = self.session.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - start
+        metrics = self.metrics if self.metrics is not None else get_metrics()
+        if metrics is not None:
+            self._record(metrics, method, url, kwargs.get('params'), r, elapsed)
+        tracer = get_tracer()
+        if tracer is not None:
+            tracer.record_request(method, url, r.status_code, r.headers.get('Trackingid'), start, start + elapsed)
+        if self.concurrency is not None:
+            self.concurrency.record(r.status_code == 429)
+        if r.status_code == 429:
+            limiter.pause(int(r.headers.get('Retry-After', 30)))
+        elif r.status_code == 451:
+            new_domain = self._redirect_domain(r)
+            if new_domain is not None:
+                # Later requests for this Org and endpoint family go straight to the right region
+                regions.learn(org_id, url, new_domain)
+        elif method != 'GET' and self.cache is not None:
+            # Any change to a resource makes the cached GETs for it stale
+            self.cache.invalidate(url)
+        return r
+
+    def _redirect_domain(self, r: requests.Response) -> Optional[str]:
+        # _send and the GET retry loops both need the domain from a 451, so the body is only decoded once
+        if not hasattr(r, '_redirect_domain'):
+            try:
+                r._redirect_domain = _region_redirect_domain(self._json(r))
+            except (requests.exceptions.JSONDecodeError, AttributeError):
+                r._redirect_domain = None
+        return r._redirect_domain
+
+    def _record(self, metrics: ApiMetrics, method: str, url: str, params: Optional[dict],
+                r: requests.Response, elapsed: float) -> None:
+        failed = r.status_code == 429 or r.status_code >= 500
+        retry = getattr(self._local, 'failed', None) == (method, url, str(params))
+        self._local.failed = (method, url, str(params)) if failed else None
+        # Later pages are requested with the cursor or start param Webex put in the "next" link
+        page = method == 'GET' and r.ok and ('next' in r.links or any(
+            f'{key}=' in url or (params is not None and key in params) for key in ('cursor', 'start')))
+        metrics.record(RequestEvent(method=method, url=url, template=endpoint_template(url), status=r.status_code,
+                                    elapsed=elapsed, bytes=len(r.content), retry=retry, page=page))
 
     def _clean_endpoint(self, url: str) -> str:
         # This just cleans up the URL to make sure there aren't any // other than after the https:
+        if url.startswith("https://") or url.startswith("http://"):
+            # A full URL is used for APIs on other hosts, such as https://analytics.webexapis.com
+            return url
         if url.startswith("/"):
             url = url[1:]
         if self.url_base.endswith("/"):
@@ -69,13 +304,23 @@ class WebexApi:
             endpoint: str,
             params: Optional[dict] = None,
             items_key: str = 'items',
-            kwargs: Optional[dict] = None,):
+            kwargs: Optional[dict] = None,
+            parallel: bool = False):
         """ Perform a GET request to the webex API.
 
+        If an identical GET (same URL, parameters and ``items_key``) is already in progress on another thread, this
+        call waits for that request to finish and returns a copy of its response instead of sending its own.
+
+        When ``params`` has no ``max``, the largest page size the endpoint allows is requested (see
+        :class:`~.paging.PageSizes`), so collections are retrieved in as few pages as possible.
+
         Args:
             endpoint (str): The API endpoint (e.g. `/v1/people`)
             params (dict, optional): The request parameters, in dict format
             items_key (str, optional): The key to use for the list of entries. Defaults to 'items'.
+            parallel (bool, optional): For endpoints that paginate with ``start`` and ``max``, such as most
+                ``v1/telephony/config`` lists, request the pages after the first several at a time instead of
+                following the ``next`` links one by one. Defaults to False.
 
         Returns:
 
@@ -84,6 +329,152 @@ class WebexApi:
         url = self._clean_endpoint(endpoint)
         # Clean the parameters to include any at the instance level
         params = self._clean_params(params)
+        if kwargs is None:
+            kwargs = {}
+        if not kwargs.get('ignore_400', False):
+            # Ask for the largest page the endpoint allows, unless the caller chose a max
+            params = self._apply_page_size(url, params)
+        key = (url, tuple(sorted((str(k), str(v)) for k, v in params.items())), items_key,
+               bool(kwargs.get('ignore_400', False)))
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            if call is None:
+                call = _InflightGet()
+                self._inflight[key] = call
+                leader = True
+            else:
+                call.waiters += 1
+                leader = False
+        if leader is False:
+            log.debug(f"GET {url} is already in flight. Waiting for that response.")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            response = self._get(url, params, items_key, kwargs, parallel=parallel)
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            return response
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            if call.waiters > 0 and call.error is None:
+                # The caller is free to change the response, so the waiters get their own copies of a snapshot
+                call.result = copy.deepcopy(response)
+            call.done.set()
+
+    def _call(self, request: Union[tuple, Callable]):
+        # Run one request from submit() or batch()
+        if callable(request):
+            return request()
+        method, endpoint, *rest = request
+        params = rest[0] if len(rest) > 0 else None
+        payload = rest[1] if len(rest) > 1 else None
+        method = method.lower()
+        if method == 'get':
+            return self.get(endpoint, params=params)
+        elif method in ['put', 'post', 'patch']:
+            return getattr(self, method)(endpoint, payload=payload, params=params)
+        elif method == 'delete':
+            return self.delete(endpoint, params=params)
+        raise ValueError(f"Unsupported method: {method}")
+
+    def _gated_call(self, request: Union[tuple, Callable]):
+        # Wait for room in the AdaptiveConcurrency window, if there is one, before running the request
+        if self.concurrency is None or _holding_window.get():
+            return self._call(request)
+        self.concurrency.acquire()
+        token = _holding_window.set(True)
+        try:
+            return self._call(request)
+        finally:
+            _holding_window.reset(token)
+            self.concurrency.release()
+
+    @property
+    def _pool_size(self) -> int:
+        if self.concurrency is not None:
+            return self.concurrency.max_window
+        return self.max_workers
+
+    def submit(self,
+               method: str,
+               endpoint: str,
+               params: Optional[dict] = None,
+               payload: Optional[dict] = None) -> Future:
+        """ Start a request on the worker pool and return a :class:`~concurrent.futures.Future` for its result
+
+        The pool has :attr:`max_workers` threads and is shared by every call to :meth:`submit` on this instance. When
+        the instance has an :class:`~.batch.AdaptiveConcurrency`, its window limits how many requests run at once.
+
+        Args:
+            method (str): The HTTP method, e.g. ``'get'`` or ``'put'``
+            endpoint (str): The API endpoint (e.g. `/v1/people`)
+            params (dict, optional): The request parameters, in dict format
+            payload (dict, optional): The payload of the request
+
+        Returns:
+            Future: The Future, whose ``result()`` is the return value of the matching method or raises its exception
+
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._pool_size,
+                                                    thread_name_prefix='wxcadm-api')
+        # Run in a copy of the caller's context so any tracing span carries over to the worker thread
+        return self._executor.submit(contextvars.copy_context().run, self._gated_call,
+                                     (method, endpoint, params, payload))
+
+    def batch(self, requests: list, max_workers: Optional[int] = None) -> list[BatchResult]:
+        """ Run a list of requests concurrently and return their results in the same order
+
+        Each request is a tuple of ``(method, endpoint, params, payload)``, where ``params`` and ``payload`` may be
+        left off, or any callable that takes no arguments, which allows higher-level methods to be batched too. For
+        example::
+
+            results = org.api.batch([
+                ('get', f'v1/people/{person.id}'),
+                ('put', f'v1/people/{person.id}/features/voicemail', None, vm_config),
+                functools.partial(workspace.set_ecbn, 'location'),
+            ])
+            failed = [result for result in results if not result.ok]
+
+        A failure doesn't stop the other requests. Instead, the exception is stored in that request's
+        :class:`~.batch.BatchResult`.
+
+        When the instance has an :class:`~.batch.AdaptiveConcurrency` and ``max_workers`` isn't given, the number of
+        requests running at once follows its window.
+
+        Args:
+            requests (list): The requests to run
+            max_workers (int, optional): A fixed number of requests to run at once. Defaults to :attr:`max_workers`.
+
+        Returns:
+            list[BatchResult]: One :class:`~.batch.BatchResult` for each request, in the same order as ``requests``
+
+        """
+        results = [BatchResult(request=request) for request in requests]
+
+        def run(result: BatchResult):
+            try:
+                if max_workers is None:
+                    result.result = self._gated_call(result.request)
+                else:
+                    result.result = self._call(result.request)
+            except Exception as e:
+                log.warning(f"Batch request {result.request} failed: {e}")
+                result.error = e
+
+        with ThreadPoolExecutor(max_workers=max_workers or self._pool_size,
+                                thread_name_prefix='wxcadm-batch') as executor:
+            contexts = [contextvars.copy_context() for _ in results]
+            list(executor.map(lambda context, result: context.run(run, result), contexts, results))
+        return results
+
+    def _get(self, url: str, params: dict, items_key: str, kwargs: dict, parallel: bool = False):
         page_number = 1
         start_time = time.time()
         try_num = 1
@@ -91,15 +482,32 @@ class WebexApi:
         log.debug("\tMethod: GET")
         log.debug("\tURL: %s", url)
         log.debug("\tParameters: %s", params)
+        request_headers = None
+        cached = None
+        if self.cache is not None:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                if not cached.expired:
+                    log.debug(f"GET {url} served from cache")
+                    return cached.copy_value()
+                if cached.etag is not None:
+                    request_headers = {'If-None-Match': cached.etag}
         keep_trying = True
+        followed_next = False
         while try_num <= self.retry_count and keep_trying is True:
-            r = self.session.get(url, params=params)
+            r = self._send('GET', url, params=params, headers=request_headers)
             log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
+            if r.status_code == 304 and cached is not None:
+                log.debug(f"GET {url} not modified. Using cached response.")
+                self.cache.refresh(cached)
+                return cached.copy_value()
             if r.ok:
-                response = r.json()
+                response = self._json(r)
                 if items_key in response:
                     log.debug(f"Webex returned {len(response[items_key])} items")
                 else:
+                    if self.cache is not None:
+                        self.cache.set(url, params, response, etag=r.headers.get('ETag'))
                     return response
             else:
                 log.warning("Webex API returned an error")
@@ -108,32 +516,36 @@ class WebexApi:
                 if r.status_code == 429:
                     retry_after = int(r.headers.get('Retry-After', 30))
                     log.info(f"Received 429 Too Many Requests. Waiting {retry_after} seconds to retry.")
-                    time.sleep(retry_after)
+                    try_num += 1
+                    continue
+                elif r.status_code == 400 and self._reject_page_size(url, params, r):
+                    log.info("Retrying GET without a page size")
                     try_num += 1
                     continue
                 elif r.status_code == 400 and kwargs.get('ignore_400', False) is True:
                     log.info("Ignoring 400 Error due to ignore_400=True")
                     return None
                 # The following was added to handle cross-region analytics and CDR
-                elif r.status_code == 451:
-                    log.info("Retrying GET in different API region")
-                    message = r.json()
-                    log.debug(message['message'])
-                    m = re.search('Please use (.*)', message['message'])
-                    if not m:
-                        m = re.search('URL: (.*)', message['message'])
-                    if m:
-                        new_domain = m.group(1)
-                        # Added 4.6.1 to remove https if present, because there are multiple verbiages
-                        new_domain = new_domain.replace("https://", "")
-                        log.info(f'Using {new_domain} as new domain')
-                        url_base = f'https://{new_domain}'
-                        continue
+                new_domain = self._redirect_domain(r) if r.status_code == 451 else None
+                if new_domain is not None:
+                    # _send has learned the new region, so the retry goes straight to it
+                    log.info(f"Retrying GET in the {new_domain} API region")
+                    try_num += 1
+                    continue
                 else:
                     try:
-                        raise APIError(r.json())
+                        raise APIError(self._json(r))
                     except requests.exceptions.JSONDecodeError:
                         raise APIError(r.text)
+            if "next" in r.links:
+                followed_next = True
+            if "next" in r.links and parallel is True:
+                remaining = self._get_offset_pages(r.links['next']['url'], items_key, len(response[items_key]))
+                if remaining is not None:
+                    response[items_key].extend(remaining)
+                    page_number += 1
+                    keep_trying = False
+                    continue
             if "next" in r.links:
                 keep_going = True
                 next_url = r.links['next']['url']
@@ -142,11 +554,11 @@ class WebexApi:
                     log.debug(f"Getting more items from {next_url}")
                     page_number += 1
                     log.debug(f"Page number: {page_number}")
-                    r = self.session.get(next_url)
+                    r = self._send('GET', next_url)
                     log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
                     log.debug(f"\tResponse Headers: {r.headers}")
                     if r.ok:
-                        new_items = r.json()
+                        new_items = self._json(r)
                         if items_key not in new_items:
                             continue  # This is here just to handle a weird case where the API responded with no data
                         log.debug(f"Webex returned {len(new_items[items_key])} more items")
@@ -162,7 +574,6 @@ class WebexApi:
                         if r.status_code == 429:
                             retry_after = int(r.headers.get('Retry-After', 30))
                             log.info(f"Received 429 Too Many Requests. Waiting {retry_after} seconds to retry.")
-                            time.sleep(retry_after)
                             continue
                         else:
                             keep_going = False
@@ -170,8 +581,207 @@ class WebexApi:
                 try_num = self.retry_count + 1
         end_time = time.time()
         log.debug(f"GET {url} completed in {end_time - start_time} seconds")
+        if self.cache is not None:
+            # Multi-page responses are cached too, but no single page's ETag covers the whole list
+            etag = None if followed_next else r.headers.get('ETag')
+            self.cache.set(url, params, response[items_key], etag=etag)
         return response[items_key]
 
+    def _get_offset_pages(self, next_url: str, items_key: str, first_page_length: int) -> Optional[list]:
+        """ Get the rest of a collection that paginates with ``start`` and ``max``, several pages at a time
+
+        Webex doesn't say how many items there are, so the pages are requested in rounds that start at two pages and
+        double up to the worker pool size, until a page comes back without a ``next`` link. The pages that are
+        requested past the end are discarded.
+
+        The offsets are only right when every page is full, so nothing is requested in parallel unless the first page
+        had exactly ``max`` items. If a later page is short but still has a ``next`` link, the rest of the collection
+        is fetched by following the ``next`` links one at a time.
+
+        Args:
+            next_url (str): The ``next`` link of the first page
+            items_key (str): The key of the list of items
+            first_page_length (int): The number of items on the first page
+
+        Returns:
+            list: The items from every page after the first, in order, or None if ``next_url`` doesn't use ``start``
+                and ``max`` or the first page wasn't full
+
+        """
+        parsed = urlparse(next_url)
+        query = dict(parse_qsl(parsed.query, keep_blank_values=True))
+        try:
+            start = int(query['start'])
+            page_size = int(query['max'])
+        except (KeyError, ValueError):
+            return None
+        if page_size <= 0 or first_page_length != page_size:
+            return None
+
+        def page_url(page_start: int) -> str:
+            return parsed._replace(query=urlencode({**query, 'start': page_start})).geturl()
+
+        items = []
+        window = 2
+        max_window = max(2, self._pool_size)
+        with ThreadPoolExecutor(max_workers=max_window, thread_name_prefix='wxcadm-pages') as executor:
+            while True:
+                log.debug(f"Getting {window} pages of {page_size} items from start={start}")
+                futures = [executor.submit(contextvars.copy_context().run, self._gated_call,
+                                           functools.partial(self._get_page, page_url(start + i * page_size)))
+                           for i in range(window)]
+                follow_url = None
+                finished = False
+                for future in futures:
+                    if finished:
+                        # A page past the end. It is cancelled if it hasn't started, and its result is ignored.
+                        future.cancel()
+                        continue
+                    r = future.result()
+                    page = self._json(r).get(items_key, [])
+                    items.extend(page)
+                    if 'next' not in r.links:
+                        finished = True
+                    elif len(page) != page_size:
+                        # The offsets of the later pages can't be trusted, so follow the links from here
+                        log.debug(f"Webex returned {len(page)} of {page_size} items. Following next links instead.")
+                        follow_url = r.links['next']['url']
+                        finished = True
+                if follow_url is not None:
+                    items.extend(self._follow_next_pages(follow_url, items_key))
+                if finished:
+                    return items
+                start += window * page_size
+                window = min(window * 2, max_window)
+
+    def _follow_next_pages(self, next_url: str, items_key: str) -> list:
+        # The items from a page and every page after it, following the next links one at a time
+        items = []
+        while next_url is not None:
+            r = self._get_page(next_url)
+            items.extend(self._json(r).get(items_key, []))
+            next_url = r.links.get('next', {}).get('url')
+        return items
+
+    def _get_page(self, url: str, params: Optional[dict] = None) -> requests.Response:
+        """ GET a single page, retrying on 429 and following a 451 to the correct region
+
+        Returns:
+            requests.Response: The successful response
+
+        Raises:
+            wxcadm.exceptions.APIError: Raised when Webex returns an error or the retries are exhausted
+
+        """
+        try_num = 1
+        while try_num <= self.retry_count:
+            r = self._send('GET', url, params=params)
+            log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
+            if r.ok:
+                return r
+            log.warning("Webex API returned an error")
+            log.warning(f"\t[{r.status_code}] {r.text}")
+            try_num += 1
+            if r.status_code == 429:
+                retry_after = int(r.headers.get('Retry-After', 30))
+                log.info(f"Received 429 Too Many Requests. Waiting {retry_after} seconds to retry.")
+                continue
+            elif r.status_code == 400 and self._reject_page_size(url, params, r):
+                log.info("Retrying GET without a page size")
+                continue
+            new_domain = self._redirect_domain(r) if r.status_code == 451 else None
+            if new_domain is not None:
+                # _send has learned the new region, so the retry goes straight to it
+                log.info(f"Retrying GET in the {new_domain} API region")
+                continue
+            try:
+                raise APIError(self._json(r))
+            except requests.exceptions.JSONDecodeError:
+                raise APIError(r.text)
+        raise APIError(f"GET {url} failed after {self.retry_count} attempts")
+
+    def iter_pages(self,
+                   endpoint: str,
+                   params: Optional[dict] = None,
+                   items_key: str = 'items',
+                   prefetch: bool = True) -> Iterator[list]:
+        """ Perform a GET request to the Webex API and yield each page of items as it arrives.
+
+        Unlike :meth:`get`, which collects every page before returning, this generator only holds one page (two when
+        ``prefetch`` is True) in memory at a time, so very large collections can be processed with bounded memory.
+        When ``prefetch`` is True, the next page is requested in the background while the caller works on the
+        current page.
+
+        If the response does not contain ``items_key``, the response itself is yielded as the only item of a single
+        page.
+
+        The pages are never served from or stored in the :class:`~.cache.ResponseCache`, and an identical GET in
+        progress on another thread isn't shared, because only one page is held at a time. Use :meth:`get` when the
+        whole collection is needed anyway.
+
+        Args:
+            endpoint (str): The API endpoint (e.g. `/v1/people`)
+            params (dict, optional): The request parameters, in dict format
+            items_key (str, optional): The key to use for the list of entries. Defaults to 'items'.
+            prefetch (bool, optional): Whether to download the next page while the current page is processed.
+                Defaults to True.
+
+        Yields:
+            list: The items from each page
+
+        """
+        url = self._clean_endpoint(endpoint)
+        params = self._apply_page_size(url, self._clean_params(params))
+        start_time = time.time()
+        log.debug("Webex API Call:")
+        log.debug("\tMethod: GET (paged)")
+        log.debug("\tURL: %s", url)
+        log.debug("\tParameters: %s", params)
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            r = self._get_page(url, params=params)
+            page_number = 1
+            while r is not None:
+                response = self._json(r)
+                next_url = r.links.get('next', {}).get('url')
+                next_page = None
+                if next_url is not None and executor is not None:
+                    next_page = executor.submit(contextvars.copy_context().run, self._get_page, next_url)
+                if items_key in response:
+                    log.debug(f"Webex returned {len(response[items_key])} items on page {page_number}")
+                    yield response[items_key]
+                elif page_number == 1:
+                    yield [response]
+                del response
+                if next_url is None:
+                    r = None
+                elif next_page is not None:
+                    r = next_page.result()
+                else:
+                    r = self._get_page(next_url)
+                page_number += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        log.debug(f"GET {url} completed in {time.time() - start_time} seconds")
+
+    def iter_items(self,
+                   endpoint: str,
+                   params: Optional[dict] = None,
+                   items_key: str = 'items',
+                   prefetch: bool = True) -> Iterator[dict]:
+        """ Perform a GET request to the Webex API and yield each item as its page arrives.
+
+        This is the item-level version of :meth:`iter_pages` and accepts the same arguments. Like
+        :meth:`iter_pages`, it doesn't use the :class:`~.cache.ResponseCache`.
+
+        Yields:
+            dict: Each item returned by the API
+
+        """
+        for page in self.iter_pages(endpoint, params=params, items_key=items_key, prefetch=prefetch):
+            yield from page
+
     def put(self, endpoint: str,
             payload: Optional[dict] = None,
             params: Optional[dict] = None):
@@ -198,11 +808,11 @@ class WebexApi:
         log.debug("\tParameters: %s", params)
         log.debug("\tPayload: %s", payload)
         while try_num <= self.retry_count:
-            r = self.session.put(url, json=payload, params=params)
+            r = self._send('PUT', url, json=payload, params=params)
             log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
             if r.ok:
                 try:
-                    response = r.json()
+                    response = self._json(r)
                 except requests.exceptions.JSONDecodeError:
                     response = r.text
                 if response:
@@ -219,12 +829,11 @@ class WebexApi:
                 if r.status_code == 429:
                     retry_after = int(r.headers.get('Retry-After', 30))
                     log.info(f"Received 429 Too Many Requests. Waiting {retry_after} seconds to retry.")
-                    time.sleep(retry_after)
                     try_num += 1
                     continue
                 else:
                     try:
-                        raise APIError(r.json())
+                        raise APIError(self._json(r))
                     except requests.exceptions.JSONDecodeError:
                         raise APIError(r.text)
         return False
@@ -235,7 +844,8 @@ class WebexApi:
                    params: Optional[dict] = None):
         """ Perform a PUT request to the webex API that uploads a file.
 
-        This is a special PUT that handles a file. The payload must be in a specific format
+        This is a special PUT that handles a file. The payload must be in a specific format. The file is streamed to
+        Webex in chunks over the same pooled connections as every other request.
 
         Args:
             endpoint (str): The API endpoint (e.g. `/v1/people`)
@@ -246,45 +856,36 @@ class WebexApi:
             Union[dict, bool]: The response if any was present, otherwise True for success.
 
         """
+        return self._upload('PUT', endpoint, payload, params)
+
+    def _upload(self, method: str, endpoint: str, payload: MultipartEncoder, params: Optional[dict] = None):
         # Clean the endpoint to get a good URL
         url = self._clean_endpoint(endpoint)
         # Clean the parameters to include any at the instance level
         params = self._clean_params(params)
         start_time = time.time()
         log.debug("Webex API Call:")
-        log.debug("\tMethod: PUT")
+        log.debug(f"\tMethod: {method}")
         log.debug("\tURL: %s", url)
         log.debug("\tParameters: %s", params)
         log.debug("\tPayload: %s", payload)
-        # Since we are changing HTTP Headers for this type of call, just use a new session
-        session = requests.Session()
-        session.headers.update({
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": payload.content_type,
-            "Accept": "application/json",
-        })
-        r = session.put(url, json=payload, params=params)
+        # Passing the encoder as the data streams it rather than reading the whole file into memory. Only the
+        # Content-Type changes for this request, so the pooled session can still be used.
+        r = self._send(method, url, data=payload, params=params, headers={"Content-Type": payload.content_type})
         log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
         log.debug(f"Response Headers: {r.headers}")
         if r.ok:
+            end_time = time.time()
+            log.debug(f"{method} {url} completed in {end_time - start_time} seconds")
             try:
-                response = r.json()
+                return self._json(r)
             except requests.exceptions.JSONDecodeError:
-                end_time = time.time()
-                log.debug(f"PUT {url} completed in {end_time - start_time} seconds")
-                session.close()
                 return True
-            else:
-                end_time = time.time()
-                log.debug(f"PUT {url} completed in {end_time - start_time} seconds")
-                session.close()
-                return response
         else:
             log.warning("Webex API returned an error")
             log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
-            session.close()
             try:
-                raise APIError(r.json())
+                raise APIError(self._json(r))
             except requests.exceptions.JSONDecodeError:
                 raise APIError(r.text)
 
@@ -315,11 +916,11 @@ class WebexApi:
         log.debug("\tPayload: %s", payload)
         try_num = 1
         while try_num <= self.retry_count:
-            r = self.session.post(url, json=payload, params=params)
+            r = self._send('POST', url, json=payload, params=params)
             log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
             if r.ok:
                 try:
-                    response = r.json()
+                    response = self._json(r)
                     log.debug(f"Response: {response}")
                 except requests.exceptions.JSONDecodeError:
                     end_time = time.time()
@@ -335,12 +936,11 @@ class WebexApi:
                 if r.status_code == 429:
                     retry_after = int(r.headers.get('Retry-After', 30))
                     log.info(f"Received 429 Too Many Requests. Waiting {retry_after} seconds to retry.")
-                    time.sleep(retry_after)
                     try_num += 1
                     continue
                 else:
                     try:
-                        raise APIError(r.json())
+                        raise APIError(self._json(r))
                     except requests.exceptions.JSONDecodeError:
                         raise APIError(r.text)
         return False
@@ -351,7 +951,8 @@ class WebexApi:
                    params: Optional[dict] = None):
         """ Perform a POST request to the webex API that uploads a file.
 
-        This is a special POST that handles a file. The payload must be in a specific format
+        This is a special POST that handles a file. The payload must be in a specific format. The file is streamed to
+        Webex in chunks over the same pooled connections as every other request.
 
         Args:
             endpoint (str): The API endpoint (e.g. `/v1/people`)
@@ -362,47 +963,7 @@ class WebexApi:
             Union[dict, bool]: The response if any was present, otherwise True for success.
 
         """
-        # Clean the endpoint to get a good URL
-        url = self._clean_endpoint(endpoint)
-        # Clean the parameters to include any at the instance level
-        params = self._clean_params(params)
-        start_time = time.time()
-        log.debug("Webex API Call:")
-        log.debug("\tMethod: POST")
-        log.debug("\tURL: %s", url)
-        log.debug("\tParameters: %s", params)
-        log.debug("\tPayload: %s", payload)
-        # Since we are changing HTTP Headers for this type of call, just use a new session
-        session = requests.Session()
-        session.headers.update({
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": payload.content_type,
-            "Accept": "application/json",
-        })
-        r = session.post(url, json=payload, params=params)
-        log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
-        log.debug(f"Response Headers: {r.headers}")
-        if r.ok:
-            try:
-                response = r.json()
-            except requests.exceptions.JSONDecodeError:
-                end_time = time.time()
-                log.debug(f"POST {url} completed in {end_time - start_time} seconds")
-                session.close()
-                return True
-            else:
-                end_time = time.time()
-                log.debug(f"POST {url} completed in {end_time - start_time} seconds")
-                session.close()
-                return response
-        else:
-            log.warning("Webex API returned an error")
-            log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
-            session.close()
-            try:
-                raise APIError(r.json())
-            except requests.exceptions.JSONDecodeError:
-                raise APIError(r.text)
+        return self._upload('POST', endpoint, payload, params)
 
     def delete(self,
                endpoint: str,
@@ -428,11 +989,11 @@ class WebexApi:
         log.debug("\tParameters: %s", params)
         try_num = 1
         while try_num <= self.retry_count:
-            r = self.session.delete(url, params=params)
+            r = self._send('DELETE', url, params=params)
             log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
             if r.ok:
                 try:
-                    response = r.json()
+                    response = self._json(r)
                     log.debug(f'Response: {response}')
                 except requests.exceptions.JSONDecodeError:
                     end_time = time.time()
@@ -448,12 +1009,11 @@ class WebexApi:
                 if r.status_code == 429:
                     retry_after = int(r.headers.get('Retry-After', 30))
                     log.info(f"Received 429 Too Many Requests. Waiting {retry_after} seconds to retry.")
-                    time.sleep(retry_after)
                     try_num += 1
                     continue
                 else:
                     try:
-                        raise APIError(r.json())
+                        raise APIError(self._json(r))
                     except requests.exceptions.JSONDecodeError:
                         raise APIError(r.text)
         return False
@@ -485,11 +1045,11 @@ class WebexApi:
         log.debug("\tPayload: %s", payload)
         try_num = 1
         while try_num <= self.retry_count:
-            r = self.session.patch(url, json=payload, params=params)
+            r = self._send('PATCH', url, json=payload, params=params)
             log.debug(f"TrackingID: {r.headers.get('Trackingid', 'None')}")
             if r.ok:
                 try:
-                    response = r.json()
+                    response = self._json(r)
                 except requests.exceptions.JSONDecodeError:
                     end_time = time.time()
                     log.debug(f"PATCH {url} completed in {end_time - start_time} seconds")
@@ -504,12 +1064,11 @@ class WebexApi:
                 if r.status_code == 429:
                     retry_after = int(r.headers.get('Retry-After', 30))
                     log.info(f"Received 429 Too Many Requests. Waiting {retry_after} seconds to retry.")
-                    time.sleep(retry_after)
                     try_num += 1
                     continue
                 else:
                     try:
-                        raise APIError(r.json())
+                        raise APIError(self._json(r))
                     except requests.exceptions.JSONDecodeError:
                         raise APIError(r.text)
         return False
@@ -527,6 +1086,9 @@ def webex_api_call(method: str,
                    **kwargs):
     """ Generic handler for all Webex API requests
 
+    .. deprecated:: 4.7.0
+        This function opens a new Session, and connection, for every call. Use :class:`WebexApi` instead.
+
     This function performs the Webex API call as a Session and handles processing the response. It has the ability
     to recognize paginated responses from the API and make subsequent requests to get all data, regardless of
     how many pages (calls) are needed.
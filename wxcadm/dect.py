@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 import wxcadm
 from wxcadm import log
+from .tracing import traced
 
 
 class DECTHandset:
@@ -448,6 +449,7 @@ class DECTNetwork:
         return None
 
 
+@traced
 class DECTNetworkList(UserList):
     def __init__(self, org: wxcadm.Org, location: Optional[wxcadm.Location] = None):
         log.info("Initializing empty DECTNetworkList")
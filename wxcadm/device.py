@@ -7,9 +7,11 @@ import logging
 
 import wxcadm
 from .common import *
-from typing import Optional, Union
+from typing import Optional, Union, Iterator
 from .exceptions import *
 from wxcadm import log
+from .tracing import traced
+from .indexed import IndexedList, casefold
 from .virtual_line import VirtualLine
 if TYPE_CHECKING:
     from .person import Person
@@ -49,6 +51,15 @@ class DeviceLayout:
 
 
 class Device:
+    # Slots instead of a __dict__ for each of the (often thousands of) devices. __dict__ is kept so that attributes can
+    # still be added to a Device, but it isn't created unless one is.
+    __slots__ = (
+        'org', 'parent', 'id', 'tags', 'model', 'mac', 'is_owner', 'activation_state', 'type', 'ip_address', '_settings',
+        'display_name', 'capabilities', 'user_permissions', 'connection_status', 'serial', 'software', 'upgrade_channel',
+        'created', 'first_seen', 'last_seen', 'owner', 'workspace_location_id', 'location_id', '_calling_device_id',
+        '_device_members', '_layout', '__dict__', '__weakref__',
+    )
+
     def __init__(self, org: wxcadm.Org, parent: wxcadm.Location | wxcadm.Person | Workspace,
                  config: Optional[dict] = None,
                  id: Optional[str] = None):
@@ -290,6 +301,7 @@ class Device:
         return decode_spark_id(self.workspace_location_id).split("/")[-1]
 
 
+@traced
 class DeviceMemberList(UserList):
     def __init__(self, device: Device):
         log.info(f"Collecting Device Members for {device.display_name}")
@@ -628,7 +640,14 @@ class DeviceMember:
         return self
 
 
-class DeviceList(UserList):
+@traced
+class DeviceList(IndexedList):
+    _indexes = {
+        'id': lambda device: device.id,
+        'name': lambda device: casefold(device.display_name),
+        'mac': lambda device: device.mac.upper().replace(':', '').replace('-', '') if device.mac else None,
+        'spark_id': lambda device: device.spark_id,
+    }
     _endpoint = "v1/devices"
     _endpoint_items_key = None
     _item_endpoint = "v1/devices/{item_id}"
@@ -645,6 +664,13 @@ class DeviceList(UserList):
 
     def _get_data(self) -> list:
         log.debug("_get_data() started")
+        # The whole list is loaded with get(), so the ResponseCache and in-flight GET sharing apply
+        items = list(self._iter_data(self._parent_params(), stream=False))
+        log.info(f"Found {len(items)} items")
+        return items
+
+    def _parent_params(self) -> dict:
+        # The params that limit the list to the parent's devices
         params = {}
         if isinstance(self.parent, wxcadm.Location):
             log.debug(f"Using Location ID {self.parent.id} as data filter")
@@ -660,17 +686,28 @@ class DeviceList(UserList):
             params['workspaceId'] = self.parent.id
         else:
             log.warn("Parent class is not Org or Location, so all items will be returned")
-        response = self.api.get(self._endpoint, params=params)
-        items = []
-        if self._endpoint_items_key is not None:
-            log.info(f"Found {len(response[self._endpoint_items_key])} items")
-            for entry in response[self._endpoint_items_key]:
-                items.append(self._item_class(org=self.org, parent=self.parent, config=entry, id=entry['id']))
+        return params
+
+    def _iter_data(self, params: dict, stream: bool = True) -> Iterator[Device]:
+        # Each page is used as it arrives when stream is True, otherwise every page is fetched with get() first
+        items_key = self._endpoint_items_key if self._endpoint_items_key is not None else 'items'
+        if stream is True:
+            response = self.api.iter_items(self._endpoint, params=params, items_key=items_key)
         else:
-            log.info(f"Found {len(response)} items")
-            for entry in response:
-                items.append(self._item_class(org=self.org, parent=self.parent, config=entry, id=entry['id']))
-        return items
+            response = self.api.get(self._endpoint, params=params, items_key=items_key)
+        for entry in response:
+            yield self._item_class(org=self.org, parent=self.parent, config=entry, id=entry['id'])
+
+    def stream(self) -> Iterator[Device]:
+        """ Yield each :class:`Device` as the pages arrive from Webex, without storing them in the list
+
+        The same Org, Location, Person or Workspace filter that was used to build the list is applied.
+
+        Yields:
+            Device: Each :class:`Device` instance
+
+        """
+        yield from self._iter_data(self._parent_params())
 
     def refresh(self):
         """ Refresh the list of instances from Webex
@@ -710,22 +747,12 @@ class DeviceList(UserList):
         """
         if id is None and name is None and mac_address is None and spark_id is None and connection_status is None:
             raise ValueError("A search argument must be provided")
-        if id is not None:
-            for item in self.data:
-                if item.id == id:
-                    return item
-        if name is not None:
-            for item in self.data:
-                if item.display_name.lower() == name.lower():
-                    return item
         if mac_address is not None:
-            for item in self.data:
-                if item.mac == mac_address.upper().replace(':', '').replace('-', ''):
-                    return item
-        if spark_id is not None:
-            for item in self.data:
-                if item.spark_id == spark_id:
-                    return item
+            mac_address = mac_address.upper().replace(':', '').replace('-', '')
+        for index, key in (('id', id), ('name', casefold(name)), ('mac', mac_address), ('spark_id', spark_id)):
+            item = self._find_first((index, key))
+            if item is not None:
+                return item
         if connection_status is not None:
             item_list: list = []
             for item in self.data:
@@ -995,6 +1022,7 @@ class SupportedDevice:
     """ Whether the device supports basic emergency nomadic (HELD) """
 
 
+@traced
 class SupportedDeviceList(UserList):
     _endpoint = "v1/telephony/config/supportedDevices"
     _endpoint_items_key = 'devices'
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from collections import UserList
+from typing import Iterator
 
 import wxcadm
 from wxcadm import log
+from .tracing import traced
 
 
 class AuditEvent:
@@ -47,6 +49,7 @@ class AuditEvent:
         """ The timestamp when the change was made """
 
 
+@traced
 class AuditEventList(UserList):
     def __init__(self, org: wxcadm.Org, start: str, end: str):
         log.info("AuditEventList instance created")
@@ -59,12 +62,21 @@ class AuditEventList(UserList):
         self.data = self._get_data()
 
     def _get_data(self):
-        data = []
-        response = self.org.api.get(
+        # The whole list is loaded with get(), so the ResponseCache and in-flight GET sharing apply
+        response = self.org.api.get("v1/adminAudit/events", params={'from': self.start, 'to': self.end})
+        return [AuditEvent(entry) for entry in response]
+
+    def stream(self) -> Iterator[AuditEvent]:
+        """ Yield each :class:`AuditEvent` as the pages arrive from Webex, without storing them in the list
+
+        Yields:
+            AuditEvent: Each :class:`AuditEvent` between the :attr:`start` and :attr:`end` of the list
+
+        """
+        response = self.org.api.iter_items(
             "v1/adminAudit/events",
             params={'from': self.start, 'to': self.end}
         )
         for entry in response:
-            data.append(AuditEvent(entry))
-        return data
+            yield AuditEvent(entry)
 
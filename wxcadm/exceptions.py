@@ -1,7 +1,7 @@
 from builtins import Exception
 
 __all__ = ['OrgError', 'LicenseError', 'APIError', 'TokenError', 'PutError', 'XSIError', 'NotAllowed', 'CSDMError',
-           'LicenseOverageError', 'NotSubscribedForLicenseError']
+           'LicenseOverageError', 'NotSubscribedForLicenseError', 'NPlusOneError']
 
 
 class OrgError(Exception):
@@ -55,3 +55,9 @@ class NotAllowed(XSIError):
 class CSDMError(APIError):
     def __init__(self, message):
         super().__init__(message)
+
+
+class NPlusOneError(Exception):
+    """Exception raised by an :class:`~.nplusone.NPlusOneDetector` when one endpoint is called for too many IDs"""
+    def __init__(self, message):
+        super().__init__(message)
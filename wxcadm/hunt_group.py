@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from typing import Optional, Union
-from collections import UserList
 
 import wxcadm.exceptions
 from .common import *
 from wxcadm import log
+from .tracing import traced
+from .indexed import IndexedList, casefold, spark_uuid
 
 
 class HuntGroup:
@@ -89,7 +90,14 @@ class HuntGroup:
         return True
 
 
-class HuntGroupList(UserList):
+@traced
+class HuntGroupList(IndexedList):
+    _indexes = {
+        'id': lambda item: item.id,
+        'name': lambda item: casefold(item.name),
+        'uuid': spark_uuid,
+        'spark_id': lambda item: item.spark_id,
+    }
     _endpoint = "v1/telephony/config/huntGroups"
     _endpoint_items_key = "huntGroups"
     _item_endpoint = "v1/telephony/config/locations/{location_id}/huntGroups/{item_id}"
@@ -112,7 +120,8 @@ class HuntGroupList(UserList):
             log.debug(f"Getting all Hunt Groups for Organization: {self.org.name}")
             params = None
 
-        response = self.org.api.get(self._endpoint, params=params, items_key=self._endpoint_items_key)
+        response = self.org.api.get(self._endpoint, params=params, items_key=self._endpoint_items_key,
+                                    parallel=True)
         items = []
         for entry in response:
             items.append(self._item_class(org=self.org, id=entry['id'], config=entry))
@@ -149,24 +158,13 @@ class HuntGroupList(UserList):
             ValueError: Raised when the method is called with no arguments
 
         """
-        if id is None and name is None and spark_id is None:
+        if id is None and name is None and spark_id is None and uuid is None:
             raise ValueError("A search argument must be provided")
-        if id is not None:
-            for item in self.data:
-                if item.id == id:
-                    return item
-        if name is not None:
-            for item in self.data:
-                if item.name.lower() == name.lower():
-                    return item
-        if uuid is not None:
-            for item in self.data:
-                if item.spark_id.split('/')[-1].uppper() == uuid.upper():
-                    return item
-        if spark_id is not None:
-            for item in self.data:
-                if item.spark_id == spark_id:
-                    return item
+        for index, key in (('id', id), ('name', casefold(name)), ('uuid', uuid and uuid.upper()),
+                           ('spark_id', spark_id)):
+            item = self._find_first((index, key))
+            if item is not None:
+                return item
         return None
 
     def create(self,
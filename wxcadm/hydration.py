@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import wxcadm
+
+__all__ = ['Hydrator']
+
+
+class Hydrator:
+    def __init__(self, org: wxcadm.Org):
+        """ The Org-wide lookup tables used to build many entities from the same API response
+
+        Building a :class:`~.person.Person` or :class:`~.workspace.Workspace` from its API data needs Org-wide
+        information, such as which license IDs are Webex Calling licenses or which :class:`~.location.Location` an ID
+        refers to. Working that out again for every entity is repeated work that grows with the size of the Org, so the
+        list classes, like :class:`~.person.PersonList` and :class:`~.workspace.WorkspaceList`, create one Hydrator
+        per load and pass it to every entity they build. Each table is computed the first time it is needed and then
+        shared by every entity on every page.
+
+        An entity that is built without a Hydrator creates its own, so building a single entity costs the same as
+        before.
+
+        Args:
+            org (Org): The Org the entities belong to
+
+        """
+        self.org: wxcadm.Org = org
+        """ The Org the entities belong to """
+
+    @cached_property
+    def wxc_license_ids(self) -> frozenset:
+        """ The IDs of the Org's Webex Calling licenses """
+        return frozenset(license.id for license in self.org.licenses if license.wxc_license)
+
+    @cached_property
+    def locations(self) -> dict:
+        """ The Org's :class:`~.location.Location` instances, as ``{id: Location}`` """
+        locations = {}
+        for location in self.org.locations:
+            locations.setdefault(location.id, location)
+        return locations
+
+    def location(self, location_id: Optional[str]) -> Optional[wxcadm.Location]:
+        """ Get the :class:`~.location.Location` with an ID
+
+        Args:
+            location_id (str): The Location ID
+
+        Returns:
+            Location: The Location, or None if the Org doesn't have one with that ID
+
+        """
+        return self.locations.get(location_id)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections import UserList
+from typing import Any, Callable, Optional
+
+__all__ = ['IndexedList']
+
+
+def casefold(value: Optional[str]) -> Optional[str]:
+    """ Index key for case-insensitive text, such as names and email addresses """
+    return value.casefold() if value else None
+
+
+def spark_uuid(item: Any) -> Optional[str]:
+    """ Index key for the UUID at the end of an item's Spark ID """
+    return item.spark_id.split('/')[-1].upper()
+
+
+class IndexedList(UserList):
+    _indexes: dict[str, Callable[[Any], Any]] = {}
+    """ The indexes to keep, as ``{name: key function}``. The key function is given an item and returns its key, or
+    None when the item shouldn't be indexed. """
+
+    def __init__(self, initlist: Optional[list] = None):
+        """ A :class:`~collections.UserList` that keeps dict indexes of its items for constant-time lookups
+
+        The list classes, like :class:`~.person.PersonList` and :class:`~.device.DeviceList`, are often searched
+        inside loops over thousands of other objects, which would be quadratic if every ``get()`` scanned the list.
+        Subclasses declare their indexes in :attr:`_indexes` and search them with :meth:`_find`. The indexes are built
+        the first time they are needed, rebuilt whenever ``data`` is replaced (e.g. by ``refresh()``) and kept
+        current by ``append()`` and ``extend()``. Any other change to the list, such as ``remove()``, rebuilds them on
+        the next lookup.
+
+        Each index holds the keys the items had when they were indexed. A hit whose key has since changed causes a
+        rebuild, but an item that was changed to a new key won't be found by it until the list is refreshed or
+        :meth:`reindex` is called.
+
+        """
+        self._positions: Optional[dict] = None
+        super().__init__(initlist)
+
+    @property
+    def data(self) -> list:
+        return self._data
+
+    @data.setter
+    def data(self, value: list):
+        self._data = value
+        self._positions = None
+
+    def reindex(self) -> None:
+        """ Rebuild the indexes, for example after the items have been changed """
+        self._positions = None
+
+    def _keys(self, item: Any):
+        for name, key_function in self._indexes.items():
+            try:
+                key = key_function(item)
+            except (AttributeError, TypeError, ValueError):
+                # The item doesn't have the attribute, or it can't be decoded, so it isn't in this index
+                continue
+            if key is not None:
+                yield name, key
+
+    def _build(self) -> dict:
+        positions = {name: {} for name in self._indexes}
+        for position, item in enumerate(self._data):
+            for name, key in self._keys(item):
+                positions[name].setdefault(key, []).append(position)
+        self._positions = positions
+        return positions
+
+    def _find_positions(self, index: str, key: Any) -> list:
+        # The positions of the items with a key, rebuilding the indexes if any of them have changed
+        if key is None:
+            return []
+        positions = self._positions if self._positions is not None else self._build()
+        found = positions[index].get(key, [])
+        key_function = self._indexes[index]
+        for position in found:
+            try:
+                valid = position < len(self._data) and key_function(self._data[position]) == key
+            except (AttributeError, TypeError, ValueError):
+                valid = False
+            if not valid:
+                return self._build()[index].get(key, [])
+        return found
+
+    def _find(self, index: str, key: Any) -> list:
+        """ Get the items with a key in one of the indexes, in list order
+
+        Args:
+            index (str): The index name
+            key (Any): The key, normalized the same way as the index's key function
+
+        Returns:
+            list: The matching items, which is empty if there are none
+
+        """
+        return [self._data[position] for position in self._find_positions(index, key)]
+
+    def _find_first(self, *searches: tuple) -> Optional[Any]:
+        """ Get the first item in list order that matches any of the ``(index, key)`` searches
+
+        Returns:
+            Any: The item, or None if nothing matches
+
+        """
+        firsts = [found[0] for found in (self._find_positions(index, key) for index, key in searches) if found]
+        return self._data[min(firsts)] if firsts else None
+
+    def append(self, item: Any) -> None:
+        self._data.append(item)
+        if self._positions is not None:
+            position = len(self._data) - 1
+            for name, key in self._keys(item):
+                self._positions[name].setdefault(key, []).append(position)
+
+    def extend(self, other) -> None:
+        for item in other:
+            self.append(item)
+
+    def remove(self, item: Any) -> None:
+        self._data.remove(item)
+        self._positions = None
+
+    def _discard(self, item: Any) -> None:
+        # Remove an item if it is in the list, using the indexes to find it
+        for name, key in self._keys(item):
+            for position in self._find_positions(name, key):
+                if self._data[position] is item:
+                    del self[position]
+                    return
+
+    def __setitem__(self, i, item):
+        self._data[i] = item
+        self._positions = None
+
+    def __delitem__(self, i):
+        del self._data[i]
+        self._positions = None
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, n):
+        self._data *= n
+        self._positions = None
+        return self
+
+    def insert(self, i, item):
+        self._data.insert(i, item)
+        self._positions = None
+
+    def pop(self, i=-1):
+        item = self._data.pop(i)
+        self._positions = None
+        return item
+
+    def clear(self):
+        self._data.clear()
+        self._positions = None
+
+    def reverse(self):
+        self._data.reverse()
+        self._positions = None
+
+    def sort(self, /, *args, **kwds):
+        self._data.sort(*args, **kwds)
+        self._positions = None
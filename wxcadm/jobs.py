@@ -7,6 +7,7 @@ from collections import UserList
 
 import wxcadm.org
 from wxcadm import log
+from .tracing import traced
 from .location import Location
 
 
@@ -67,6 +68,7 @@ class NumberManagementJob:
             return False
 
 
+@traced
 class NumberManagementJobList(UserList):
     _endpoint = "v1/telephony/config/jobs/numbers/manageNumbers"
     _endpoint_items_key = "items"
@@ -142,14 +144,10 @@ class NumberManagementJobList(UserList):
         # Get a copy of the Org numbers for processing
         org_numbers = self.org.numbers
         for number in numbers:
-            number_found = False
-            for org_number in org_numbers:
-                if org_number.phone_number is not None:
-                    if number in org_number.phone_number:
-                        number_found = True
-                        numbers_to_move.append(org_number)
-            if number_found is False:
+            found_numbers = org_numbers.find(number)
+            if not found_numbers:
                 raise KeyError(f"{number} was not found in the Org")
+            numbers_to_move.extend(found_numbers)
 
         if isinstance(target_location, wxcadm.Location):
             target_location_id = target_location.id
@@ -223,6 +221,7 @@ class UserMoveJob:
             return False
 
 
+@traced
 class UserMoveJobList(UserList):
     _endpoint = "v1/telephony/config/jobs/person/moveLocation"
     _endpoint_items_key = "items"
@@ -442,6 +441,7 @@ class RebuildPhonesJob:
         return self.details['deviceCount']
 
 
+@traced
 class RebuildPhonesJobList(UserList):
     _endpoint = "v1/telephony/config/jobs/devices/rebuildPhones"
     _endpoint_items_key = "items"
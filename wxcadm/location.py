@@ -9,6 +9,8 @@ from typing import Union
 
 import wxcadm
 from wxcadm import log
+from .tracing import traced
+from .indexed import IndexedList
 from .models import LocationEmergencySettings
 from .location_features import LocationSchedule, CallParkExtension, VoicePortal, OutgoingPermissionDigitPatternList
 from .call_queue import CallQueueList
@@ -27,7 +29,14 @@ from .pstn import LocationPSTN
 from .number import Number
 
 
-class LocationList(UserList):
+@traced
+class LocationList(IndexedList):
+    _indexes = {
+        'id': lambda location: location.id,
+        'name': lambda location: location.name,
+        'spark_id': lambda location: location.spark_id,
+    }
+
     def __init__(self, org: wxcadm.Org):
         super().__init__()
         log.debug("Initializing LocationList instance")
@@ -72,18 +81,10 @@ class LocationList(UserList):
         """
         if id is None and name is None and spark_id is None:
             raise ValueError("A search argument must be provided")
-        if id is not None:
-            for location in self.data:
-                if location.id == id:
-                    return location
-        if name is not None:
-            for location in self.data:
-                if location.name == name:
-                    return location
-        if spark_id is not None:
-            for location in self.data:
-                if location.spark_id == spark_id:
-                    return location
+        for index, key in (('id', id), ('name', name), ('spark_id', spark_id)):
+            location = self._find_first((index, key))
+            if location is not None:
+                return location
         return None
 
     def create(self,
@@ -199,6 +200,7 @@ class LocationList(UserList):
         """ Alias function of :meth:`LocationList.with_pstn(False)` to quickly provide Locations without PSTN """
         return self.with_pstn(has_pstn=False)
 
+@traced
 class Location:
     def __init__(self,
                  org: wxcadm.Org,
@@ -931,6 +933,7 @@ class LocationFloor:
         return True
 
 
+@traced
 class LocationFloorList(UserList):
     def __init__(self, location: Location):
         super().__init__()
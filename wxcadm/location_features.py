@@ -9,6 +9,7 @@ from datetime import datetime
 import wxcadm.location
 from .realtime import RealtimeClass
 from wxcadm import log
+from .tracing import traced
 from .common import *
 
 
@@ -800,6 +801,7 @@ class VoicemailGroup:
         return self
 
 
+@traced
 class VoicemailGroupList(UserList):
     def __init__(self, org: wxcadm.Org):
         log.info(f'Initializing VoicemailGroupList for Org: {org.name}')
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Optional, Callable
+from urllib.parse import urlparse
+
+from wxcadm import log
+
+__all__ = ['RequestEvent', 'ApiMetrics', 'endpoint_template', 'get_metrics', 'set_metrics']
+
+# Path segments that are words, like "people", "callingConfig" or "e911", are kept. Anything else is treated as an ID.
+_LITERAL_SEGMENT = re.compile(r'^(?=.{1,40}$)[A-Za-z][A-Za-z_-]*\d{0,3}$')
+
+
+def endpoint_template(url: str) -> str:
+    """ Reduce a URL to its endpoint template by replacing the IDs in the path with ``{id}``
+
+    For example, ``https://webexapis.com/v1/telephony/config/locations/Y2lzY2.../queues`` becomes
+    ``v1/telephony/config/locations/{id}/queues``.
+
+    Args:
+        url (str): The full URL or endpoint path
+
+    Returns:
+        str: The endpoint template
+
+    """
+    return _split_url(url)[0]
+
+
+def _split_url(url: str) -> tuple[str, tuple]:
+    # Return the endpoint template of a URL and the IDs that were taken out of it
+    segments = []
+    ids = []
+    for segment in urlparse(url).path.strip('/').split('/'):
+        if _LITERAL_SEGMENT.match(segment):
+            segments.append(segment)
+        else:
+            segments.append('{id}')
+            ids.append(segment)
+    return '/'.join(segments), tuple(ids)
+
+
+@dataclass
+class RequestEvent:
+    """ One HTTP request sent by :class:`~.common.WebexApi`, as passed to :class:`ApiMetrics` callbacks """
+    method: str
+    """ The HTTP method """
+    url: str
+    """ The full URL of the request """
+    template: str
+    """ The endpoint template of the URL, from :func:`endpoint_template` """
+    status: int
+    """ The HTTP status code of the response """
+    elapsed: float
+    """ The number of seconds from sending the request to receiving the full response """
+    bytes: int
+    """ The size of the response body """
+    retry: bool = False
+    """ Whether the request repeated one that had received a 429 or a 5xx """
+    page: bool = False
+    """ Whether the response was one page of a paginated collection """
+
+
+class EndpointMetrics:
+    def __init__(self, buckets: tuple):
+        self.count: int = 0
+        """ The number of requests """
+        self.errors: int = 0
+        """ The number of responses with a 4xx or 5xx status, including 429s and 451s """
+        self.retries: int = 0
+        """ The number of requests that repeated one that had received a 429 or a 5xx """
+        self.throttled: int = 0
+        """ The number of 429 responses """
+        self.redirects: int = 0
+        """ The number of 451 region redirects """
+        self.bytes: int = 0
+        """ The total size of the response bodies """
+        self.pages: int = 0
+        """ The number of responses that were a page of a paginated collection """
+        self.latency_sum: float = 0.0
+        """ The total latency, in seconds """
+        self.buckets: tuple = buckets
+        """ The upper bounds of the latency histogram buckets, in seconds """
+        self.bucket_counts: list = [0] * len(buckets)
+        """ The number of requests in each bucket. Each count only includes requests above the previous bound. """
+
+    def add(self, event: RequestEvent) -> None:
+        self.count += 1
+        if event.status >= 400:
+            self.errors += 1
+        if event.status == 429:
+            self.throttled += 1
+        elif event.status == 451:
+            self.redirects += 1
+        if event.retry:
+            self.retries += 1
+        if event.page:
+            self.pages += 1
+        self.bytes += event.bytes
+        self.latency_sum += event.elapsed
+        for i, bound in enumerate(self.buckets):
+            if event.elapsed <= bound:
+                self.bucket_counts[i] += 1
+                break
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'retries': self.retries,
+            'throttled': self.throttled,
+            'redirects': self.redirects,
+            'bytes': self.bytes,
+            'pages': self.pages,
+            'latency_sum': self.latency_sum,
+            'latency_buckets': dict(zip(self.buckets, self.bucket_counts)),
+        }
+
+
+class ApiMetrics:
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+    def __init__(self, buckets: Optional[tuple] = None, callbacks: Optional[list] = None):
+        """ Request metrics for :class:`~.common.WebexApi`, grouped by HTTP method and endpoint template
+
+        Every request sent by a :class:`~.common.WebexApi` is recorded against its endpoint template (see
+        :func:`endpoint_template`), so requests for different people or locations add up under one name. For each
+        template, the count, latency histogram, retries, 429s, 451 redirects, bytes received and pages are kept.
+        Callbacks receive each :class:`RequestEvent` as it happens, to feed another metrics system::
+
+            metrics = wxcadm.get_metrics()
+            metrics.add_callback(lambda event: statsd.timing(event.template, event.elapsed))
+            ...
+            print(metrics.to_prometheus())
+
+        Args:
+            buckets (tuple, optional): The upper bounds of the latency histogram buckets, in seconds. The last bound
+                should be ``float('inf')``. Defaults to :attr:`DEFAULT_BUCKETS`.
+            callbacks (list, optional): Functions to call with each :class:`RequestEvent`
+
+        """
+        self.buckets: tuple = tuple(buckets) if buckets is not None else self.DEFAULT_BUCKETS
+        """ The upper bounds of the latency histogram buckets, in seconds """
+        self.callbacks: list = list(callbacks or [])
+        """ The functions called with each :class:`RequestEvent` """
+        self._endpoints: dict = {}
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback: Callable[[RequestEvent], None]) -> None:
+        """ Call a function with every :class:`RequestEvent`
+
+        Args:
+            callback (Callable): The function, which receives the :class:`RequestEvent` as its only argument
+
+        """
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[RequestEvent], None]) -> None:
+        """ Stop calling a function added with :meth:`add_callback` """
+        self.callbacks.remove(callback)
+
+    def record(self, event: RequestEvent) -> None:
+        """ Add a request to the metrics and pass it to the callbacks
+
+        Args:
+            event (RequestEvent): The request
+
+        """
+        key = (event.method, event.template)
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = EndpointMetrics(self.buckets)
+            endpoint.add(event)
+        for callback in self.callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                # A broken callback must never break the API call
+                log.warning(f"Metrics callback {callback} failed: {e}")
+
+    def snapshot(self) -> dict:
+        """ Get the current metrics
+
+        Returns:
+            dict: A dict keyed by ``"METHOD template"`` (e.g. ``"GET v1/people/{id}"``). Each value is a dict of
+                ``count``, ``errors``, ``retries``, ``throttled``, ``redirects``, ``bytes``, ``pages``,
+                ``latency_sum`` and ``latency_buckets``.
+
+        """
+        with self._lock:
+            return {f"{method} {template}": endpoint.to_dict()
+                    for (method, template), endpoint in sorted(self._endpoints.items())}
+
+    def reset(self) -> None:
+        """ Clear all of the recorded metrics """
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = 'wxcadm') -> str:
+        """ Format the current metrics in the Prometheus text exposition format
+
+        Args:
+            prefix (str, optional): The prefix of the metric names. Defaults to ``'wxcadm'``.
+
+        Returns:
+            str: The metrics text
+
+        """
+        counters = [
+            ('requests_total', 'count', 'Requests sent to the Webex API'),
+            ('errors_total', 'errors', 'Webex API responses with a 4xx or 5xx status'),
+            ('retries_total', 'retries', 'Webex API requests retried after a 429 or 5xx'),
+            ('throttled_total', 'throttled', 'Webex API 429 Too Many Requests responses'),
+            ('redirects_total', 'redirects', 'Webex API 451 region redirects'),
+            ('response_bytes_total', 'bytes', 'Bytes received from the Webex API'),
+            ('pages_total', 'pages', 'Pages of paginated collections received from the Webex API'),
+        ]
+        snapshot = self.snapshot()
+        lines = []
+        for name, field, help_text in counters:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for key, values in snapshot.items():
+                lines.append(f"{prefix}_{name}{{{self._labels(key)}}} {values[field]}")
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {name} Webex API request latency")
+        lines.append(f"# TYPE {name} histogram")
+        for key, values in snapshot.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in values['latency_buckets'].items():
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {values['latency_sum']}")
+            lines.append(f"{name}_count{{{labels}}} {values['count']}")
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _labels(key: str) -> str:
+        method, template = key.split(' ', 1)
+        return f'method="{method}",endpoint="{template}"'
+
+
+_metrics: Optional[ApiMetrics] = ApiMetrics()
+
+
+def get_metrics() -> Optional[ApiMetrics]:
+    """ Get the process-wide :class:`ApiMetrics` used by every :class:`~.common.WebexApi` without its own
+
+    Returns:
+        ApiMetrics: The shared metrics, or None if metrics have been turned off with :func:`set_metrics`
+
+    """
+    return _metrics
+
+
+def set_metrics(metrics: Optional[ApiMetrics]) -> None:
+    """ Replace the process-wide :class:`ApiMetrics`
+
+    Args:
+        metrics (ApiMetrics): The new metrics, or None to stop recording metrics for instances without their own
+
+    """
+    global _metrics
+    _metrics = metrics
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import threading
+import traceback
+from typing import Optional
+from urllib.parse import urlparse, parse_qsl
+
+from wxcadm import log
+from .exceptions import NPlusOneError
+from .metrics import _split_url
+
+__all__ = ['NPlusOneDetector', 'get_n_plus_one_detector']
+
+# Params that page through or scope a request rather than identify what it is for
+_IGNORED_PARAMS = {'orgId', 'max', 'start', 'cursor', 'callingData', 'offset', 'limit'}
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Frames in these modules are the plumbing of every request, so they are never reported as the call site
+_PLUMBING = {os.path.join(_PACKAGE_DIR, name) for name in ('common.py', 'nplusone.py', 'tracing.py', 'batch.py')}
+
+
+class NPlusOneDetector:
+    def __init__(self, threshold: int = 10, raise_error: bool = False, ignore: Optional[list] = None):
+        """ Detect code that sends one API request per item of a list (the "N+1" pattern)
+
+        While the detector is active, every request sent by any :class:`~.common.WebexApi` is grouped by HTTP
+        method and endpoint template (e.g. ``GET v1/people/{id}``). When one template is requested for more than
+        ``threshold`` different IDs, the detector logs a warning once, or raises :class:`~.exceptions.NPlusOneError`
+        for every request past the threshold when ``raise_error`` is True, showing the wxcadm code that sent the
+        requests and the code outside wxcadm that called it. IDs in the path and in params, such as
+        ``GET v1/people?id=...``, are both counted. This is meant for development runs and tests::
+
+            with wxcadm.NPlusOneDetector(threshold=5, raise_error=True):
+                devices = org.devices
+
+        Args:
+            threshold (int, optional): The number of different IDs allowed for one template. Defaults to 10.
+            raise_error (bool, optional): Whether to raise :class:`~.exceptions.NPlusOneError` instead of logging a
+                warning. Defaults to False.
+            ignore (list, optional): Endpoint templates to skip, such as ``['GET v1/people/{id}']``
+
+        """
+        self.threshold: int = threshold
+        """ The number of different IDs allowed for one endpoint template """
+        self.raise_error: bool = raise_error
+        """ Whether to raise :class:`~.exceptions.NPlusOneError` instead of logging a warning """
+        self.ignore: set = set(ignore or [])
+        """ The ``"METHOD template"`` names that are never reported """
+        self.findings: dict = {}
+        """ The templates that passed the threshold, as ``{"METHOD template": {'ids': int, 'wxcadm_site': str,
+        'caller_site': str}}``. The ID count keeps growing after the first report. """
+        self._ids: dict = {}
+        self._lock = threading.Lock()
+        self._previous: Optional[NPlusOneDetector] = None
+
+    def __enter__(self):
+        global _detector
+        self._previous = _detector
+        _detector = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _detector
+        if _detector is self:
+            _detector = self._previous
+        self._previous = None
+
+    def record(self, method: str, url: str, params: Optional[dict] = None) -> None:
+        """ Count a request and report it if its template has passed the threshold
+
+        Args:
+            method (str): The HTTP method
+            url (str): The full URL
+            params (dict, optional): The request params
+
+        Raises:
+            wxcadm.exceptions.NPlusOneError: Raised when ``raise_error`` is True and the template has passed the
+                threshold, for this request and every later one with the same template
+
+        """
+        template, ids = _split_url(url)
+        name = f"{method} {template}"
+        if name in self.ignore:
+            return
+        all_params = dict(parse_qsl(urlparse(url).query))
+        if params:
+            all_params.update(params)
+        ids += tuple(f"{key}={value}" for key, value in sorted(all_params.items()) if key not in _IGNORED_PARAMS)
+        if not ids:
+            return
+        with self._lock:
+            seen = self._ids.setdefault(name, set())
+            seen.add(ids)
+            count = len(seen)
+            if count <= self.threshold:
+                return
+            if name in self.findings:
+                # The warning is only logged once, but every request past the threshold raises
+                self.findings[name]['ids'] = count
+                if not self.raise_error:
+                    return
+                wxcadm_site = self.findings[name]['wxcadm_site']
+                caller_site = self.findings[name]['caller_site']
+            else:
+                wxcadm_site, caller_site = self._call_sites()
+                self.findings[name] = {'ids': count, 'wxcadm_site': wxcadm_site, 'caller_site': caller_site}
+        message = f"N+1 API calls: {name} was requested for {count} different IDs. Sent from {wxcadm_site}"
+        if caller_site != wxcadm_site:
+            message += f", called from {caller_site}"
+        if self.raise_error:
+            raise NPlusOneError(message)
+        log.warning(message)
+
+    @staticmethod
+    def _call_sites() -> tuple[str, str]:
+        # The innermost frame that isn't request plumbing, and the innermost frame outside the wxcadm package
+        wxcadm_site = caller_site = 'unknown'
+        for frame in reversed(traceback.extract_stack()[:-2]):
+            filename = os.path.abspath(frame.filename)
+            if filename in _PLUMBING:
+                continue
+            site = f"{frame.filename}:{frame.lineno} in {frame.name}"
+            if wxcadm_site == 'unknown':
+                wxcadm_site = site
+            if not filename.startswith(_PACKAGE_DIR + os.sep):
+                caller_site = site
+                break
+        return wxcadm_site, caller_site
+
+
+_detector: Optional[NPlusOneDetector] = None
+
+
+def get_n_plus_one_detector() -> Optional[NPlusOneDetector]:
+    """ Get the active :class:`NPlusOneDetector`
+
+    Returns:
+        NPlusOneDetector: The active detector, or None if there isn't one
+
+    """
+    return _detector
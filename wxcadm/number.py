@@ -1,16 +1,59 @@
 from __future__ import annotations
 
+import bisect
+import re
 from typing import Union, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from dataclasses_json import dataclass_json, LetterCase, Undefined
-from collections import UserList
 
 import wxcadm
 from wxcadm import log
+from .tracing import traced
 from .common import *
+from .indexed import IndexedList
+
+_NON_DIGITS = re.compile(r'\D')
+
+
+def normalize_number(phone_number: Optional[str]) -> Optional[str]:
+    """ Normalize a phone number for matching, by removing everything but the digits and a leading ``+``
+
+    Args:
+        phone_number (str): The phone number, in E.164 or national format, with or without punctuation
+
+    Returns:
+        str: The normalized number, e.g. ``+19195551234`` or ``9195551234``, or None if there are no digits
+
+    """
+    if not phone_number:
+        return None
+    digits = _NON_DIGITS.sub('', phone_number)
+    if not digits:
+        return None
+    return '+' + digits if phone_number.lstrip().startswith('+') else digits
+
+
+def _add_slots(cls):
+    # dataclass(slots=True) needs Python 3.10, so rebuild the dataclass with __slots__ the same way it does. __dict__ is
+    # kept so that attributes can still be added to an instance, but it isn't created unless one is.
+    names = tuple(dataclass_field.name for dataclass_field in fields(cls))
+    slots = names + ('__dict__', '__weakref__')
+    cls_dict = {key: value for key, value in vars(cls).items() if key not in slots}
+    cls_dict['__slots__'] = slots
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def _location_id(number: Number) -> Optional[str]:
+    # The Location ID of a Number, without looking up the Location
+    if not number._location:
+        return None
+    if isinstance(number._location, dict):
+        return number._location.get('id')
+    return number._location.id
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL, undefined=Undefined.EXCLUDE)
+@_add_slots
 @dataclass
 class Number:
     phone_number: Optional[str] = None
@@ -123,11 +166,22 @@ class Number:
         return True
 
 
-class NumberList(UserList):
+@traced
+class NumberList(IndexedList):
+    _indexes = {
+        'number': lambda number: normalize_number(number.phone_number),
+        'esn': lambda number: number.esn,
+        'extension': lambda number: number.extension,
+        'extension_location': lambda number: (number.extension, _location_id(number)) if number.extension else None,
+        'state': lambda number: number.state,
+        'location': _location_id,
+    }
+
     def __init__(self, org: wxcadm.Org, location: Optional[wxcadm.Location] = None):
         super().__init__()
         self.org = org
         self.location = location
+        self._suffixes: list = []
         self.data: list = self._get_data(location=location)
 
     def _get_data(self, location: Optional[wxcadm.Location] = None) -> list:
@@ -136,7 +190,8 @@ class NumberList(UserList):
             params = {'locationId': location.id}
         else:
             params = None
-        response = self.org.api.get('v1/telephony/config/numbers', params=params, items_key='phoneNumbers')
+        response = self.org.api.get('v1/telephony/config/numbers', params=params, items_key='phoneNumbers',
+                                    parallel=True)
         for number in response:
             this_number: Number = Number.from_dict(number)
             this_number.org = self.org
@@ -178,26 +233,22 @@ class NumberList(UserList):
         if phone_number is None and extension is None and esn is None and state is None and location is None:
             raise ValueError('A parameter is required')
         # Handle the single-value searches first
-        for number in self.data:
-            if phone_number is not None and phone_number in number.phone_number:
-                return number
-            if esn is not None and esn == number.esn:
-                return number
-            # If an extension and a location were provided, the user is expecting a single entry
-            if extension is not None and location is not None:
-                if extension == number.extension and location == number.location:
-                    return number
+        firsts = []
+        if phone_number is not None:
+            firsts.extend(self._number_positions(phone_number)[:1])
+        firsts.extend(self._find_positions('esn', esn)[:1])
+        # If an extension and a location were provided, the user is expecting a single entry
+        if extension is not None and location is not None:
+            firsts.extend(self._find_positions('extension_location', (extension, location.id))[:1])
+        if firsts:
+            return self.data[min(firsts)]
         # Then do the list-return searches
         if state is not None or location is not None or extension is not None:
-            result = []
-            for number in self.data:
-                # Extensions can exist in more than one location
-                if extension is not None and extension == number.extension:
-                    result.append(number)
-                if state is not None and state == number.state:
-                    result.append(number)
-                if location is not None and location.id == number.location.id:
-                    result.append(number)
+            # Extensions can exist in more than one location. A Number that matches more than one of the arguments is
+            # in the result once for each.
+            positions = sorted(self._find_positions('extension', extension) + self._find_positions('state', state)
+                               + self._find_positions('location', location.id if location is not None else None))
+            result = [self.data[position] for position in positions]
             # To handle legacy extension searches, only return the Number if it's the only one in the result
             if len(result) == 1:
                 return result[0]
@@ -205,6 +256,58 @@ class NumberList(UserList):
                 return result
         return None
 
+    def find(self, phone_number: str) -> list[Number]:
+        """ Find the Numbers that match a phone number in E.164 or national format
+
+        A number with a leading ``+`` must match the whole E.164 number. Otherwise, a number that matches an E.164
+        number once its ``+`` is added (e.g. ``19195551234``) is returned, and if there isn't one, every Number that
+        ends with the same digits is returned, so a national-format number like ``(919) 555-1234`` matches
+        ``+19195551234``. Punctuation and spaces are ignored.
+
+        Args:
+            phone_number (str): The phone number to find
+
+        Returns:
+            list[Number]: The matching Numbers, in list order. The list is empty if there are no matches.
+
+        """
+        return [self.data[position] for position in self._number_positions(phone_number)]
+
+    def _number_positions(self, phone_number: str) -> list:
+        normalized = normalize_number(phone_number)
+        if normalized is None:
+            return []
+        if normalized.startswith('+'):
+            return self._find_positions('number', normalized)
+        exact = self._find_positions('number', '+' + normalized)
+        if exact:
+            return exact
+        # Find every number that ends with these digits, using the sorted list of reversed numbers
+        if self._positions is None:
+            self._build()
+        suffix = normalized[::-1]
+        matches = []
+        i = bisect.bisect_left(self._suffixes, (suffix,))
+        while i < len(self._suffixes) and self._suffixes[i][0].startswith(suffix):
+            matches.append(self._suffixes[i][1])
+            i += 1
+        matches.sort()
+        if len(matches) > 1:
+            log.debug(f"{phone_number} matches {len(matches)} numbers")
+        return matches
+
+    def _build(self) -> dict:
+        positions = super()._build()
+        # The digits of every number, reversed and sorted, so a suffix search is a binary search for a prefix
+        self._suffixes = sorted((key.lstrip('+')[::-1], position)
+                                for key, found in positions['number'].items() for position in found)
+        return positions
+
+    def append(self, item: Number) -> None:
+        # The suffix list is sorted, so it is rebuilt on the next lookup instead of being updated here
+        self.data.append(item)
+        self._positions = None
+
     def get_by_owner(self, owner):
         for number in self.data:
             if number.owner == owner:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import base64
-from collections import UserList
 
 import re
 import wxcadm
-from typing import Union, Optional
+from typing import Union, Optional, TYPE_CHECKING
 from wxcadm import log
+from .tracing import traced
+from .indexed import IndexedList, casefold
 from .common import *
+from .async_api import AsyncWebexApi
 from .exceptions import *
 from .cpapi import CPAPI
 from .location import LocationList
@@ -21,7 +23,6 @@ from .applications import WebexApplications
 from .announcements import AnnouncementList, PlaylistList
 from .workspace import Workspace, WorkspaceList
 from .call_routing import CallRouting, TranslationPatternList
-from .reports import ReportList
 from .calls import Calls
 from .device import DeviceList, SupportedDeviceList
 from .recording import ComplianceAnnouncementSettings, RecordingList, OrgRecordingVendorSelection
@@ -32,11 +33,14 @@ from .number import NumberList
 from .events import AuditEventList
 from .monitoring import MonitoringList
 from .location_features import CallParkExtension
+if TYPE_CHECKING:
+    from .reports import ReportList
 
 
+@traced
 class Org:
     def __init__(self,
-                 api_connection: Union[WebexApi, str],
+                 api_connection: Union[WebexApi, AsyncWebexApi, str],
                  name: str,
                  id: str,
                  parent: wxcadm.Webex = None,
@@ -46,7 +50,8 @@ class Org:
         """Initialize an Org instance
 
         Args:
-            api_connection (Union[WebexApi, str]): WebexApi instance or Webex Access Token
+            api_connection (Union[WebexApi, AsyncWebexApi, str]): WebexApi or AsyncWebexApi instance, or Webex
+                Access Token
             name (str): The Organization name
             id (str): The Webex ID of the Organization
             parent (Webex, optional): The parent Webex instance that owns this Org.
@@ -58,8 +63,17 @@ class Org:
 
         # Instance attrs
         ### Added 4.6.0 - Use an Org-specific WebexApi instance for API calls
+        self._async_api: Optional[AsyncWebexApi] = None
         if isinstance(api_connection, WebexApi):
+            ### Changed 4.7.0 - Every Org shares the connection pool of the WebexApi it was given
+            self.api = api_connection.for_org(id)
+        elif isinstance(api_connection, AsyncWebexApi):
+            ### Added 4.7.0 - An Org built on an AsyncWebexApi keeps a sync WebexApi for the existing classes
             self.api = WebexApi(api_connection.access_token, org_id=id)
+            self._async_api = AsyncWebexApi(api_connection.access_token, org_id=id,
+                                            max_connections=api_connection.max_connections,
+                                            rate_limiter=api_connection.rate_limiter,
+                                            region_map=api_connection.region_map)
         elif isinstance(api_connection, str):
             self.api = WebexApi(api_connection, org_id=id)
         else:
@@ -103,7 +117,10 @@ class Org:
         self._reports = None
 
         # Set the Authorization header based on how the instance was built
-        self._headers = parent.headers
+        if parent is not None:
+            self._headers = parent.headers
+        else:
+            self._headers = {"Authorization": "Bearer " + self.api.access_token}
 
         # Create a CPAPI instance for CPAPI work
         #self._cpapi = CPAPI(self, self._parent._access_token)
@@ -112,6 +129,19 @@ class Org:
             self.get_xsi_endpoints()
 
 
+    @property
+    def async_api(self) -> AsyncWebexApi:
+        """ The :class:`~.async_api.AsyncWebexApi` for this Org, used to run many API calls concurrently
+
+        .. note::
+            This requires the optional ``aiohttp`` library, which can be installed with
+            ``pip install "wxcadm[async]"``.
+
+        """
+        if self._async_api is None:
+            self._async_api = AsyncWebexApi(self.api.access_token, org_id=self.id)
+        return self._async_api
+
     @property
     def numbers(self):
         """ :class:`NumberList` of all numbers for the Org """
@@ -130,6 +160,8 @@ class Org:
     def reports(self) -> ReportList:
         """ :class:`~.reports.ReportList` of all Reports for the Org """
         if self._reports is None:
+            # Imported here so that reports isn't loaded with the rest of wxcadm unless it is used
+            from .reports import ReportList
             self._reports = ReportList(self)
         return self._reports
 
@@ -347,20 +379,20 @@ class Org:
 
         .. note::
             Since Webex sometimes uses E.164 formatting and other times uses the national format, the match is made
-            using a partial match. If the method is passed a national-format number, but stored in Webex as an E164
-            number, a match will be made.
+            with :meth:`NumberList.find() <.number.NumberList.find>`. If the method is passed a national-format number,
+            but stored in Webex as an E164 number, a match will be made. If more than one number ends with a
+            national-format number, the first one in :attr:`numbers` is used.
 
         Args:
             number (str): The phone number to search for.
 
         """
         log.info(f"get_number_assignment({number})")
-        for num in self.numbers:
-            if num.phone_number is not None:
-                if number in num.phone_number:
-                    log.debug(f"Found match: {num}")
-                    log.debug("Finding owner")
-                    return num.owner
+        matches = self.numbers.find(number)
+        if matches:
+            log.debug(f"Found match: {matches[0]}")
+            log.debug("Finding owner")
+            return matches[0].owner
         return None
 
     def get_all_monitoring(self) -> dict:
@@ -569,7 +601,8 @@ class Org:
         """
         success = self.api.delete(f"v1/people/{person.id}")
         if success:
-            self._people = []
+            if self._people is not None:
+                self._people._discard(person)
             return True
         else:
             return False
@@ -718,7 +751,14 @@ class Org:
         return RecordingList(org=self, **kwargs)
 
 
-class WebexLicenseList(UserList):
+@traced
+class WebexLicenseList(IndexedList):
+    _indexes = {
+        'id': lambda license: license.id,
+        'name': lambda license: license.name,
+        'subscription': lambda license: casefold(license.subscription),
+    }
+
     def __init__(self, org: wxcadm.Org):
         """ The list of Webex licenses within the Org """
         super().__init__()
@@ -812,15 +852,10 @@ class WebexLicenseList(UserList):
             WebexLicense: The Webex license that matches the provided ID or name, if only one is found.
             list[WebexLicense]: A list of Webex licenses that matches the provided ID or name, if multiple matches are found.
         """
-        matches = []
-        for entry in self.data:
-            if id is not None and entry.id == id:
-                return entry
-            if name is not None and entry.name == name:
-                matches.append(entry)
-            if entry.subscription is not None:
-                if subscription is not None and entry.subscription.lower() == subscription.lower():
-                    matches.append(entry)
+        entry = self._find_first(('id', id))
+        if entry is not None:
+            return entry
+        matches = self._find('name', name) + self._find('subscription', casefold(subscription))
 
         if len(matches) == 1:
             return matches[0]
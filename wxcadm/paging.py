@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import re
+import threading
+from typing import Optional
+
+from .metrics import endpoint_template
+
+__all__ = ['PageSizes', 'get_page_sizes', 'set_page_sizes']
+
+# An error message about the max param, such as "max must be less than 1000" or "Invalid max value"
+_MAX_ERROR = re.compile(r'\bmax\b', re.IGNORECASE)
+
+
+class PageSizes:
+    DEFAULTS = {
+        'v1/people': 1000,
+        'v1/devices': 1000,
+        'v1/workspaces': 1000,
+        'v1/locations': 1000,
+        'v1/telephony/config/numbers': 2000,
+        'v1/convergedRecordings': 100,
+        'v1/admin/convergedRecordings': 100,
+        'v1/adminAudit/events': 1000,
+    }
+    """ The largest ``max`` that each endpoint template accepts """
+    PARAM_LIMITS = {
+        'v1/people': {'callingData': 100},
+    }
+    """ Lower limits that apply when a param is sent, as ``{template: {param: max}}``. For example, Webex returns at
+    most 100 people per page when ``callingData`` is requested. """
+
+    def __init__(self, overrides: Optional[dict] = None):
+        """ The page size (``max`` param) to request from each paginated endpoint
+
+        Without a ``max`` param, Webex returns a small default page size for most list endpoints (often 100 items), so
+        a large collection takes many more sequential round trips than it needs. :class:`~.common.WebexApi` looks up
+        the endpoint template of each GET here (see :func:`~.metrics.endpoint_template`) and, when the caller didn't
+        send its own ``max``, sends the largest page size that the endpoint accepts. If Webex rejects that page size
+        with a 400 whose error is about ``max``, the request is repeated without it, and that
+        :class:`~.common.WebexApi` doesn't send a page size for the endpoint again.
+
+        Page sizes can be changed for the whole process, or ``None`` used to stop sending one for an endpoint::
+
+            wxcadm.get_page_sizes().set('v1/devices', 500)
+            wxcadm.get_page_sizes().set('v1/workspaces', None)
+
+        Args:
+            overrides (dict, optional): Page sizes to use instead of :attr:`DEFAULTS`, as ``{template: max}``. A value
+                of None turns off the page size for that template.
+
+        """
+        self.sizes: dict = dict(self.DEFAULTS)
+        """ The page size of each endpoint template. A value of None means no ``max`` is sent. """
+        self.param_limits: dict = {template: dict(limits) for template, limits in self.PARAM_LIMITS.items()}
+        """ The lower limits that apply when a param is sent, as ``{template: {param: max}}`` """
+        self._lock = threading.Lock()
+        if overrides:
+            self.sizes.update(overrides)
+
+    def set(self, endpoint: str, size: Optional[int]) -> None:
+        """ Set the page size for an endpoint
+
+        Args:
+            endpoint (str): The endpoint template or any URL that matches it, e.g. ``v1/devices``
+            size (int): The ``max`` to send, or None to not send one
+
+        """
+        with self._lock:
+            self.sizes[endpoint_template(endpoint)] = size
+
+    def lookup(self, url: str, params: Optional[dict] = None) -> Optional[int]:
+        """ Get the page size to request for a URL
+
+        Args:
+            url (str): The full URL or endpoint path
+            params (dict, optional): The params that will be sent with the request
+
+        Returns:
+            int: The page size, or None if no ``max`` should be sent
+
+        """
+        template = endpoint_template(url)
+        size = self.sizes.get(template)
+        if size is None:
+            return None
+        for param, limit in self.param_limits.get(template, {}).items():
+            if params and param in params:
+                size = min(size, limit)
+        return size
+
+    def apply(self, url: str, params: dict) -> dict:
+        """ Add the page size for a URL to its params, unless they already have a ``max``
+
+        Args:
+            url (str): The full URL or endpoint path
+            params (dict): The params that will be sent with the request
+
+        Returns:
+            dict: The params, with ``max`` added when the endpoint has a page size
+
+        """
+        if 'max' in params:
+            return params
+        size = self.lookup(url, params)
+        if size is None:
+            return params
+        return {**params, 'max': size}
+
+    def reject(self, url: str, params: dict, error: str) -> bool:
+        """ Remove a page size that Webex rejected from a request's params
+
+        The page size is only removed when it came from this registry and the error is about ``max``, so a 400 for
+        any other reason, such as a bad filter, is still raised to the caller. The registry itself isn't changed.
+
+        Args:
+            url (str): The URL of the request that received a 400
+            params (dict): The params of the request
+            error (str): The body of the 400 response
+
+        Returns:
+            bool: True if ``max`` was the page size from this registry, which has now been removed from ``params``
+
+        """
+        if 'max' not in params or not _MAX_ERROR.search(error or ''):
+            return False
+        size = params['max']
+        others = {key: value for key, value in params.items() if key != 'max'}
+        if self.lookup(url, others) != size:
+            return False
+        del params['max']
+        return True
+
+
+_page_sizes: PageSizes = PageSizes()
+
+
+def get_page_sizes() -> PageSizes:
+    """ Get the process-wide :class:`PageSizes` used by every :class:`~.common.WebexApi` without its own
+
+    Returns:
+        PageSizes: The shared page sizes
+
+    """
+    return _page_sizes
+
+
+def set_page_sizes(page_sizes: PageSizes) -> None:
+    """ Replace the process-wide :class:`PageSizes`
+
+    Args:
+        page_sizes (PageSizes): The new page sizes
+
+    """
+    global _page_sizes
+    _page_sizes = page_sizes
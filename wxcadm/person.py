@@ -3,22 +3,33 @@ from __future__ import annotations
 from requests_toolbelt import MultipartEncoder
 import base64
 import os
-from typing import Optional, Union
+from typing import Optional, Union, Iterator
 from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json, config
 from collections import UserList
 
 import wxcadm.exceptions
-from .xsi import XSI
+from .indexed import IndexedList, casefold, spark_uuid
+from .hydration import Hydrator
+from .columns import PeopleFrame
 from .device import DeviceList, Device
 from .location import Location
 from .monitoring import MonitoringList
 from .models import BargeInSettings
 
 from wxcadm import log
+from .tracing import traced
 
 
-class PersonList(UserList):
+@traced
+class PersonList(IndexedList):
+    _indexes = {
+        'id': lambda person: person.id,
+        'email': lambda person: casefold(person.email),
+        'name': lambda person: casefold(person.display_name),
+        'uuid': spark_uuid,
+    }
+
     def __init__(self, org: wxcadm.Org, location: Optional[wxcadm.Location] = None):
         super().__init__()
         log.debug("Initializing PersonList")
@@ -32,6 +43,16 @@ class PersonList(UserList):
     def _get_data(self, filters: Optional[dict] = None) -> list[Person]:
         log.debug("_get_people() started")
         self.__filters = filters
+        # The whole list is loaded with get(), so the ResponseCache and in-flight GET sharing apply
+        return list(self._iter_data(filters=filters, stream=False))
+
+    def _iter_data(self, filters: Optional[dict] = None, stream: bool = True) -> Iterator[Person]:
+        hydrator = Hydrator(self.org)
+        for entry in self._iter_items(filters, stream=stream):
+            yield Person(entry['id'], org=self.org, config=entry, hydrator=hydrator)
+
+    def _iter_items(self, filters: Optional[dict] = None, stream: bool = True) -> Iterator[dict]:
+        # Each page is yielded as it arrives when stream is True, otherwise every page is fetched with get() first
         params = {"callingData": "true"}
         if self.location is not None:
             log.debug("_get_people() location=%s" % self.location)
@@ -40,15 +61,54 @@ class PersonList(UserList):
             log.debug("_get_people() filters=%s" % filters)
             params.update(filters)
         # The Webex API doesn't allow any other params when `id` is present
+        api = self.org.api
         if "id" in params.keys():
             params = {'id': params['id']}
-            response = self.org._parent.api.get("v1/people", params=params)
-        else:
-            response = self.org.api.get("v1/people", params=params)
-        people = []
-        for entry in response:
-            people.append(Person(entry['id'], org=self.org, config=entry))
-        return people
+            api = self.org._parent.api
+        if stream is True:
+            return api.iter_items("v1/people", params=params)
+        return iter(api.get("v1/people", params=params))
+
+    def stream(self) -> Iterator[Person]:
+        """ Yield each :py:class:`Person` as the pages arrive from Webex, without storing them in the list
+
+        This is intended for very large Orgs, where holding every :py:class:`Person` in memory isn't practical. Work
+        can begin on the first page of people while the next page is still being downloaded. If the list was created
+        for a Location, only people at that Location are returned.
+
+        Yields:
+            Person: Each :py:class:`Person` instance
+
+        """
+        yield from self._iter_data()
+
+    def to_columns(self) -> PeopleFrame:
+        """ Get the people as a :class:`~.columns.PeopleFrame`, which holds one list per field instead of a
+        :py:class:`Person` for each person
+
+        The people are fetched from Webex page by page and no :py:class:`Person` instances are built, so this is much
+        faster and smaller than loading the list when a report only needs a few fields for everyone in a large Org. If
+        the list was created for a Location, only people at that Location are included.
+
+        Returns:
+            PeopleFrame: The table of people
+
+        """
+        return PeopleFrame.from_items(self._iter_items(), Hydrator(self.org))
+
+    def to_frame(self):
+        """ Get the people as a :class:`pandas.DataFrame`, using :meth:`to_columns`
+
+        .. note::
+            This method requires the optional ``pandas`` library, which can be installed with
+            ``pip install "wxcadm[pandas]"``.
+
+        Returns:
+            pandas.DataFrame: The DataFrame, with one row per person and the columns of
+            :attr:`PeopleFrame.COLUMNS <.columns.PeopleFrame.COLUMNS>`
+
+        """
+        return self.to_columns().to_pandas()
 
     def refresh(self):
         """ Refresh the list of :py:class:`Person` instances from Webex
@@ -69,11 +129,7 @@ class PersonList(UserList):
             Person: The :py:class:`Person` instance. None is return if no match is found.
 
         """
-        entry: Person
-        for entry in self.data:
-            if entry.id == id:
-                return entry
-        return None
+        return self._find_first(('id', id))
 
     def get(self, id: Optional[str] = None, email: Optional[str] = None, name: Optional[str] = None,
             location: Optional[wxcadm.Location] = None, uuid: Optional[str] = None) -> Union[Person, PersonList]:
@@ -81,8 +137,8 @@ class PersonList(UserList):
 
         This method was added after the :meth:`get_by_email()` and :meth:`get_by_id()` to match other List Classes.
         When the method is called with a ``name`` argument, a list *can* be returned if more than one Person matches
-        the argument. Only the :attr:`Person.display_name` is checked for ``name`` matches. Name matches are
-        case-insensitive and must match the entire Display Name.
+        the argument. Only the :attr:`Person.display_name` is checked for ``name`` matches. Name and email matches are
+        case-insensitive and must match the entire Display Name or email address.
 
         Args:
             id (str, optional): The Webex ID of the Person
@@ -98,14 +154,12 @@ class PersonList(UserList):
         """
         # Only fetch data if we don't already have it
         if self.__data_loaded is True and self.__data_filtered is False:
-            if id is not None:
-                for entry in self.data:
-                    if entry.id == id:
-                        return entry
-            if email is not None:
-                for entry in self.data:
-                    if entry.email == email:
-                        return entry
+            # An ID match wins over an email match, wherever they are in the list
+            entry = self._find_first(('id', id))
+            if entry is None:
+                entry = self._find_first(('email', casefold(email)))
+            if entry is not None:
+                return entry
         filters = {}
         self.__data_filtered = False
         if id is not None:
@@ -253,13 +307,71 @@ class PersonList(UserList):
         response = self.org.api.post("v1/people", params={'callingData': "true"}, payload=payload)
         if response:
             new_person = Person(response['id'], org=self.org, config=response)
+            if self.__data_loaded is True and self.__data_filtered is False:
+                self.append(new_person)
             return new_person
         else:
             raise wxcadm.exceptions.PutError("Something went wrong while creating the user")
 
 
+class _FeatureConfig:
+    """ A feature config attribute of :class:`Person`, which is an empty dict until it is set or first used
+
+    The configs are kept together in ``Person._features``, which isn't created until one of them is needed, so a Person
+    whose feature configs are never fetched doesn't hold an empty dict for each of them.
+
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if instance._features is None:
+            instance._features = {}
+        return instance._features.setdefault(self.name, {})
+
+    def __set__(self, instance, value):
+        if instance._features is None:
+            instance._features = {}
+        instance._features[self.name] = value
+
+
+@traced
 class Person:
-    def __init__(self, user_id, org: wxcadm.Org, config: Optional[dict] = None):
+    # Slots keep large Orgs small: with this many attributes, every instance would otherwise get its own full-size
+    # __dict__. __dict__ is kept so that attributes can still be added to a Person, but it isn't created unless one is.
+    __slots__ = (
+        'id', 'org', 'email', 'first_name', 'last_name', 'display_name', 'wxc', 'licenses', 'location', 'roles',
+        'ptt', 'xsi', 'numbers', 'extension', '_hunt_groups', '_call_queues', 'applications_settings',
+        'executive_assistant', 'avatar', 'department', 'manager', 'login_enabled', 'manager_id', 'title', 'addresses',
+        'status', '_features', '_devices', '_monitoring', '_barge_in', '_applications', '_preferred_answer_endpoint',
+        '_available_answer_endpoints', '_single_number_reach', '_outgoing_permission', '__dict__', '__weakref__',
+    )
+
+    vm_config = _FeatureConfig()
+    """Dictionary of the VM config as returned by Webex API with :meth:`get_vm_config()`"""
+    call_recording = _FeatureConfig()
+    """Dictionary of the Recording config as returned by Webex API with :meth:`get_call_recording()`"""
+    call_forwarding = _FeatureConfig()
+    """Dictionary of the Call Forwarding config as returned by Webex API
+    with :meth:`get_call_forwarding()`"""
+    caller_id = _FeatureConfig()
+    """Dictionary of Caller ID config as returned by Webex API with :meth:`get_caller_id()`"""
+    intercept = _FeatureConfig()
+    """Dictionary of Call Intercept config as returned by Webex API with :meth:`get_intercept()`"""
+    dnd = _FeatureConfig()
+    """Dictionary of DND settings as returned by Webex API with :meth:`get_dnd()`"""
+    calling_behavior = _FeatureConfig()
+    """Dictionary of Calling Behavior as returned by Webex API with :meth:`get_calling_behavior()`"""
+    hoteling = _FeatureConfig()
+    """Dictionary of Hoteling settings as returned by Webex API with :meth:`get_hoteling()`"""
+    outgoing_permission = _FeatureConfig()
+    """Dictionary of Outgoing Permission config returned by Webex API
+    with :meth:`get_outgoing_permission()`"""
+
+    def __init__(self, user_id, org: wxcadm.Org, config: Optional[dict] = None, hydrator: Optional[Hydrator] = None):
         """ Initialize a new Person instance.
 
         If only the `user_id` is provided, the API calls will be made to get
@@ -271,6 +383,8 @@ class Person:
             org (wxcadm.Org): The parent Org that owns the Person instance.
             config (dict, optional): A dictionary of raw values from the `GET v1/people` items. Not normally used
                 except for automated people population from the Org init.
+            hydrator (Hydrator, optional): The Org-wide lookup tables shared by the people built from the same
+                response. Not normally used except by :class:`PersonList`.
 
         """
         self.id = user_id
@@ -294,23 +408,7 @@ class Person:
         """The Webex ID of the user's assigned location"""
         self.roles: list = []
         """ The role IDs assigned to this Person in Webex"""
-        self.vm_config: dict = {}
-        '''Dictionary of the VM config as returned by Webex API with :meth:`get_vm_config()`'''
-        self.call_recording: dict = {}
-        """Dictionary of the Recording config as returned by Webex API with :meth:`get_call_recording()`"""
-        self.call_forwarding: dict = {}
-        """Dictionary of the Call Forwarding config as returned by Webex API 
-        with :meth:`get_call_forwarding()`"""
-        self.caller_id: dict = {}
-        """Dictionary of Caller ID config as returned by Webex API with :meth:`get_caller_id()`"""
-        self.intercept: dict = {}
-        """Dictionary of Call Intercept config as returned by Webex API with :meth:`get_intercept()`"""
-        self.dnd: dict = {}
-        """Dictionary of DND settings as returned by Webex API with :meth:`get_dnd()`"""
-        self.calling_behavior: dict = {}
-        """Dictionary of Calling Behavior as returned by Webex API with :meth:`get_calling_behavior()`"""
-        self.hoteling: dict = {}
-        """Dictionary of Hoteling settings as returned by Webex API with :meth:`get_hoteling()`"""
+        self._features: Optional[dict] = None
         self.ptt: Optional[dict] = None
         """ Dictionary of Push-to-Talk settings as returned by Webex API with :meth:`get_ptt()` """
         self.xsi = None
@@ -323,9 +421,6 @@ class Person:
         """A list of the Hunt Group instances that this user is an Agent for"""
         self._call_queues: list = []
         """A list of the Call Queue instances that this user is an Agent for"""
-        self.outgoing_permission: dict = {}
-        """Dictionary of Outgoing Permission config returned by Webex API
-        with :meth:`get_outgoing_permission()`"""
         self.applications_settings = None
         """ The Application Services Settings for this Person"""
         self.executive_assistant = None
@@ -356,16 +451,17 @@ class Person:
 
         # If the config was passed, process it. If not, make the API call for the Person ID and then process
         if config:
-            self.__process_api_data(config)
+            self.__process_api_data(config, hydrator)
         else:
             response = self.org.api.get(f"v1/people/{self.id}", params={'callingData': True})
-            self.__process_api_data(response)
+            self.__process_api_data(response, hydrator)
 
-    def __process_api_data(self, data: dict):
+    def __process_api_data(self, data: dict, hydrator: Optional[Hydrator] = None):
         """Takes the API data passed as the `data` argument and parses it to the instance attributes.
 
         Args:
             data (dict): A dictionary of the raw data returned by the `v1/people` API call
+            hydrator (Hydrator, optional): The Org-wide lookup tables to use
 
         """
         self.email = data.get('emails', [''])[0]
@@ -387,7 +483,9 @@ class Person:
         self.licenses = data.get("licenses", [])
 
         # Calculate whether this is a Webex Calling user
-        wxc_licenses = list(license.id for license in self.org.licenses if 'Webex Calling' in license.name)
+        if hydrator is None:
+            hydrator = Hydrator(self.org)
+        wxc_licenses = hydrator.wxc_license_ids
         for license in self.licenses:
             if license in wxc_licenses:
                 # v4.4.4 Ensure Person has both license and assigned Location in order to be .wxc=True
@@ -488,6 +586,8 @@ class Person:
     def delete(self) -> bool:
         """ Delete the Person """
         self.org.api.delete(f"v1/people/{self.id}")
+        if getattr(self.org, '_people', None):
+            self.org._people._discard(self)
         return True
 
     def assign_wxc(self,
@@ -668,6 +768,8 @@ class Person:
         Returns:
             XSI: The XSI instance for this Person
         """
+        # Imported here so that the XSI dependencies aren't loaded with the rest of wxcadm unless XSI is used
+        from .xsi import XSI
         self.xsi = XSI(org=self.org, person=self, get_profile=get_profile, cache=cache)
         return self.xsi
 
@@ -869,20 +971,21 @@ class Person:
         content = open(filename, "rb")
         encoder = MultipartEncoder(fields={"file": (upload_as, content, 'audio/wav')})
         log.debug(f"File Encoder: {encoder}")
-        r = self.org.api.post_upload(
-            f"v1/people/{self.id}/features/voicemail/actions/uploadBusyGreeting/invoke",
-            data=encoder
-        )
-        content.close()
-        if r.ok:
-            if activate is True:
-                vm_config = self.get_vm_config()
-                vm_config['sendBusyCalls']['greeting'] = "CUSTOM"
-                self.push_vm_config(vm_config)
-            return True
-        else:
-            log.warning(f"The Greeting upload failed: {r.text}")
+        try:
+            self.org.api.post_upload(
+                f"v1/people/{self.id}/features/voicemail/actions/uploadBusyGreeting/invoke",
+                payload=encoder
+            )
+        except wxcadm.exceptions.APIError as e:
+            log.warning(f"The Greeting upload failed: {e}")
             return False
+        finally:
+            content.close()
+        if activate is True:
+            vm_config = self.get_vm_config()
+            vm_config['sendBusyCalls']['greeting'] = "CUSTOM"
+            self.push_vm_config(vm_config)
+        return True
 
     def upload_no_answer_greeting(self, filename: str, activate: bool = True):
         """ Upload a WAV file to be used as the Person's Voicemail No Answer Greeting
@@ -904,20 +1007,21 @@ class Person:
         content = open(filename, "rb")
         encoder = MultipartEncoder(fields={"file": (upload_as, content, 'audio/wav')})
         log.debug(f"File Encoder: {encoder}")
-        r = self.org.api.post_upload(
-            f"v1/people/{self.id}/features/voicemail/actions/uploadNoAnswerGreeting/invoke",
-            data=encoder
-        )
-        content.close()
-        if r.ok:
-            if activate is True:
-                vm_config = self.get_vm_config()
-                vm_config['sendUnansweredCalls']['greeting'] = "CUSTOM"
-                self.push_vm_config(vm_config)
-            return True
-        else:
-            log.warning(f"The Greeting upload failed: {r.text}")
+        try:
+            self.org.api.post_upload(
+                f"v1/people/{self.id}/features/voicemail/actions/uploadNoAnswerGreeting/invoke",
+                payload=encoder
+            )
+        except wxcadm.exceptions.APIError as e:
+            log.warning(f"The Greeting upload failed: {e}")
             return False
+        finally:
+            content.close()
+        if activate is True:
+            vm_config = self.get_vm_config()
+            vm_config['sendUnansweredCalls']['greeting'] = "CUSTOM"
+            self.push_vm_config(vm_config)
+        return True
 
     def push_cf_config(self, cf_config: dict = None):
         """ Pushes the Call Forwarding config back to Webex
@@ -1938,6 +2042,7 @@ class VoiceMessage:
             return False
 
 
+@traced
 class UserGroups(UserList):
     """ UserGroups is the parent class for :py:class:`UserGroup`, providing methods for the list of Groups """
 
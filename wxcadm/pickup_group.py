@@ -4,9 +4,11 @@ from collections import UserList
 
 import wxcadm.location
 from wxcadm import log
+from .tracing import traced
 from .common import *
 
 
+@traced
 class PickupGroupList(UserList):
     def __init__(self, location: wxcadm.Location):
         super().__init__()
@@ -11,6 +11,7 @@ from dataclasses_json import dataclass_json, config
 import wxcadm
 from .common import *
 from wxcadm import log
+from .tracing import traced
 
 
 @dataclass_json
@@ -24,6 +25,7 @@ class PSTNProvider:
     """ The services offered by the PSTN Provider """
 
 
+@traced
 class PSTNProviderList(UserList):
     def __init__(self, location: wxcadm.Location):
         super().__init__()
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from wxcadm import log
+
+__all__ = ['RateLimiter', 'SharedRateLimiter', 'get_rate_limiter', 'set_rate_limiter']
+
+
+class RateLimiter:
+    def __init__(self, rate: Optional[float] = None, burst: int = 10):
+        """ A thread-safe token-bucket rate limiter shared by :class:`~.common.WebexApi` instances
+
+        Every request made by a :class:`~.common.WebexApi` first takes a token from the limiter. When ``rate`` is set,
+        tokens are added at ``rate`` per second, up to ``burst``, which spreads requests out before Webex has to
+        reject them. Whenever Webex responds with a 429, the limiter is paused for the Retry-After time, so every
+        thread waits together instead of each one receiving its own 429.
+
+        Args:
+            rate (float, optional): The sustained number of requests per second. When None (the default), requests
+                are not spaced out, but all callers still pause together after a 429.
+            burst (int, optional): The number of requests that can be sent at once before ``rate`` applies.
+                Defaults to 10.
+
+        """
+        self.rate: Optional[float] = rate
+        """ The sustained number of requests per second, or None for no limit """
+        self.burst: int = burst
+        """ The maximum number of requests that can be sent back-to-back """
+        self._lock = threading.Lock()
+        self._tokens: float = float(burst)
+        self._updated: float = self._clock()
+        self._paused_until: float = 0.0
+
+    # The clock only has to be consistent within a process. SharedRateLimiter uses wall-clock time instead.
+    _clock = staticmethod(time.monotonic)
+
+    def _take(self, tokens: float, updated: float, paused_until: float, now: float) -> tuple[float, float, float]:
+        # Take a token from the bucket state and return the new state and the time the caller must wait
+        wait = max(0.0, paused_until - now)
+        if self.rate is not None:
+            if now > updated:
+                tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+                updated = now
+            tokens -= 1
+            token_wait = max(updated - now, 0.0) + max(-tokens, 0.0) / self.rate
+            wait = max(wait, token_wait)
+        return tokens, updated, wait
+
+    def _hold(self, tokens: float, updated: float, paused_until: float, now: float,
+              seconds: float) -> tuple[float, float, float]:
+        # Pause the bucket state for the given seconds and return the new state
+        paused_until = max(paused_until, now + seconds)
+        # Don't let tokens build up while paused, or every waiting caller would fire at once when it ends
+        tokens = min(tokens, 0.0)
+        updated = max(updated, paused_until)
+        return tokens, updated, paused_until
+
+    def reserve(self) -> float:
+        """ Take a token and return how long the caller must wait before sending its request
+
+        This never sleeps, so the caller decides how to wait, with :func:`time.sleep` or :func:`asyncio.sleep`. Most
+        callers should use :meth:`acquire` instead. A :class:`SharedRateLimiter` can block on its database lock, so
+        :class:`~.async_api.AsyncWebexApi` calls it from an executor rather than on the event loop.
+
+        Returns:
+            float: The number of seconds to wait before sending the request
+
+        """
+        with self._lock:
+            self._tokens, self._updated, wait = self._take(self._tokens, self._updated, self._paused_until,
+                                                           self._clock())
+            return wait
+
+    def acquire(self) -> None:
+        """ Block until the caller is allowed to send a request """
+        wait = self.reserve()
+        if wait > 0:
+            log.debug(f"Rate limiter waiting {wait:.2f} seconds")
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """ Stop all callers from sending requests for the given number of seconds
+
+        This is called when Webex responds with a 429 and a Retry-After header.
+
+        Args:
+            seconds (float): The number of seconds to pause
+
+        """
+        log.info(f"Rate limiter pausing all requests for {seconds} seconds")
+        with self._lock:
+            self._tokens, self._updated, self._paused_until = self._hold(self._tokens, self._updated,
+                                                                         self._paused_until, self._clock(), seconds)
+
+    @property
+    def paused(self) -> bool:
+        """ Whether the limiter is currently paused because of a 429 """
+        return self._clock() < self._paused_until
+
+
+class SharedRateLimiter(RateLimiter):
+    def __init__(self,
+                 path: Optional[str] = None,
+                 rate: Optional[float] = None,
+                 burst: int = 10,
+                 name: str = 'default'):
+        """ A :class:`RateLimiter` whose budget is shared by every process on the host
+
+        The bucket is stored in a small SQLite database file, and every :meth:`reserve` and :meth:`pause` runs in an
+        exclusive transaction, so worker processes using the same ``path`` and ``name`` draw from one budget and all
+        pause together when any of them receives a 429. No external service is required. To use it for every
+        :class:`~.common.WebexApi` in a process::
+
+            wxcadm.set_rate_limiter(wxcadm.SharedRateLimiter(rate=5, burst=5))
+
+        Args:
+            path (str, optional): The path of the SQLite file. Defaults to ``wxcadm_ratelimit.sqlite`` in the system
+                temp directory.
+            rate (float, optional): The sustained number of requests per second across all processes. When None, the
+                processes only share the 429 pause.
+            burst (int, optional): The number of requests that can be sent at once. Defaults to 10.
+            name (str, optional): The name of the bucket, which allows several budgets (e.g. one per token) to live in
+                the same file. Defaults to ``'default'``.
+
+        """
+        super().__init__(rate=rate, burst=burst)
+        self.path: str = path or os.path.join(tempfile.gettempdir(), 'wxcadm_ratelimit.sqlite')
+        """ The path of the SQLite file holding the shared bucket """
+        self.name: str = name
+        """ The name of the bucket """
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    _clock = staticmethod(time.time)
+
+    def __getstate__(self):
+        # Connections can't be pickled, so a copy sent to another process opens its own
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_pid'] = None
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection must not be shared with a forked child, so reconnect whenever the PID changes
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS buckets "
+                         "(name TEXT PRIMARY KEY, tokens REAL, updated REAL, paused_until REAL)")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _update(self, func):
+        # Read the bucket, apply func to it and write it back, all inside one exclusive transaction
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = self._clock()
+                row = conn.execute("SELECT tokens, updated, paused_until FROM buckets WHERE name = ?",
+                                   (self.name,)).fetchone()
+                if row is None:
+                    row = (float(self.burst), now, 0.0)
+                tokens, updated, paused_until, result = func(*row, now)
+                conn.execute("INSERT OR REPLACE INTO buckets (name, tokens, updated, paused_until) "
+                             "VALUES (?, ?, ?, ?)", (self.name, tokens, updated, paused_until))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return result
+
+    def reserve(self) -> float:
+        def take(tokens, updated, paused_until, now):
+            tokens, updated, wait = self._take(tokens, updated, paused_until, now)
+            return tokens, updated, paused_until, wait
+        return self._update(take)
+
+    def pause(self, seconds: float) -> None:
+        log.info(f"Shared rate limiter pausing all processes for {seconds} seconds")
+
+        def hold(tokens, updated, paused_until, now):
+            return self._hold(tokens, updated, paused_until, now, seconds) + (None,)
+        self._update(hold)
+
+    @property
+    def paused(self) -> bool:
+        return self._update(lambda tokens, updated, paused_until, now:
+                            (tokens, updated, paused_until, now < paused_until))
+
+
+_rate_limiter: RateLimiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """ Get the process-wide :class:`RateLimiter` used by every :class:`~.common.WebexApi` without its own limiter
+
+    Returns:
+        RateLimiter: The shared limiter
+
+    """
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter: RateLimiter) -> None:
+    """ Replace the process-wide :class:`RateLimiter`
+
+    This takes effect immediately for every :class:`~.common.WebexApi` that doesn't have its own limiter, including
+    instances that already exist. For example, to allow no more than 5 requests per second across every Org::
+
+        wxcadm.set_rate_limiter(wxcadm.RateLimiter(rate=5, burst=5))
+
+    Args:
+        limiter (RateLimiter): The new limiter
+
+    """
+    global _rate_limiter
+    _rate_limiter = limiter
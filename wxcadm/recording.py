@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import Optional, Union, Iterator, Iterable
 from collections import UserList
 from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json, config
@@ -10,6 +10,8 @@ import re
 
 import wxcadm.location
 from wxcadm import log
+from .tracing import traced
+from .indexed import IndexedList
 from .common import *
 
 
@@ -30,6 +32,7 @@ class RecordingVendor:
     """ The URL to access the Recording Provider's Terms of Service """
 
 
+@traced
 class RecordingVendorsList(UserList):
     def __init__(self, vendors: list):
         super().__init__()
@@ -501,7 +504,12 @@ class Recording:
         return response.text
 
 
-class RecordingList(UserList):
+@traced
+class RecordingList(IndexedList):
+    _indexes = {
+        'id': lambda recording: recording.id,
+        'call_id': lambda recording: recording.call_session_id,
+    }
     _endpoint = 'v1/admin/convergedRecordings'
     _endpoint_items_key = None
     _item_endpoint = 'v1/convergedRecordings/{item_id}'
@@ -519,7 +527,7 @@ class RecordingList(UserList):
         super().__init__()
         log.debug("Initializing RecordingList")
         self.org: wxcadm.Org = org
-        self.params: dict = {'max': 100}
+        self.params: dict = {}
         if from_date_time is not None:
             self.params['from'] = str(from_date_time)
         if to_date_time is not None:
@@ -538,12 +546,23 @@ class RecordingList(UserList):
 
     def _get_data(self) -> list:
         log.debug(f"_get_data() started with params {self.params}")
-        response = self.org.api.get(self._endpoint, params=self.params)
+        # The whole list is loaded with get(), so the ResponseCache and in-flight GET sharing apply
+        return list(self._iter_data(self.org.api.get(self._endpoint, params=self.params)))
 
-        items = []
-        for entry in response:
-            items.append(self._item_class(org=self.org, id=entry['id'], details=entry))
-        return items
+    def _iter_data(self, entries: Iterable[dict]) -> Iterator[Recording]:
+        for entry in entries:
+            yield self._item_class(org=self.org, id=entry['id'], details=entry)
+
+    def stream(self) -> Iterator[Recording]:
+        """ Yield each :class:`Recording` as the pages arrive from Webex, without storing them in the list
+
+        The same filters that were used to build the list are applied.
+
+        Yields:
+            Recording: Each :class:`Recording` instance
+
+        """
+        yield from self._iter_data(self.org.api.iter_items(self._endpoint, params=self.params))
 
     def refresh(self):
         """ Refresh the list of instances from Webex
@@ -572,16 +591,9 @@ class RecordingList(UserList):
 
         """
         if id is not None:
-            for item in self.data:
-                if item.id == id:
-                    return item
-            return None
+            return self._find_first(('id', id))
         elif call_id is not None:
-            return_list = []
-            for item in self.data:
-                if item.call_session_id == call_id:
-                    return_list.append(item)
-            return return_list
+            return self._find('call_id', call_id)
         else:
             raise ValueError("id or call_id must be specified")
 
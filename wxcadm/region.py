@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from typing import Optional
+from urllib.parse import urlparse
+
+from wxcadm import log
+
+__all__ = ['RegionMap', 'get_region_map', 'set_region_map']
+
+
+class RegionMap:
+    def __init__(self, path: Optional[str] = None):
+        """ The regional API hosts learned from 451 responses, by Org and endpoint family
+
+        Some endpoints, such as ``v1/cdr_feed`` and the analytics APIs, must be called on the API host for the
+        region where the Org's data lives, and Webex answers a request to any other host with a 451 that names the
+        right one. :class:`~.common.WebexApi` records that host here and sends later requests for the same Org and
+        endpoint family (the first two segments of the path, e.g. ``v1/cdr_feed``) straight to it, instead of paying
+        for a 451 and a retry every time.
+
+        By default, the map only lasts as long as the process. When ``path`` is given, the map is loaded from and saved
+        to that JSON file, so it carries over to the next run::
+
+            wxcadm.set_region_map(wxcadm.RegionMap(path='~/.wxcadm_regions.json'))
+
+        Args:
+            path (str, optional): The JSON file to persist the map to
+
+        """
+        self.path: Optional[str] = os.path.expanduser(path) if path is not None else None
+        """ The JSON file the map is persisted to, if any """
+        self.routes: dict = {}
+        """ The learned hosts, as ``{"<org_id> <family>": host}`` """
+        self._lock = threading.Lock()
+        if self.path is not None and os.path.exists(self.path):
+            try:
+                with open(self.path) as f:
+                    self.routes = json.load(f)
+            except (OSError, ValueError) as e:
+                log.warning(f"Could not load the region map from {self.path}: {e}")
+
+    @staticmethod
+    def family(url: str) -> str:
+        """ Get the endpoint family of a URL, which is the first two segments of its path
+
+        Args:
+            url (str): The full URL or endpoint path
+
+        Returns:
+            str: The endpoint family, such as ``v1/cdr_feed``
+
+        """
+        return '/'.join(urlparse(url).path.strip('/').split('/')[:2])
+
+    @staticmethod
+    def _key(org_id: Optional[str], url: str) -> str:
+        return f"{org_id or '*'} {RegionMap.family(url)}"
+
+    def lookup(self, org_id: Optional[str], url: str) -> Optional[str]:
+        """ Get the learned host for an Org and URL
+
+        Args:
+            org_id (str): The Org ID, or None for requests that aren't scoped to an Org
+            url (str): The full URL of the request
+
+        Returns:
+            str: The host, or None if no region has been learned
+
+        """
+        return self.routes.get(self._key(org_id, url))
+
+    def route(self, org_id: Optional[str], url: str) -> str:
+        """ Send a URL to the learned host for its Org and endpoint family
+
+        Args:
+            org_id (str): The Org ID, or None for requests that aren't scoped to an Org
+            url (str): The full URL of the request
+
+        Returns:
+            str: The URL to use
+
+        """
+        host = urlparse(url).netloc
+        regional = self.lookup(org_id, url)
+        if regional is None or regional == host:
+            return url
+        return url.replace(host, regional, 1)
+
+    def learn(self, org_id: Optional[str], url: str, host: str) -> None:
+        """ Record the host that Webex redirected a request to
+
+        Args:
+            org_id (str): The Org ID, or None for requests that aren't scoped to an Org
+            url (str): The full URL of the request that received the 451
+            host (str): The host named in the 451 response
+
+        """
+        key = self._key(org_id, url)
+        with self._lock:
+            if self.routes.get(key) == host:
+                return
+            log.info(f"Routing {key} to {host}")
+            self.routes[key] = host
+            if self.path is not None:
+                self._save()
+
+    def clear(self) -> None:
+        """ Forget every learned host """
+        with self._lock:
+            self.routes.clear()
+            if self.path is not None:
+                self._save()
+
+    def _save(self) -> None:
+        # Write to a temp file and rename it, so another process never reads a partial file
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.routes, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            log.warning(f"Could not save the region map to {self.path}: {e}")
+
+
+_region_map: RegionMap = RegionMap()
+
+
+def get_region_map() -> RegionMap:
+    """ Get the process-wide :class:`RegionMap` used by every :class:`~.common.WebexApi` without its own
+
+    Returns:
+        RegionMap: The shared map
+
+    """
+    return _region_map
+
+
+def set_region_map(region_map: RegionMap) -> None:
+    """ Replace the process-wide :class:`RegionMap`, for example with one that is persisted to a file
+
+    Args:
+        region_map (RegionMap): The new map
+
+    """
+    global _region_map
+    _region_map = region_map
@@ -4,6 +4,7 @@ import requests
 from .common import *
 import wxcadm
 from wxcadm import log
+from .tracing import traced
 from datetime import datetime, timedelta
 from io import BytesIO
 from zipfile import ZipFile
@@ -121,6 +122,7 @@ class ReportTemplate:
         """ A list of validations which are run against the Template when a Report is requested """
 
 
+@traced
 class ReportList(UserList):
     """ The Reports class provides an interface to all reports available via the Webex API """
     def __init__(self, org: wxcadm.Org):
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from wxcadm import log
+from .metrics import endpoint_template
+
+__all__ = ['Span', 'Tracer', 'traced', 'get_tracer']
+
+# The span that is open in the current thread or task, which becomes the parent of any new span
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar('wxcadm_span', default=None)
+_span_ids = itertools.count(1)
+
+
+class Span:
+    def __init__(self, tracer: Tracer, name: str, parent: Optional[Span] = None,
+                 attributes: Optional[dict] = None, kind: str = 'call'):
+        self.tracer: Tracer = tracer
+        self.name: str = name
+        """ The name of the span, e.g. ``Org.get_all_monitoring`` or ``GET v1/people/{id}`` """
+        self.kind: str = kind
+        """ ``'call'`` for a wxcadm method or ``'http'`` for an API request """
+        self.id: int = next(_span_ids)
+        """ The unique ID of the span """
+        self.parent: Optional[Span] = parent
+        """ The span that was open when this span started, if any """
+        self.attributes: dict = attributes or {}
+        """ Details of the span. HTTP spans include ``method``, ``url``, ``status`` and ``tracking_id``. """
+        self.thread_id: int = threading.get_ident()
+        """ The thread that ran the span """
+        self.requests: int = 0
+        """ The number of API requests sent within the span, including its child spans """
+        self.start: float = time.perf_counter()
+        """ The perf_counter() time when the span started """
+        self.end: Optional[float] = None
+        """ The perf_counter() time when the span ended """
+
+    @property
+    def duration(self) -> float:
+        """ The length of the span, in seconds """
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'parent_id': self.parent.id if self.parent is not None else None,
+            'name': self.name,
+            'kind': self.kind,
+            'thread_id': self.thread_id,
+            'start': self.start - self.tracer.started,
+            'duration': self.duration,
+            'requests': self.requests,
+            'attributes': self.attributes,
+        }
+
+
+class Tracer:
+    def __init__(self, keep_empty: bool = False):
+        """ Record a trace of wxcadm method calls and the API requests they send
+
+        While a Tracer is active, the public methods and properties of :class:`~.org.Org`,
+        :class:`~.person.Person`, :class:`~.location.Location`, :class:`~.workspace.Workspace` and the list classes
+        each open a span, and every request sent by :class:`~.common.WebexApi` is recorded as a child span with its
+        status, duration and Webex TrackingID. The trace can then be written as JSON, or in the Chrome trace format
+        to be viewed in ``chrome://tracing`` or Perfetto::
+
+            with wxcadm.Tracer() as tracer:
+                org.get_all_monitoring()
+            tracer.export('monitoring.json', format='chrome')
+
+        Tracing is off unless a Tracer is active, and only one Tracer can be active at a time.
+
+        Args:
+            keep_empty (bool, optional): Whether to keep spans for method calls that didn't send any API requests.
+                Defaults to False, which keeps the trace focused on the calls that took time.
+
+        """
+        self.keep_empty: bool = keep_empty
+        """ Whether spans that didn't send any API requests are kept """
+        self.spans: list[Span] = []
+        """ The finished spans, in the order they ended """
+        self.started: float = time.perf_counter()
+        self._lock = threading.Lock()
+        self._previous: Optional[Tracer] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> None:
+        """ Make this the active Tracer """
+        global _tracer
+        self._previous = _tracer
+        self.started = time.perf_counter()
+        _tracer = self
+
+    def stop(self) -> None:
+        """ Stop tracing and restore the Tracer that was active before :meth:`start`, if any """
+        global _tracer
+        if _tracer is self:
+            _tracer = self._previous
+        self._previous = None
+
+    def open(self, name: str, attributes: Optional[dict] = None,
+             kind: str = 'call') -> tuple[Span, contextvars.Token]:
+        span = Span(self, name, parent=_current_span.get(), attributes=attributes, kind=kind)
+        return span, _current_span.set(span)
+
+    def close(self, span: Span, token: contextvars.Token) -> None:
+        span.end = time.perf_counter()
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # The span was opened in another context, e.g. a generator that was finished by another thread
+            pass
+        with self._lock:
+            if span.parent is not None:
+                span.parent.requests += span.requests
+            if span.kind == 'call' and span.requests == 0 and not self.keep_empty:
+                return
+            self.spans.append(span)
+
+    def record_request(self, method: str, url: str, status: int, tracking_id: Optional[str],
+                       start: float, end: float) -> None:
+        """ Add a finished API request as a child of the current span """
+        span = Span(self, f"{method} {endpoint_template(url)}", parent=_current_span.get(), kind='http',
+                    attributes={'method': method, 'url': url, 'status': status, 'tracking_id': tracking_id})
+        span.start = start
+        span.end = end
+        span.requests = 1
+        with self._lock:
+            if span.parent is not None:
+                span.parent.requests += 1
+            self.spans.append(span)
+
+    def to_json(self) -> list[dict]:
+        """ Get the spans as a list of dicts, ordered by start time
+
+        Returns:
+            list[dict]: The spans, each with ``id``, ``parent_id``, ``name``, ``kind``, ``thread_id``, ``start`` (the
+                seconds since the Tracer started), ``duration``, ``requests`` and ``attributes``
+
+        """
+        with self._lock:
+            spans = list(self.spans)
+        return [span.to_dict() for span in sorted(spans, key=lambda span: span.start)]
+
+    def to_chrome_trace(self) -> dict:
+        """ Get the spans in the Chrome trace event format
+
+        Returns:
+            dict: The trace, which can be saved as JSON and opened in ``chrome://tracing`` or Perfetto
+
+        """
+        events = []
+        for span in self.to_json():
+            events.append({
+                'name': span['name'],
+                'cat': span['kind'],
+                'ph': 'X',
+                'ts': span['start'] * 1_000_000,
+                'dur': span['duration'] * 1_000_000,
+                'pid': os.getpid(),
+                'tid': span['thread_id'],
+                'args': dict(span['attributes'], requests=span['requests'], id=span['id'],
+                             parent_id=span['parent_id']),
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export(self, path: str, format: str = 'json') -> None:
+        """ Write the trace to a file
+
+        Args:
+            path (str): The file to write
+            format (str, optional): ``'json'`` for the list from :meth:`to_json` or ``'chrome'`` for
+                :meth:`to_chrome_trace`. Defaults to ``'json'``.
+
+        """
+        if format == 'json':
+            data = self.to_json()
+        elif format == 'chrome':
+            data = self.to_chrome_trace()
+        else:
+            raise ValueError(f"Unknown trace format: {format}")
+        with open(path, 'w') as f:
+            json.dump(data, f, default=str)
+        log.info(f"Wrote {len(self.spans)} spans to {path}")
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """ Get the active :class:`Tracer`
+
+    Returns:
+        Tracer: The active Tracer, or None if tracing is off
+
+    """
+    return _tracer
+
+
+def _wrap(func, name: str):
+    if inspect.isgeneratorfunction(func):
+        # A generator does its work as it is consumed, so the span has to cover the iteration, not the call
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                yield from func(*args, **kwargs)
+                return
+            span, token = tracer.open(name)
+            try:
+                yield from func(*args, **kwargs)
+            finally:
+                tracer.close(span, token)
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tracer = _tracer
+        if tracer is None:
+            return func(*args, **kwargs)
+        span, token = tracer.open(name)
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            span.attributes['error'] = repr(e)
+            raise
+        finally:
+            tracer.close(span, token)
+    return wrapper
+
+
+def traced(cls):
+    """ Class decorator that opens a span for each public method and property while a :class:`Tracer` is active """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith('_'):
+            continue
+        name = f"{cls.__name__}.{attr}"
+        if isinstance(value, property) and value.fget is not None:
+            setattr(cls, attr, property(_wrap(value.fget, name), value.fset, value.fdel, value.__doc__))
+        elif inspect.isfunction(value):
+            setattr(cls, attr, _wrap(value, name))
+    return cls
@@ -4,6 +4,7 @@ from collections import UserList
 import wxcadm
 from .common import *
 from wxcadm import log
+from .tracing import traced
 if TYPE_CHECKING:
     from wxcadm import Org, Location
 
@@ -323,6 +324,7 @@ class VirtualLine:
         return response
 
 
+@traced
 class VirtualLineList(UserList):
     _endpoint = "v1/telephony/config/virtualLines"
     _endpoint_items_key = 'virtualLines'
@@ -345,7 +347,8 @@ class VirtualLineList(UserList):
         else:
             params = None
 
-        response = self.org.api.get(self._endpoint, params=params, items_key=self._endpoint_items_key)
+        response = self.org.api.get(self._endpoint, params=params, items_key=self._endpoint_items_key,
+                                    parallel=True)
         items = []
         for entry in response:
             items.append(self._item_class(org=self.org, config=entry))
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import requests
 from typing import Optional, Type
 from datetime import datetime, timedelta
 
 import wxcadm.person
 from wxcadm import log
 from .common import *
+from .cache import ResponseCache
 from .exceptions import *
 from .org import Org
 from .person import Me, Person
@@ -23,6 +23,10 @@ class Webex:
                  org_id: Optional[str] = None,
                  auto_refresh_token: bool = False,
                  read_only: bool = False,
+                 cache: Optional[ResponseCache] = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: Optional[int] = None,
+                 lazy: bool = False,
                  ) -> None:
         """Initialize a Webex instance to communicate with Webex and store data
 
@@ -47,6 +51,16 @@ class Webex:
                 :class:`Webex` instance is created, as those values are needed by the refresh process. **This feature
                 is still in development and should not be used until this warning is removed**
             read_only (bool, optional): Set to True if the token has only read access. Defaults to False.
+            cache (ResponseCache, optional): A :class:`~.cache.ResponseCache` to cache GET responses for every Org.
+                By default, responses are not cached.
+            pool_connections (int, optional): The number of hosts to keep connection pools for. Every Org shares the
+                same pools. Defaults to 10.
+            pool_maxsize (int, optional): The maximum number of keep-alive connections to each host. Defaults to
+                enough for the worker threads of :meth:`WebexApi.batch() <.common.WebexApi.batch>`, and at least 10.
+            lazy (bool, optional): When True, no API calls are made until :attr:`orgs` or :attr:`org` is first used,
+                and with an ``org_id``, :attr:`org` is built without retrieving the list of Orgs. This makes startup
+                much faster for scripts that only work with one Org. Note that the token isn't checked until the
+                first API call. Defaults to False.
 
         Returns:
             Webex: The Webex instance
@@ -64,7 +78,8 @@ class Webex:
         _webex_headers['Authorization'] = "Bearer " + access_token
 
         ### Added in 4.6.0 - Create a WebexApi instance for API calls
-        self.api = WebexApi(self._access_token)
+        self.api = WebexApi(self._access_token, cache=cache, pool_connections=pool_connections,
+                            pool_maxsize=pool_maxsize)
 
         # Fast Mode flag when needed
         self._fast_mode = fast_mode
@@ -72,6 +87,9 @@ class Webex:
         # Set Read Only mode
         self._read_only = read_only
 
+        # Lazy mode defers getting the Orgs until they are needed
+        self._lazy = lazy
+
         # Instance attrs
         self.client_id = client_id
         """ The Client ID or Application ID """
@@ -85,56 +103,90 @@ class Webex:
         """ The datetime when the refresh token expires """
         self.auto_refresh_token: bool = auto_refresh_token
 
-        self.orgs: list = []
-        '''A list of the Org instances that this Webex instance can manage'''
-        self.org: Optional[Org] = None
+        self._orgs: Optional[list] = None
+        self._org: Optional[Org] = None
+        self._org_id: Optional[str] = org_id
+        self._me: Optional[Type[Me]] = None
+        if lazy is False:
+            # Validate the token and build the Orgs now, so any problem is raised here
+            self._org = self._get_default_org()
+
+    @property
+    def orgs(self) -> list:
+        """ A list of the Org instances that this Webex instance can manage
+
+        With ``lazy=True``, the Orgs are retrieved from Webex the first time this is used.
+        """
+        if self._orgs is None:
+            self._orgs = self._get_orgs()
+        return self._orgs
+
+    @orgs.setter
+    def orgs(self, orgs: list):
+        self._orgs = orgs
+
+    @property
+    def org(self) -> Org:
         """
         If there is only one Org in :py:attr:`Webex.orgs` or if the ``org_id`` param was passed, this attribute will be
-        the first or selected Org.
+        the first or selected Org. With ``lazy=True`` and an ``org_id``, the Org is built without retrieving the list
+        of Orgs.
         """
-        self._me: Optional[Type[Me]] = None
+        if self._org is None:
+            self._org = self._get_default_org()
+        return self._org
+
+    @org.setter
+    def org(self, org: Org):
+        self._org = org
+
+    def _get_orgs(self) -> list:
+        orgs = []
         if self._read_only is True:
             # We can't call /v1/organizations on a read-only token, so we have to get it from somewhere else
             log.info("Using token Org as Org ID")
             response = self.api.get('v1/people/me')
             log.debug(response)
             org_id = response['orgId']
-            this_org = Org(name="My Organization", id=org_id, parent=self, xsi=False, api_connection=self.api)
-            self.orgs.append(this_org)
+            orgs.append(Org(name="My Organization", id=org_id, parent=self, xsi=False, api_connection=self.api))
         else:
             # Get the orgs that this token can manage
             log.debug(f"Making API call to v1/organizations")
-            r = requests.get(_url_base + "v1/organizations", headers=self._headers)
-            # Handle invalid access token
-            if r.status_code != 200:
+            try:
+                response = self.api.get("v1/organizations")
+            except APIError as e:
+                # Handle invalid access token
                 log.critical("The Access Token was not accepted by Webex")
-                log.debug(f"Response: {r.text}")
-                raise TokenError("The Access Token was not accepted by Webex")
-            response = r.json()
+                log.debug(f"Response: {e}")
+                raise TokenError("The Access Token was not accepted by Webex") from None
             # Handle when no Orgs are returned. This is pretty rare
-            if len(response['items']) == 0:
+            if len(response) == 0:
                 log.warning("No Orgs were returned by the Webex API")
                 raise OrgError
 
-            orgs = response['items']
-            for org in orgs:
+            for org in response:
                 log.debug(f"Processing org: {org['displayName']}")
-                this_org = Org(api_connection=self.api, name=org['displayName'], id=org['id'], parent=self, xsi=False)
-                self.orgs.append(this_org)
-
+                orgs.append(Org(api_connection=self.api, name=org['displayName'], id=org['id'], parent=self, xsi=False))
+        return orgs
+
+    def _get_default_org(self) -> Org:
+        if self._lazy is False or self._read_only is True:
+            # Eager startup always lists the Orgs, which also validates the token. A read-only token needs the
+            # list to find its Org ID.
+            orgs = self.orgs
+        else:
+            orgs = None
+        org_id = self._org_id
         if org_id is not None:
             log.info(f"Setting Org ID {org_id} as default Org")
-            #self.org = self.get_org_by_id(org_id)
             if len(org_id) == 36:
                 # We were given a UUID and need to go find the right value
                 response = self.api.get(f"v1/organizations/{org_id}")
                 org_id = response['id']
-            self.org = Org(api_connection=self.api, name=org_id, id=org_id, parent=self, xsi=False)
-            if self.org is None:
-                log.warning("Org not found")
-                raise OrgError
-        else:
-            self.org = self.orgs[0]
+            return Org(api_connection=self.api, name=org_id, id=org_id, parent=self, xsi=False)
+        if orgs is None:
+            orgs = self.orgs
+        return orgs[0]
 
 
     @property
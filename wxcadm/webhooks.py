@@ -6,9 +6,11 @@ from dataclasses import dataclass, field
 
 import wxcadm
 from wxcadm import log
+from .tracing import traced
 from .common import *
 
 
+@traced
 class Webhooks(UserList):
     def __init__(self, org: wxcadm.Org):
         """ The list of Webhooks
@@ -17,6 +17,8 @@ class Wholesale:
         log.debug(f"Setting Global _webex_headers")
         global _webex_headers
         _webex_headers['Authorization'] = "Bearer " + access_token
+        self.api: WebexApi = WebexApi(access_token)
+        """ The pooled :class:`~.common.WebexApi` shared by every customer """
         self._orgs = None
 
     @property
@@ -26,7 +28,7 @@ class Wholesale:
 
     @property
     def customers(self):
-        response = webex_api_call('get', '/v1/wholesale/customers')
+        response = self.api.get('v1/wholesale/customers')
         customer_list = []
         for customer in response:
             this_customer = WholesaleCustomer(self, customer)
@@ -38,7 +40,7 @@ class Wholesale:
         if self._orgs is None:
             orgs = []
             for customer in self.customers:
-                orgs.append(Org(name=customer.external_id, id=customer.id, parent=self))
+                orgs.append(Org(self.api, name=customer.external_id, id=customer.id, parent=self))
             self._orgs = orgs
         return self._orgs
 
@@ -73,6 +75,9 @@ class WholesaleCustomer:
 
         # Set the Authorization header based on how the instance was built
         self._headers = partner.headers
+        self._partner = partner
+        # Requests for the customer share the partner's connection pool
+        self.api: WebexApi = partner.api.for_org(self.org_id)
 
     @property
     def spark_id(self):
@@ -82,8 +87,7 @@ class WholesaleCustomer:
     @property
     def locations(self):
         locations = []
-        params = {"orgId": self.org_id}
-        response = webex_api_call('get', '/v1/locations', params=params)
+        response = self.api.get('v1/locations')
         for location in response:
             this_location = Location(self, location.get('id'), location.get('name'), time_zone=location.get('timeZone'),
                                      preferred_language=location.get('preferredLanguage'),
@@ -146,6 +150,7 @@ class WholesaleCustomer:
                 'locationId': location.id
             }
         }
-        response = webex_api_call('post', '/v1/wholesale/subscribers', payload=payload)
+        # Subscribers are created by the partner, so the request isn't scoped to the customer's orgId
+        response = self._partner.api.post('v1/wholesale/subscribers', payload=payload)
         return response
 
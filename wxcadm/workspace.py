@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import UserList
 from typing import Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,13 +9,23 @@ if TYPE_CHECKING:
 import wxcadm.location
 import wxcadm
 from wxcadm import log
+from .tracing import traced
+from .indexed import IndexedList, spark_uuid
+from .hydration import Hydrator
 from .common import *
 from .device import DeviceList
 from .monitoring import MonitoringList
 from .models import BargeInSettings
 
 
-class WorkspaceList(UserList):
+@traced
+class WorkspaceList(IndexedList):
+    _indexes = {
+        'id': lambda workspace: workspace.id,
+        'name': lambda workspace: workspace.name,
+        'uuid': spark_uuid,
+    }
+
     def __init__(self, org: wxcadm.Org, location: Optional[wxcadm.Location] = None):
         super().__init__()
         log.debug("Initializing WorkspaceList instance")
@@ -34,8 +43,9 @@ class WorkspaceList(UserList):
             params = {}
         response = self.org.api.get("v1/workspaces", params=params)
         log.debug(f"Received {len(response)} Workspaces from Webex")
+        hydrator = Hydrator(self.org)
         for entry in response:
-            workspaces.append(Workspace(org=self.org, id=entry['id'], config=entry))
+            workspaces.append(Workspace(org=self.org, id=entry['id'], config=entry, hydrator=hydrator))
         return workspaces
 
     def refresh(self):
@@ -52,11 +62,7 @@ class WorkspaceList(UserList):
             Workspace: The :py:class:`Workspace` instance for the given ID. None is returned if no match is found.
 
         """
-        entry: Workspace
-        for entry in self.data:
-            if entry.id == id:
-                return entry
-        return None
+        return self._find_first(('id', id))
 
     def get(self, id: Optional[str] = None, name: Optional[str] = None, uuid: Optional[str] = None):
         """ Get a Workspace instance by ID, Name or UUID
@@ -70,14 +76,7 @@ class WorkspaceList(UserList):
             Workspace: The :class:`Workspace` for the given criteria
 
         """
-        entry: Workspace
-        for entry in self.data:
-            if entry.id == id or (entry.name is not None and entry.name == name):
-                return entry
-            if uuid is not None:
-                if entry.spark_id.split('/')[-1].upper() == uuid.upper():
-                    return entry
-        return None
+        return self._find_first(('id', id), ('name', name), ('uuid', uuid and uuid.upper()))
 
     def webex_calling(self) -> list:
         """ Return a list of Workspaces that have Webex Calling enabled """
@@ -180,8 +179,9 @@ class WorkspaceList(UserList):
         return new_workspace
 
 
+@traced
 class Workspace:
-    def __init__(self, org: wxcadm.Org, id: str, config: Optional[dict] = None):
+    def __init__(self, org: wxcadm.Org, id: str, config: Optional[dict] = None, hydrator: Optional[Hydrator] = None):
         """Initialize a Workspace instance
 
         If only the `id` is provided, the configuration will be fetched from
@@ -191,6 +191,8 @@ class Workspace:
             org (Org): The Organization to which this workspace belongs
             id (str): The Webex ID of the Workspace
             config (dict): The configuration of the Workspace as returned by the Webex API
+            hydrator (Hydrator, optional): The Org-wide lookup tables shared by the Workspaces built from the same
+                response. Not normally used except by :class:`WorkspaceList`.
 
         """
         self.id: str = id
@@ -246,7 +248,7 @@ class Workspace:
 
 
         if config:
-            self.__process_config(config)
+            self.__process_config(config, hydrator)
         else:
             self.get_config()
 
@@ -427,11 +429,14 @@ class Workspace:
         response = self.org.api.get(f"v1/workspaces/{self.id}")
         self.__process_config(response)
 
-    def __process_config(self, config: dict):
+    def __process_config(self, config: dict, hydrator: Optional[Hydrator] = None):
         """Processes the config dict, whether passed in init or from an API call"""
         self.name = config.get("displayName", "")
         if 'locationId' in config.keys():
-            self.location_id = self.org.locations.get(id=config['locationId'])
+            if hydrator is None:
+                self.location_id = self.org.locations.get(id=config['locationId'])
+            else:
+                self.location_id = hydrator.location(config['locationId'])
         else:
             self.location = config.get("workspaceLocationId", None)
         self.floor = config.get("floorId", "")